@@ -10,3 +10,10 @@ class CellarSerializer(serializers.Serializer):
 
 class CellarsSerializer(serializers.Serializer):
     cellars = CellarSerializer(many=True)
+
+
+class CellarGridSerializer(serializers.Serializer):
+    id = serializers.UUIDField()
+    layout = serializers.ListField(child=serializers.IntegerField())
+    racks = serializers.ListField(child=serializers.ListField(child=serializers.UUIDField(allow_null=True)))
+    basket = serializers.ListField(child=serializers.UUIDField())
@@ -1,9 +1,19 @@
-from django.test import Client, TestCase
+from django.core.cache import caches
+from django.db import connection
+from django.test import Client, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 
-from llwinecellar.common.test_utils import CellarFactory, UserFactory
+from llwinecellar.common.test_utils import (
+    CellarFactory,
+    UserFactory,
+    WineFactory,
+    WineInBasketFactory,
+    WineInRackFactory,
+)
 
 from ..models import Cellar
+from ..use_cases import GetCellarGrid
 
 
 class TestCellarViews(TestCase):
@@ -64,6 +74,87 @@ class TestCellarViews(TestCase):
         self.assertEqual(params["has_basket"], created_cellar.has_basket)
         self.assertEqual(self.user.id, created_cellar.user_id)
 
+    def test_grid(self):
+        """
+        Get /api/cellars/{id}/grid/
+        """
+        # Arrange
+        cellar = CellarFactory(user=self.user, layout=[2, 3])
+        wine_in_rack = WineInRackFactory(user=self.user, cellar=cellar, row=2, column=3)
+        wine_in_basket = WineInBasketFactory(user=self.user, cellar=cellar)
+
+        # Act
+        status_code, body = self._make_request("get", f"{self.base_path}{cellar.id}/grid/", self.user)
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, status_code)
+
+        expected = {
+            "id": str(cellar.id),
+            "layout": [2, 3],
+            "racks": [[None, None], [None, None, str(wine_in_rack.id)]],
+            "basket": [str(wine_in_basket.id)],
+        }
+        self.assertDictEqual(expected, body)
+
+    def test_grid__one_query(self):
+        # Arrange
+        cellar = CellarFactory(user=self.user)
+        WineInRackFactory(user=self.user, cellar=cellar, row=1, column=1)
+        WineInBasketFactory(user=self.user, cellar=cellar)
+
+        # Act
+        with CaptureQueriesContext(connection) as context:
+            GetCellarGrid().execute(user=self.user, cellar_id=cellar.id)
+
+        # Assert
+        # silk adds an EXPLAIN for each query while it still holds an earlier request of this thread.
+        queries = [query for query in context.captured_queries if not query["sql"].startswith("EXPLAIN")]
+        self.assertEqual(1, len(queries))
+
+    @override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+    def test_grid__invalidated_by_move(self):
+        # Arrange
+        caches["default"].clear()
+        cellar = CellarFactory(user=self.user)
+        wine = WineFactory(user=self.user)
+        client = Client()
+        client.force_login(self.user)
+        _status_code, before = self._make_request("get", f"{self.base_path}{cellar.id}/grid/", self.user)
+
+        # Act
+        client.put(
+            f"/api/wines/{wine.id}/space/",
+            {"cellar_id": str(cellar.id), "row": 1, "column": 1},
+            content_type="application/json",
+        )
+        _status_code, after = self._make_request("get", f"{self.base_path}{cellar.id}/grid/", self.user)
+
+        # Assert
+        self.assertIsNone(before["racks"][0][0])
+        self.assertEqual(str(wine.id), after["racks"][0][0])
+
+    def test_grid__no_spaces(self):
+        # Arrange
+        cellar = CellarFactory(user=self.user, layout=[], has_basket=False)
+
+        # Act
+        status_code, body = self._make_request("get", f"{self.base_path}{cellar.id}/grid/", self.user)
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, status_code)
+        self.assertDictEqual({"id": str(cellar.id), "layout": [], "racks": [], "basket": []}, body)
+
+    def test_grid__not_my_cellar__404(self):
+        # Arrange
+        cellar = CellarFactory()
+
+        # Act
+        status_code, _body = self._make_request("get", f"{self.base_path}{cellar.id}/grid/", self.user)
+
+        # Assert
+        self.assertEqual(status.HTTP_404_NOT_FOUND, status_code)
+
     """
     Utility functions
     """
@@ -0,0 +1,24 @@
+from llwinecellar.common.test_utils import QueryBudgetTestCase
+
+from ..models import Cellar
+
+
+class TestCellarQueryBudget(QueryBudgetTestCase):
+    def test_list(self):
+        self.assert_query_budget("GET /api/cellars/")
+
+    def test_create(self):
+        self.assert_query_budget("POST /api/cellars/", params={"name": "Cave", "layout": [6, 6], "has_basket": True})
+
+    def test_grid(self):
+        self.assert_query_budget(
+            "GET /api/cellars/{id}/grid/",
+            path=lambda user: f"/api/cellars/{self._cellar(user).id}/grid/",
+        )
+
+    """
+    Utility functions
+    """
+
+    def _cellar(self, user) -> Cellar:
+        return Cellar.objects.filter_eq_user_id(user.id).get()
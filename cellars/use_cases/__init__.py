@@ -1,2 +1,3 @@
 from .create_cellar import CreateCellar
+from .get_cellar_grid import GetCellarGrid
 from .list_cellars import ListCellars
@@ -1,5 +1,6 @@
 import logging
 
+from llwinecellar.common.user_data_cache import user_data_cache
 from users.models import User
 
 from ..models import Cellar
@@ -22,5 +23,6 @@ class CreateCellar:
         )
 
         cellar.save()
+        user_data_cache.invalidate(user.id)
 
         return cellar
@@ -0,0 +1,57 @@
+import logging
+
+from rest_framework import exceptions
+
+from llwinecellar.common.user_data_cache import user_data_cache
+from users.models import User
+
+from ..enums import CellarSpaceType
+from ..models import Cellar, CellarSpace
+
+logger = logging.getLogger(__name__)
+
+
+class GetCellarGrid:
+    def __init__(self):
+        self.exception_log_title = f"{__class__.__name__}_exception"
+
+    def execute(self, user: User, cellar_id: str) -> dict:
+        logger.info(self.__class__.__name__, extra={"user": user, "cellar_id": cellar_id})
+
+        return user_data_cache.get_or_set(
+            user.id, self.__class__.__name__, {"cellar_id": str(cellar_id)}, lambda: self._get_grid(user, cellar_id)
+        )
+
+    def _get_grid(self, user: User, cellar_id: str) -> dict:
+        """
+        Wine ids aligned to Cellar.layout (None for an empty rack) plus the basket's wine ids, from one query.
+        A cellar without spaces (empty layout, no basket) returns no rows, so the Cellar row is read to tell it from
+        a cellar that is missing or not the user's.
+        """
+        spaces = (
+            CellarSpace.objects.filter_eq_user_id(user.id)
+            .filter(cellar_id=cellar_id)
+            .order_by_position()
+            .values_list("row", "column", "type", "wine_id", "cellar__layout")
+        )
+
+        grid = None
+        for row, column, space_type, wine_id, layout in spaces:
+            if grid is None:
+                grid = {
+                    "id": cellar_id,
+                    "layout": layout,
+                    "racks": [[None] * capacity for capacity in layout],
+                    "basket": [],
+                }
+            if space_type == CellarSpaceType.RACK:
+                grid["racks"][row - 1][column - 1] = wine_id
+            elif wine_id is not None:
+                grid["basket"].append(wine_id)
+
+        if grid is None:
+            cellar = Cellar.objects.filter_eq_user_id(user.id).get_by_id(cellar_id)
+            if cellar is None:
+                raise exceptions.NotFound
+            grid = {"id": cellar_id, "layout": cellar.layout, "racks": [], "basket": []}
+        return grid
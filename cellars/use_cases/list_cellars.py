@@ -2,6 +2,7 @@ import logging
 
 from rest_framework import exceptions
 
+from llwinecellar.common.user_data_cache import user_data_cache
 from users.models import User
 
 from ..models import Cellar
@@ -16,6 +17,9 @@ class ListCellars:
     def execute(self, user: User):
         logger.info(self.__class__.__name__, extra={"user": user})
 
-        cellars = Cellar.objects.filter_eq_user_id(user.id).order_by_created_at().all()
-
-        return cellars
+        return user_data_cache.get_or_set(
+            user.id,
+            self.__class__.__name__,
+            None,
+            lambda: list(Cellar.objects.filter_eq_user_id(user.id).order_by_created_at().all()),
+        )
@@ -2,13 +2,16 @@ import logging
 
 from rest_framework import status, viewsets
 from rest_framework.authentication import SessionAuthentication
+from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from llwinecellar.common.conditional_get import get_list_etag, get_not_modified_response
 from llwinecellar.exception_handler import exception_handler_with_logging
 
-from ..serializers import CellarSerializer, CellarsSerializer
-from ..use_cases import CreateCellar, ListCellars
+from ..models import Cellar, CellarSpace
+from ..serializers import CellarGridSerializer, CellarSerializer, CellarsSerializer
+from ..use_cases import CreateCellar, GetCellarGrid, ListCellars
 
 logger = logging.getLogger(__name__)
 
@@ -39,3 +42,22 @@ class CellarViewSet(viewsets.GenericViewSet):
 
         except Exception as exc:
             return exception_handler_with_logging(exc)
+
+    @action(detail=True, methods=["get"])
+    def grid(self, request, use_case=GetCellarGrid(), format=None, pk=None):
+        try:
+            etag = get_list_etag(
+                request,
+                Cellar.objects.filter_eq_user_id(request.user.id).filter(id=pk),
+                CellarSpace.objects.filter_eq_user_id(request.user.id).filter(cellar_id=pk),
+            )
+            if not_modified := get_not_modified_response(request, etag):
+                return not_modified
+
+            grid = use_case.execute(user=request.user, cellar_id=pk)
+
+            serializer = CellarGridSerializer(grid)
+            return Response(serializer.data, headers={"ETag": etag})
+
+        except Exception as exc:
+            return exception_handler_with_logging(exc)
@@ -0,0 +1,33 @@
+import hashlib
+from typing import Optional
+
+from django.db.models import Count, Max, QuerySet, Value
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import get_conditional_response
+
+
+def get_list_etag(request: HttpRequest, *querysets: QuerySet) -> str:
+    """
+    Strong ETag for a list response: row count and max(updated_at) of every queryset the response is built from,
+    plus the user, path and query string. Cheap enough to run before the list query itself.
+    """
+    parts = [
+        qs.order_by()
+        .annotate(_part=Value(index))
+        .values("_part")
+        .annotate(count=Count("pk"), last_updated_at=Max("updated_at"))
+        .values_list("_part", "count", "last_updated_at")
+        for index, qs in enumerate(querysets)
+    ]
+    validator = sorted(parts[0].union(*parts[1:], all=True)) if len(parts) > 1 else list(parts[0])
+
+    query = sorted(request.GET.lists())
+    digest = hashlib.md5(repr((request.user.pk, request.path, query, validator)).encode()).hexdigest()
+    return f'"{digest}"'
+
+
+def get_not_modified_response(request: HttpRequest, etag: str) -> Optional[HttpResponse]:
+    """
+    Returns 304 Not Modified when the request's If-None-Match matches etag, otherwise None.
+    """
+    return get_conditional_response(request, etag=etag)
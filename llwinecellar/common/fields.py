@@ -0,0 +1,34 @@
+import threading
+from datetime import datetime, timedelta
+from typing import Optional
+
+from django.db import models
+from django.utils import timezone
+
+
+class InsertionOrderedDateTimeField(models.DateTimeField):
+    """
+    A created_at, declared with auto_now_add=True, whose stamps never repeat within the process. Two timezone.now()
+    calls often return the same microsecond, so rows inserted by one bulk_create would tie and ordering by
+    created_at would not list them in the order they were inserted. A stamp that would tie is moved one microsecond
+    past the last one.
+    """
+
+    _lock = threading.Lock()
+    _last: Optional[datetime] = None
+
+    def pre_save(self, model_instance, add):
+        if not add:
+            return super().pre_save(model_instance, add)
+        value = self._next_stamp()
+        setattr(model_instance, self.attname, value)
+        return value
+
+    @classmethod
+    def _next_stamp(cls) -> datetime:
+        with cls._lock:
+            value = timezone.now()
+            if cls._last is not None and value <= cls._last:
+                value = cls._last + timedelta(microseconds=1)
+            cls._last = value
+            return value
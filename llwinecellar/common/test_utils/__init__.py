@@ -1,6 +1,13 @@
 from .cellar_factory import CellarFactory, CellarSpaceFactory
+from .query_budget import COLLECTION_SIZES, QueryBudgetTestCase, QueryRecorder, create_wine_collection
 from .user_factory import UserFactory
-from .wine_factory import (CepageFactory, DrunkWineFactory, GrapeMasterFactory,
-                           WineFactory, WineInBasketFactory, WineInRackFactory,
-                           WineTagFactory)
+from .wine_factory import (
+    CepageFactory,
+    DrunkWineFactory,
+    GrapeMasterFactory,
+    WineFactory,
+    WineInBasketFactory,
+    WineInRackFactory,
+    WineTagFactory,
+)
 from .wine_memo_factory import WineMemoFactory
@@ -0,0 +1,156 @@
+import math
+import sys
+from datetime import date
+from typing import Callable, Optional, Union
+
+from django.db import connection
+from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
+
+from cellars.enums import CellarSpaceType
+from cellars.models import CellarSpace
+from users.models import User
+from wine_memos.models import WineMemo
+from wines.models import Cepage, Wine, WineTag, WineTagRelation, count_wine_values
+
+from .cellar_factory import CellarFactory, CellarSpaceFactory
+from .user_factory import UserFactory
+from .wine_factory import CepageFactory, GrapeMasterFactory, WineFactory, WineTagFactory
+from .wine_memo_factory import WineMemoFactory
+
+COLLECTION_SIZES = (10, 100, 1000)
+RACK_COLUMNS = 10
+
+
+class QueryRecorder(CaptureQueriesContext):
+    """
+    CaptureQueriesContext without the queries silk makes to record a request, nor the EXPLAINs it runs for the
+    queries of the request.
+    """
+
+    @property
+    def queries(self) -> list[dict]:
+        return [
+            query
+            for query in self.captured_queries
+            if not query["sql"].startswith("EXPLAIN") and '"silk_' not in query["sql"]
+        ]
+
+    def __len__(self):
+        return len(self.queries)
+
+    @property
+    def time_ms(self) -> float:
+        return sum(float(query["time"]) for query in self.queries) * 1000
+
+
+def create_wine_collection(size: int) -> User:
+    """
+    A user with `size` wines: a third in the racks of their cellar, a third in its baskets and the rest out of
+    cellars, some of them drunk. Each wine has two cepages and one or two tags, and the user has `size` memos.
+    Built with the factories but inserted in bulk, so that a collection of 1000 wines takes a few queries.
+    """
+    user = UserFactory()
+    cellar = CellarFactory(user=user, layout=[RACK_COLUMNS] * math.ceil(size / 3 / RACK_COLUMNS))
+    grapes = [
+        GrapeMasterFactory(user=user, name="Pinot Noir", abbreviation="PN"),
+        GrapeMasterFactory(user=user, name="Gamay", abbreviation="Ga"),
+    ]
+    tags = [WineTagFactory(user=user, text=text) for text in ("daily", "gift", "cellar_worthy")]
+
+    wines = WineFactory.build_batch(size, user=user)
+    for wine in wines[2::6]:
+        wine.drunk_at = date(2024, 1, 1)
+    Wine.objects.bulk_create(wines)
+    count_wine_values(user.id, added=[wine.counted_values for wine in wines])
+
+    Cepage.objects.bulk_create(
+        [
+            CepageFactory.build(wine=wine, grape=grape, percentage=percentage)
+            for wine in wines
+            for grape, percentage in zip(grapes, (70, 30))
+        ]
+    )
+    relations = [
+        WineTagRelation(wine=wine, tag_master=tag)
+        for index, wine in enumerate(wines)
+        for tag in tags[index % 3 : index % 3 + 2]
+    ]
+    WineTagRelation.objects.bulk_create(relations)
+    WineTag.objects.add_counts_of_relations(relations)
+
+    racks = CellarSpace.objects.filter(cellar=cellar).order_by_position()
+    CellarSpace.objects.set_wines({rack.id: wine.id for rack, wine in zip(racks, wines[0::3])})
+    CellarSpace.objects.bulk_create(
+        [CellarSpaceFactory.build(cellar=cellar, type=CellarSpaceType.BASKET, wine=wine) for wine in wines[1::3]]
+    )
+
+    WineMemo.objects.bulk_create(WineMemoFactory.build_batch(size, user=user))
+    return user
+
+
+class QueryBudgetTestCase(TestCase):
+    """
+    Requests endpoints for users with collections of each of COLLECTION_SIZES wines, and fails when the number
+    of queries an endpoint makes grows with the collection. The counts and SQL times are written to stderr as a
+    table once the class has run.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.users = {size: create_wine_collection(size) for size in COLLECTION_SIZES}
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.budget_rows = []
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        sys.stderr.write(cls.format_budget_table())
+
+    @classmethod
+    def format_budget_table(cls) -> str:
+        lines = [f"\n{cls.__name__}", f"{'endpoint':<64} {'wines':>6} {'queries':>8} {'SQL ms':>8}"]
+        for endpoint, size, count, time_ms in cls.budget_rows:
+            lines.append(f"{endpoint:<64} {size:>6} {count:>8} {time_ms:>8.1f}")
+        return "\n".join(lines) + "\n"
+
+    def assert_query_budget(
+        self,
+        endpoint: str,
+        path: Optional[Callable[[User], str]] = None,
+        params: Union[dict, Callable[[User], dict], None] = None,
+        batch_size: Optional[int] = None,
+    ):
+        """
+        endpoint is the method and path, as in "GET /api/wines/?limit=50", and labels the rows of the table. For
+        paths and params that refer to rows of the user, pass functions of the user: they are called before queries
+        are recorded. An endpoint that reads in batches of batch_size rows may make, for each batch, as many queries
+        as it makes for the smallest collection.
+        """
+        method, _, endpoint_path = endpoint.partition(" ")
+        method = method.lower()
+        counts = {}
+        for size, user in self.users.items():
+            client = Client()
+            client.force_login(user)
+            request_path = path(user) if path else endpoint_path
+            request_params = params(user) if callable(params) else params
+            # GET sends params as the query string.
+            extra = {} if method == "get" else {"content_type": "application/json"}
+
+            with QueryRecorder(connection) as recorder:
+                response = getattr(client, method)(request_path, request_params, **extra)
+                if response.streaming:
+                    b"".join(response.streaming_content)
+
+            self.assertLess(response.status_code, 300, f"{endpoint} for {size} wines: {response.status_code}")
+            counts[size] = len(recorder)
+            self.budget_rows.append((endpoint, size, len(recorder), recorder.time_ms))
+
+        smallest = counts[COLLECTION_SIZES[0]]
+        for size, count in counts.items():
+            batches = math.ceil(size / batch_size) if batch_size else 1
+            self.assertLessEqual(count, smallest * batches, f"Queries of {endpoint} grow with the collection: {counts}")
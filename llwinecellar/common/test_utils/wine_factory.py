@@ -6,7 +6,7 @@ import factory.fuzzy
 
 from cellars.models import CellarSpace
 from wines.enums import Country
-from wines.models import Cepage, GrapeMaster, Wine, WineTag
+from wines.models import Cepage, GrapeMaster, Wine, WineTag, count_wine_values
 
 from .user_factory import UserFactory
 
@@ -14,6 +14,7 @@ from .user_factory import UserFactory
 class WineFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = Wine
+        skip_postgeneration_save = True
 
     user = factory.SubFactory(UserFactory)
     name = factory.Sequence(lambda n: f"Gevrey Chambertin_{n}")
@@ -31,6 +32,12 @@ class WineFactory(factory.django.DjangoModelFactory):
     drunk_at = None
     note = "Good wine."
 
+    @factory.post_generation
+    def counted_values(wine, create, extracted, **kwargs):
+        # Counted the way CreateWine does, so that regions and producers can be listed.
+        if create:
+            count_wine_values(wine.user_id, added=[wine.counted_values])
+
 
 class DrunkWineFactory(WineFactory):
     drunk_at = factory.LazyAttribute(lambda wine: wine.bought_at + timedelta(days=randint(0, 365)))
@@ -0,0 +1,52 @@
+import functools
+import logging
+import random
+import time
+from typing import Callable, TypeVar
+
+from django.db import OperationalError, transaction
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+SERIALIZATION_FAILURE = "40001"
+DEADLOCK_DETECTED = "40P01"
+
+
+class RetryableConflict(Exception):
+    """
+    Raise inside atomic_with_retry when rows read before taking locks turned out to be stale.
+    """
+
+
+def atomic_with_retry(max_attempts: int = 10, base_delay: float = 0.005):
+    """
+    Runs the function in transaction.atomic and reruns it from scratch on serialization failures, deadlocks and
+    RetryableConflict, with jittered exponential backoff. Inside an outer transaction a rerun is impossible, so the
+    error is raised as is.
+    """
+
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs) -> T:
+            can_retry = not transaction.get_connection().in_atomic_block
+            for attempt in range(1, max_attempts + 1):
+                try:
+                    with transaction.atomic():
+                        return func(*args, **kwargs)
+                except (OperationalError, RetryableConflict) as exc:
+                    if not (can_retry and attempt < max_attempts and _is_retryable(exc)):
+                        raise
+                    logger.info("Retrying after conflict", extra={"function": func.__qualname__, "attempt": attempt})
+                    time.sleep(random.uniform(0, base_delay * 2**attempt))
+
+        return wrapper
+
+    return decorator
+
+
+def _is_retryable(exc: Exception) -> bool:
+    if isinstance(exc, RetryableConflict):
+        return True
+    return getattr(exc.__cause__, "pgcode", None) in (SERIALIZATION_FAILURE, DEADLOCK_DETECTED)
@@ -0,0 +1,103 @@
+import hashlib
+import logging
+import threading
+import time
+from collections import Counter
+from typing import Callable, Optional, TypeVar
+
+from django.core.cache import caches
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class UserDataCache:
+    """
+    Cache for read use cases, keyed by a per-user data generation.
+    Write use cases call invalidate(), which moves the user to a new generation, so stale entries are never read
+    again and just expire. Works on any Django cache backend; use a backend shared between processes
+    (e.g. FileBasedCache) when running several workers.
+
+    Hits and misses are counted in memory, per process, so counting adds no cache write to a read. stats() returns
+    the totals, which are also logged every STATS_LOG_INTERVAL lookups.
+    """
+
+    STATS_LOG_INTERVAL = 1000
+
+    def __init__(self, alias: str = "default", timeout: int = 60 * 60):
+        self.alias = alias
+        self.timeout = timeout
+        self._counts = Counter()
+        self._counts_lock = threading.Lock()
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def get_or_set(self, user_id, name: str, params: Optional[dict], compute: Callable[[], T]) -> T:
+        """
+        `compute` must return a fully evaluated, picklable value (e.g. a list, not a QuerySet).
+        """
+        key = self._get_key(user_id, name, params)
+        value = self.cache.get(key, self)
+        if value is not self:
+            self._count("hits")
+            logger.debug("UserDataCache hit", extra={"user_id": user_id, "use_case": name})
+            return value
+
+        self._count("misses")
+        logger.debug("UserDataCache miss", extra={"user_id": user_id, "use_case": name})
+        value = compute()
+        self.cache.set(key, value, self.timeout)
+        return value
+
+    def invalidate(self, user_id):
+        """
+        Invalidates now so no reader serves the old data, and again on commit, so that anything cached from
+        pre-commit state in between is discarded too.
+        """
+        self._bump_generation(user_id)
+        transaction.on_commit(lambda: self._bump_generation(user_id))
+
+    def stats(self) -> dict[str, int]:
+        """
+        Hits and misses of this process since it started.
+        """
+        with self._counts_lock:
+            return {"hits": self._counts["hits"], "misses": self._counts["misses"]}
+
+    def _get_key(self, user_id, name: str, params: Optional[dict]) -> str:
+        params_hash = hashlib.md5(repr(sorted((params or {}).items())).encode()).hexdigest()
+        return f"user_data:{user_id}:{self._get_generation(user_id)}:{name}:{params_hash}"
+
+    def _get_generation(self, user_id) -> int:
+        key = self._get_generation_key(user_id)
+        generation = self.cache.get(key)
+        if generation is None:
+            # Never restart from a fixed value: entries of an evicted generation could still be alive.
+            generation = time.time_ns()
+            self.cache.add(key, generation, None)
+            generation = self.cache.get(key, generation)
+        return generation
+
+    def _bump_generation(self, user_id):
+        key = self._get_generation_key(user_id)
+        try:
+            self.cache.incr(key)
+        except ValueError:
+            self.cache.set(key, time.time_ns(), None)
+
+    def _get_generation_key(self, user_id) -> str:
+        return f"user_data_generation:{user_id}"
+
+    def _count(self, outcome: str):
+        with self._counts_lock:
+            self._counts[outcome] += 1
+            stats = {"hits": self._counts["hits"], "misses": self._counts["misses"]}
+        if (stats["hits"] + stats["misses"]) % self.STATS_LOG_INTERVAL == 0:
+            logger.info("UserDataCache stats", extra=stats)
+
+
+user_data_cache = UserDataCache()
@@ -0,0 +1,12 @@
+from rest_framework.negotiation import DefaultContentNegotiation
+
+
+class IgnoreFormatNegotiation(DefaultContentNegotiation):
+    """
+    For views with a `format` query parameter of their own, such as GET /api/wines/export?format=csv: DRF would
+    otherwise take it for a renderer override and answer 404 for formats no renderer has. Renderers are chosen from
+    the Accept header only, so error responses stay JSON.
+    """
+
+    def filter_renderers(self, renderers, format):
+        return renderers
@@ -0,0 +1,39 @@
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+LINE_SEPARATOR = "\u2028".encode()
+PARAGRAPH_SEPARATOR = "\u2029".encode()
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that encodes with orjson when it is installed and falls back to the standard library otherwise,
+    rendering the same bytes either way: UUIDs, str and int enums such as Country come out as orjson writes them
+    natively, and dates, datetimes and Decimals are handed to DRF's encoder, as json.dumps does.
+    Indented output (`; indent=` in Accept, the browsable API) and non-default UNICODE_JSON or COMPACT_JSON settings
+    also use the standard library. Floats above 1e16 or below 1e-4 are written without the exponent sign and
+    padding that repr() adds (1e16, not 1e+16); the API renders Decimals as strings, so none reach the encoder.
+    """
+
+    orjson_options = (orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            orjson is None
+            or data is None
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(data, default=self.encoder_class().default, option=self.orjson_options)
+
+        # Escaped like JSONRenderer does, so that the output stays a strict JavaScript subset.
+        if LINE_SEPARATOR in ret or PARAGRAPH_SEPARATOR in ret:
+            ret = ret.replace(LINE_SEPARATOR, b"\\u2028").replace(PARAGRAPH_SEPARATOR, b"\\u2029")
+        return ret
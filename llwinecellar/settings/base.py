@@ -76,6 +76,24 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+# Backs llwinecellar.common.user_data_cache. Local memory is per process, so use a shared backend with several workers.
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "OPTIONS": {"MAX_ENTRIES": 10_000},
+    }
+}
+
+
+# Wine read model
+# Serves ListWine from wines.models.WineReadModel. Run the rebuild_wine_read_models command after turning it on.
+
+WINE_READ_MODEL = env.bool("WINE_READ_MODEL", default=False)
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.0/ref/settings/#auth-password-validators
 
@@ -114,9 +132,11 @@ SESSION_COOKIE_SAMESITE = "Strict"
 CSRF_COOKIE_HTTPONLY = False
 SESSION_COOKIE_HTTPONLY = True
 
+# FastJSONRenderer uses orjson when installed (poetry install -E fast-json). A settings module can switch back to
+# rest_framework.renderers.JSONRenderer; both render the same bytes.
 REST_FRAMEWORK = {
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
+        "llwinecellar.renderers.FastJSONRenderer",
     ],
     "DEFAULT_AUTHENTICATION_CLASSES": [
         "rest_framework.authentication.SessionAuthentication",
@@ -10,6 +10,15 @@ env.read_env(".env")
 
 ALLOWED_HOSTS = env.list("ALLOWED_HOSTS")
 
+# Shared between gunicorn workers, so one worker's writes invalidate the others' cached reads.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": env.get_value("CACHE_LOCATION", default="/var/tmp/llwinecellar_cache"),
+        "OPTIONS": {"MAX_ENTRIES": 10_000},
+    }
+}
+
 
 # Logging
 #  https://docs.djangoproject.com/en/2.0/topics/logging/
@@ -7,6 +7,13 @@ DEBUG = True
 
 ALLOWED_HOSTS: list[str] = []
 
+# Factories write without going through the use cases, so nothing would invalidate cached reads.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.dummy.DummyCache",
+    }
+}
+
 """
 Settings for django-silk
 """
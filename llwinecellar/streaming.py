@@ -0,0 +1,84 @@
+import csv
+import io
+import json
+from typing import Iterable, Iterator
+
+from rest_framework.serializers import BaseSerializer
+
+from .renderers import FastJSONRenderer
+
+BUFFER_SIZE = 64 * 1024
+
+
+def stream_json_list(key: str, items: Iterable, serializer: BaseSerializer) -> Iterator[bytes]:
+    """
+    Yields {"<key>": [...]} encoded one item at a time, so neither the list nor the whole body is held in memory.
+    Output is byte-identical to JSONRenderer rendering the same envelope.
+    """
+    renderer = FastJSONRenderer()
+
+    buffer = [b"{", json.dumps(key, ensure_ascii=False).encode(), b":["]
+    buffered = 0
+    for index, item in enumerate(items):
+        if index > 0:
+            buffer.append(b",")
+        encoded = renderer.render(serializer.to_representation(item))
+        buffer.append(encoded)
+        buffered += len(encoded)
+        if buffered >= BUFFER_SIZE:
+            yield b"".join(buffer)
+            buffer = []
+            buffered = 0
+    buffer.append(b"]}")
+    yield b"".join(buffer)
+
+
+def stream_json_lines(items: Iterable, serializer: BaseSerializer) -> Iterator[bytes]:
+    """
+    Yields one JSON document per item and line (JSON Lines), encoded one item at a time.
+    """
+    renderer = FastJSONRenderer()
+
+    buffer = []
+    buffered = 0
+    for item in items:
+        encoded = renderer.render(serializer.to_representation(item))
+        buffer.append(encoded)
+        buffer.append(b"\n")
+        buffered += len(encoded) + 1
+        if buffered >= BUFFER_SIZE:
+            yield b"".join(buffer)
+            buffer = []
+            buffered = 0
+    yield b"".join(buffer)
+
+
+def stream_csv(items: Iterable, serializer: BaseSerializer) -> Iterator[bytes]:
+    """
+    Yields a UTF-8 CSV, written one item at a time, with a header row of the keys of the first item.
+    None is written as an empty cell, and lists and dicts as JSON. No items give an empty body.
+    """
+    renderer = FastJSONRenderer()
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    fieldnames = None
+    for item in items:
+        data = serializer.to_representation(item)
+        if fieldnames is None:
+            fieldnames = list(data.keys())
+            writer.writerow(fieldnames)
+        writer.writerow([_to_csv_cell(data[fieldname], renderer) for fieldname in fieldnames])
+        if buffer.tell() >= BUFFER_SIZE:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode()
+
+
+def _to_csv_cell(value, renderer: FastJSONRenderer):
+    if value is None:
+        return ""
+    if isinstance(value, (list, dict)):
+        return renderer.render(value).decode()
+    return value
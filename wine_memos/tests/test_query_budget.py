@@ -0,0 +1,25 @@
+from llwinecellar.common.test_utils import QueryBudgetTestCase
+
+from ..models import WineMemo
+
+
+class TestWineMemoQueryBudget(QueryBudgetTestCase):
+    def test_list(self):
+        self.assert_query_budget("GET /api/wine_memos/")
+
+    def test_create(self):
+        self.assert_query_budget("POST /api/wine_memos/", params={"title": "List to buy", "entry": "Morgon"})
+
+    def test_update(self):
+        self.assert_query_budget(
+            "PUT /api/wine_memos/{id}/",
+            path=lambda user: f"/api/wine_memos/{self._wine_memo(user).id}/",
+            params={"title": "Dream wine list", "entry": "Musigny"},
+        )
+
+    """
+    Utility functions
+    """
+
+    def _wine_memo(self, user) -> WineMemo:
+        return WineMemo.objects.filter(user=user).first()
@@ -1,6 +1,8 @@
 import logging
 from typing import TYPE_CHECKING
 
+from llwinecellar.common.user_data_cache import user_data_cache
+
 from ..models import WineMemo
 
 if TYPE_CHECKING:
@@ -24,5 +26,6 @@ class CreateWineMemo:
             entry=entry,
             user=user,
         )
+        user_data_cache.invalidate(user.id)
 
         return wine_memo
@@ -3,6 +3,8 @@ from typing import TYPE_CHECKING
 
 from rest_framework import exceptions
 
+from llwinecellar.common.user_data_cache import user_data_cache
+
 from ..models import WineMemo
 
 if TYPE_CHECKING:
@@ -31,5 +33,6 @@ class UpdateWineMemo:
         wine_memo.title = title
         wine_memo.entry = entry
         wine_memo.save()
+        user_data_cache.invalidate(user.id)
 
         return wine_memo
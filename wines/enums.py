@@ -86,3 +86,21 @@ class Grape(Enum):
     @classmethod
     def choices_for_model(cls):
         return tuple((c.id, c.abrev) for c in cls)
+
+
+class CepageMatch(str, Enum):
+    ALL = "all"
+    ANY = "any"
+
+    @classmethod
+    def choices_for_serializer(cls):
+        return tuple((c.value, c.value) for c in cls)
+
+
+class WineFileFormat(str, Enum):
+    CSV = "csv"
+    JSONL = "jsonl"
+
+    @classmethod
+    def choices_for_serializer(cls):
+        return tuple((c.value, c.value) for c in cls)
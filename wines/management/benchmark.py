@@ -0,0 +1,44 @@
+import random
+import time
+
+from django.db import connection
+
+from users.models import User
+
+from ..enums import Country
+from ..models import Wine
+
+WORDS = (
+    "Château", "Domaine", "Clos", "Côte", "Réserve", "Cuvée", "Vieilles", "Vignes", "Grand", "Premier",
+    "Saint", "Émilion", "Nuits", "Beaune", "Pinot", "Rosé", "Brut", "Sélection", "Haut", "Médoc",
+    "Barolo", "Rioja", "Riesling", "Müller", "Grüner", "Veltliner", "Mosel", "Napa", "Sonoma", "Mendoza",
+)  # fmt: skip
+
+
+def create_benchmark_user() -> User:
+    return User.objects.create(username="benchmark", email=f"benchmark_{time.time_ns()}@example.com")
+
+
+def seed_wines(user: User, count: int, batch_size: int = 5_000, seed: int = 0) -> list[Wine]:
+    """
+    Bulk inserts `count` wines with pseudo-random accented names, then ANALYZEs the table.
+    """
+    rng = random.Random(seed)
+    countries = list(Country)
+    wines = []
+    for index in range(count):
+        wine = Wine(
+            user=user,
+            name=" ".join(rng.sample(WORDS, 3)) + f" {index}",
+            producer=" ".join(rng.sample(WORDS, 2)),
+            region_1=rng.choice(WORDS),
+            region_2=rng.choice(WORDS),
+            vintage=rng.randint(1980, 2022),
+            price=rng.randint(1_000, 50_000),
+        )
+        wine.country = rng.choice(countries)
+        wines.append(wine)
+    Wine.objects.bulk_create(wines, batch_size=batch_size)
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE wines_wine")
+    return wines
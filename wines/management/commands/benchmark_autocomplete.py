@@ -0,0 +1,51 @@
+import random
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import connection
+
+from llwinecellar.common.benchmark import measure, rolled_back
+from wines.management.benchmark import WORDS, create_benchmark_user, seed_wines
+from wines.models import WineProducer, WineRegion, WineTag, WineTagRelation, count_wine_values
+
+
+class Command(BaseCommand):
+    help = "Times the q= typeahead of producers, regions and tags against seeded wines. Data is rolled back."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--wines", type=int, default=100_000)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--limit", type=int, default=10)
+        parser.add_argument("--terms", nargs="+", default=["c", "do", "cha", "vieilles", "cote"])
+
+    def handle(self, *args, **options):
+        with rolled_back():
+            user = create_benchmark_user()
+            wines = seed_wines(user, options["wines"])
+            count_wine_values(user.id, added=[wine.counted_values for wine in wines])
+            self._seed_tags(user, wines)
+            self.stdout.write(f"Seeded {options['wines']} wines.\n")
+
+            limit = options["limit"]
+            for term in options["terms"]:
+                searches = {
+                    "producers": WineProducer.objects.filter_eq_user_id(user.id).search(term)[:limit],
+                    "regions": WineRegion.objects.filter_eq_user_id(user.id).search(term)[:limit],
+                    "tags": WineTag.objects.filter_eq_user_id(user.id).search(term)[:limit],
+                }
+                self.stdout.write(f"== {term!r}")
+                for name, queryset in searches.items():
+                    elapsed_ms = measure(lambda: list(queryset.all()), options["repeat"])
+                    self.stdout.write(f"{name:<10} {elapsed_ms:.1f} ms")
+                self.stdout.write("")
+
+    def _seed_tags(self, user, wines, tag_count=1_000):
+        rng = random.Random(0)
+        tags = WineTag.objects.bulk_create(
+            [WineTag(user=user, text=" ".join(rng.sample(WORDS, 2)) + f" {index}") for index in range(tag_count)]
+        )
+        WineTagRelation.objects.bulk_create(
+            [WineTagRelation(wine=wine, tag_master=rng.choice(tags)) for wine in wines], batch_size=5_000
+        )
+        WineTag.objects.filter_eq_user_id(user.id).rebuild_counts()
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE wines_winetag, wines_winetagrelation, wines_wineregion, wines_wineproducer")
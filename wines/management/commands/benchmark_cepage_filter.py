@@ -0,0 +1,66 @@
+import random
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import connection
+
+from llwinecellar.common.benchmark import measure, rolled_back
+from wines.management.benchmark import create_benchmark_user, seed_wines
+from wines.models import Cepage, GrapeMaster, Wine
+
+GRAPE_NAMES = (
+    "Pinot Noir", "Chardonnay", "Merlot", "Cabernet Sauvignon", "Cabernet Franc", "Syrah", "Grenache", "Mourvèdre",
+    "Sangiovese", "Nebbiolo", "Tempranillo", "Riesling", "Sauvignon Blanc", "Sémillon", "Chenin Blanc", "Gamay",
+    "Malbec", "Petit Verdot", "Viognier", "Zinfandel",
+)  # fmt: skip
+
+
+class Command(BaseCommand):
+    help = "Times cepage_names filtering, the former join per grape against the grouped subquery. Data is rolled back."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--wines", type=int, default=100_000)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--max_cepages", type=int, default=4)
+
+    def handle(self, *args, **options):
+        with rolled_back():
+            user = create_benchmark_user()
+            wines = seed_wines(user, options["wines"])
+            names = self._seed_cepages(user, wines, options["max_cepages"])
+            self.stdout.write(f"Seeded {options['wines']} wines.\n")
+
+            for grape_count in range(1, len(names) + 1):
+                wines = Wine.objects.filter_eq_user_id(user.id)
+                filters = {
+                    "join chain": self._filter_by_join_chain(wines, names[:grape_count]),
+                    "all": wines.filter_has_grapes(user.id, names[:grape_count]),
+                    "any": wines.filter_has_grapes(user.id, names[:grape_count], match_all=False),
+                }
+                self.stdout.write(f"== {', '.join(names[:grape_count])}")
+                for name, queryset in filters.items():
+                    count = queryset.count()
+                    elapsed_ms = measure(lambda: list(queryset.values_list("id", flat=True)), options["repeat"])
+                    self.stdout.write(f"{name:<10} {elapsed_ms:.1f} ms ({count} wines)")
+                self.stdout.write("")
+
+    def _filter_by_join_chain(self, wines, names):
+        for name in names:
+            wines = wines.filter(cepages__grape__name=name)
+        return wines
+
+    def _seed_cepages(self, user, wines, max_cepages) -> list[str]:
+        """
+        Draws blends from a small pool, so that multi-grape filters still match a few thousand wines, and returns the
+        grape names of the first blend.
+        """
+        rng = random.Random(0)
+        grapes = GrapeMaster.objects.bulk_create([GrapeMaster(user=user, name=name) for name in GRAPE_NAMES])
+        blends = [rng.sample(grapes, max_cepages) for _ in range(50)]
+        cepages = []
+        for wine in wines:
+            blend = rng.choice(blends)[: rng.randint(1, max_cepages)]
+            cepages.extend(Cepage(wine=wine, grape=grape) for grape in blend)
+        Cepage.objects.bulk_create(cepages, batch_size=5_000)
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE wines_cepage, wines_grapemaster")
+        return [grape.name for grape in blends[0]]
@@ -0,0 +1,82 @@
+import datetime
+import random
+import uuid
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandParser
+from rest_framework.renderers import JSONRenderer
+
+from llwinecellar.common.benchmark import measure
+from llwinecellar.renderers import FastJSONRenderer, orjson
+from wines.enums import Country
+from wines.management.benchmark import WORDS
+
+
+class Command(BaseCommand):
+    help = "Times JSONRenderer against FastJSONRenderer on a synthetic wine list. Needs no database."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--wines", type=int, default=10_000)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options):
+        payloads = {
+            "serialized": {"wines": [self._get_serialized_wine(index) for index in range(options["wines"])]},
+            "native types": {"wines": [self._get_native_wine(index) for index in range(options["wines"])]},
+        }
+        self.stdout.write(f"orjson {'installed' if orjson else 'not installed, FastJSONRenderer falls back'}.\n")
+
+        for name, payload in payloads.items():
+            expected = JSONRenderer().render(payload)
+            if FastJSONRenderer().render(payload) != expected:
+                self.stderr.write(f"{name}: FastJSONRenderer rendered different bytes.")
+            self.stdout.write(f"== {name} ({len(expected) // 1024} KiB)")
+            for renderer in (JSONRenderer(), FastJSONRenderer()):
+                elapsed_ms = measure(lambda: renderer.render(payload), options["repeat"])
+                self.stdout.write(f"{renderer.__class__.__name__:<18} {elapsed_ms:.1f} ms")
+            self.stdout.write("")
+
+    def _get_native_wine(self, index: int) -> dict:
+        """
+        A wine with the types the encoders have to handle: UUIDs, Decimals, dates and the Country enum.
+        """
+        rng = random.Random(index)
+        return {
+            "id": uuid.UUID(int=rng.getrandbits(128)),
+            "name": " ".join(rng.sample(WORDS, 3)) + f" {index}",
+            "producer": " ".join(rng.sample(WORDS, 2)),
+            "country": rng.choice(list(Country)),
+            "region_1": rng.choice(WORDS),
+            "region_2": "",
+            "region_3": "",
+            "region_4": "",
+            "region_5": "",
+            "cepages": [
+                {"name": rng.choice(WORDS), "abbreviation": "", "percentage": Decimal(rng.randint(0, 1000)) / 10}
+                for _ in range(2)
+            ],
+            "vintage": rng.randint(1980, 2022),
+            "bought_at": datetime.date(2024, 1, 1) + datetime.timedelta(days=rng.randint(0, 365)),
+            "bought_from": "",
+            "price": rng.randint(1_000, 50_000),
+            "drunk_at": None,
+            "note": "",
+            "tag_texts": rng.sample(WORDS, 2),
+            "value": None,
+            "cellar_id": uuid.UUID(int=index),
+            "position": f"{rng.randint(1, 10)}-{rng.randint(1, 10)}",
+        }
+
+    def _get_serialized_wine(self, index: int) -> dict:
+        """
+        The same wine as WineListItemSerializer returns it, with every special type already turned into a string.
+        """
+        wine = self._get_native_wine(index)
+        return {
+            **wine,
+            "id": str(wine["id"]),
+            "country": wine["country"].label,
+            "cepages": [{**cepage, "percentage": str(cepage["percentage"])} for cepage in wine["cepages"]],
+            "bought_at": wine["bought_at"].isoformat(),
+            "cellar_id": str(wine["cellar_id"]),
+        }
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand, CommandParser
+from django.db.models import Q
+
+from llwinecellar.common.benchmark import measure, rolled_back
+from wines.management.benchmark import create_benchmark_user, seed_wines
+from wines.models import Wine
+
+
+class Command(BaseCommand):
+    help = "Compares the name_or_producer search before and after the trigram indexes. Data is rolled back."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--wines", type=int, default=100_000)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--terms", nargs="+", default=["chateau", "cote de", "rose 12"])
+
+    def handle(self, *args, **options):
+        with rolled_back():
+            user = create_benchmark_user()
+            seed_wines(user, options["wines"])
+            self.stdout.write(f"Seeded {options['wines']} wines.\n")
+
+            for term in options["terms"]:
+                before = Wine.objects.filter_eq_user_id(user.id).filter(
+                    Q(name__unaccent__icontains=term) | Q(producer__unaccent__icontains=term)
+                )
+                after = Wine.objects.filter_eq_user_id(user.id).filter_eq_name_or_producer(term)
+
+                before_ms = measure(lambda: list(before.values_list("id", flat=True)), options["repeat"])
+                after_ms = measure(lambda: list(after.values_list("id", flat=True)), options["repeat"])
+
+                self.stdout.write(f"== {term!r}: {after.count()} hits")
+                self.stdout.write(f"unaccent__icontains: {before_ms:.1f} ms")
+                self.stdout.write(f"trigram index:       {after_ms:.1f} ms")
+                self.stdout.write(after.values("id").explain(analyze=True))
+                self.stdout.write("")
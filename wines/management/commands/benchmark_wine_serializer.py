@@ -0,0 +1,53 @@
+import random
+
+from django.core.management.base import BaseCommand, CommandParser
+from rest_framework.renderers import JSONRenderer
+
+from llwinecellar.common.benchmark import measure, rolled_back
+from wines.management.benchmark import WORDS, create_benchmark_user, seed_wines
+from wines.models import Cepage, GrapeMaster, Wine, WineTag, WineTagRelation
+from wines.serializers import WineListItemSerializer, WineWithCellarSpaceSerializer
+
+
+class Command(BaseCommand):
+    help = "Times the wine list serializers against the query that loads the wines. Data is rolled back."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--wines", type=int, default=5_000)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options):
+        with rolled_back():
+            user = create_benchmark_user()
+            self._seed_relations(user, seed_wines(user, options["wines"]))
+            self.stdout.write(f"Seeded {options['wines']} wines with 2 cepages and 2 tags each.\n")
+
+            queryset = Wine.objects.filter_eq_user_id(user.id).select_cellarspace().prefetch_tags().prefetch_cepages()
+            wines = list(queryset.order_by("created_at"))
+            renderer = JSONRenderer()
+            timings = {
+                "query": lambda: list(queryset.order_by("created_at")),
+                "WineWithCellarSpaceSerializer": lambda: renderer.render(
+                    {"wines": WineWithCellarSpaceSerializer(wines, many=True).data}
+                ),
+                "WineListItemSerializer": lambda: renderer.render(
+                    {"wines": WineListItemSerializer(wines, many=True).data}
+                ),
+            }
+            for name, func in timings.items():
+                self.stdout.write(f"{name:<30} {measure(func, options['repeat']):.1f} ms")
+
+    def _seed_relations(self, user, wines):
+        rng = random.Random(0)
+        grapes = GrapeMaster.objects.bulk_create(
+            [GrapeMaster(user=user, name=word, abbreviation=word[:2]) for word in WORDS]
+        )
+        tags = WineTag.objects.bulk_create([WineTag(user=user, text=word) for word in WORDS])
+        Cepage.objects.bulk_create(
+            [Cepage(wine=wine, grape=grape, percentage=50) for wine in wines for grape in rng.sample(grapes, 2)],
+            batch_size=5_000,
+        )
+        WineTagRelation.objects.bulk_create(
+            [WineTagRelation(wine=wine, tag_master=tag) for wine in wines for tag in rng.sample(tags, 2)],
+            batch_size=5_000,
+        )
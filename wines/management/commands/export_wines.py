@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from llwinecellar.streaming import stream_csv, stream_json_lines
+from users.models import User
+from wines.enums import WineFileFormat
+from wines.serializers import WineListItemSerializer
+from wines.use_cases import ExportWines
+
+
+class Command(BaseCommand):
+    help = (
+        "Streams the wines of a user, or of one of their cellars, as CSV or JSON Lines. "
+        "register_wines --format reads the file back."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--user_id", type=int, required=True)
+        parser.add_argument("--cellar_id", type=str)
+        parser.add_argument("--format", choices=[f.value for f in WineFileFormat], default=WineFileFormat.CSV.value)
+        parser.add_argument("--output", type=str, help="File to write to. Defaults to stdout.")
+
+    def handle(self, *args, **options):
+        user = User.objects.filter(id=options["user_id"]).first()
+        if user is None:
+            raise CommandError(f"User {options['user_id']} does not exist.")
+
+        wines = ExportWines().execute(user=user, cellar_id=options["cellar_id"])
+        stream = stream_json_lines if options["format"] == WineFileFormat.JSONL else stream_csv
+        content = stream(wines, WineListItemSerializer())
+
+        if options["output"] is None:
+            # Chunks end between rows, so each one decodes on its own.
+            for chunk in content:
+                self.stdout.write(chunk.decode(), ending="")
+        else:
+            with open(options["output"], "wb") as f:
+                for chunk in content:
+                    f.write(chunk)
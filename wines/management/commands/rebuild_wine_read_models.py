@@ -0,0 +1,37 @@
+import itertools
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import transaction
+
+from llwinecellar.common.user_data_cache import user_data_cache
+from wines.models import Wine, refresh_wine_read_models
+
+
+class Command(BaseCommand):
+    help = "Re-renders the WineReadModel document of every wine, in batches. Needs settings.WINE_READ_MODEL."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--user_id", type=int)
+        parser.add_argument("--batch_size", type=int, default=1_000)
+
+    def handle(self, *args, **options):
+        if not settings.WINE_READ_MODEL:
+            raise CommandError("WINE_READ_MODEL is off, so documents would go stale again. Turn it on first.")
+
+        wines = Wine.objects.all()
+        if (user_id := options["user_id"]) is not None:
+            wines = wines.filter_eq_user_id(user_id)
+
+        wine_ids = wines.order_by("id").values_list("id", flat=True).iterator(chunk_size=options["batch_size"])
+        count = 0
+        while batch := list(itertools.islice(wine_ids, options["batch_size"])):
+            with transaction.atomic():
+                refresh_wine_read_models(batch)
+            count += len(batch)
+
+        # Cached lists still hold the old documents.
+        for user_id in wines.order_by().values_list("user_id", flat=True).distinct():
+            user_data_cache.invalidate(user_id)
+
+        self.stdout.write(f"{count} wine documents rebuilt.")
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
+
+from llwinecellar.common.user_data_cache import user_data_cache
+from wines.models import WineTag
+
+
+class Command(BaseCommand):
+    help = "Checks the wine_count and in_stock_count of wine tags against their relations and rebuilds them."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--user_id", type=int)
+        parser.add_argument("--check", action="store_true", help="Only report inconsistent tags.")
+
+    def handle(self, *args, **options):
+        tags = WineTag.objects.all()
+        if (user_id := options["user_id"]) is not None:
+            tags = tags.filter_eq_user_id(user_id)
+
+        with transaction.atomic():
+            inconsistent_tags = list(tags.filter_inconsistent_counts().select_for_update(of=("self",)).order_by("id"))
+            for tag in inconsistent_tags:
+                self.stdout.write(
+                    f"{tag.user_id} {tag.text!r}: wine_count {tag.wine_count} -> {tag.counted_wine_count}, "
+                    f"in_stock_count {tag.in_stock_count} -> {tag.counted_in_stock_count}"
+                )
+            if inconsistent_tags and not options["check"]:
+                WineTag.objects.filter(id__in=[tag.id for tag in inconsistent_tags]).rebuild_counts()
+                # Cached tag lists still hold the wrong counts.
+                for user_id in {tag.user_id for tag in inconsistent_tags}:
+                    user_data_cache.invalidate(user_id)
+
+        action = "found" if options["check"] else "rebuilt"
+        self.stdout.write(f"{len(inconsistent_tags)} inconsistent tags {action}.")
@@ -1,74 +1,313 @@
-from datetime import datetime
+import csv
+import itertools
+import json
+import time
+import uuid
+from collections.abc import Iterable, Iterator
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Optional
 
-from django.core.management.base import BaseCommand, CommandParser
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import transaction
 
+from cellars.enums import CellarSpaceType
 from cellars.models import Cellar, CellarSpace
-from wines.enums import Country
-from wines.models import Wine, WineTag
+from llwinecellar.common.bulk_copy import copy_insert
+from llwinecellar.common.user_data_cache import user_data_cache
+from users.models import User
+from wines.enums import Country, WineFileFormat
+from wines.models import (
+    Cepage,
+    GrapeMaster,
+    Wine,
+    WineTag,
+    WineTagRelation,
+    count_wine_values,
+    refresh_wine_read_models,
+)
 
 FILE_DIR = "wines/fixtures"
+NEW_RECORD_MARK = "⭐︎,"
+
+
+class _TargetCellars:
+    """
+    The cellar of the user each wine with a position goes to. Files export_wines wrote name the cellar of each
+    wine: cellars given in --cellar_map go to their mapped cellar, and --cellar_id takes the wines of one other
+    cellar, or every wine of the legacy export, which names none. The wines of a further cellar would be mixed into
+    that one, so they are rejected.
+    """
+
+    def __init__(self, default: Optional[Cellar], mapped: dict[str, Cellar]):
+        self.default = default
+        self.mapped = mapped
+        # The exported cellar --cellar_id stands for, once a wine of it has been read.
+        self.default_source_id: Optional[str] = None
+
+    def get(self, number: int, source_id: Optional[str]) -> Cellar:
+        if source_id is not None and source_id in self.mapped:
+            return self.mapped[source_id]
+        if self.default is None:
+            raise CommandError(f"Record {number}: the wine has a position, but no --cellar_id or --cellar_map for it.")
+        if source_id is not None:
+            if self.default_source_id is None:
+                self.default_source_id = source_id
+            elif source_id != self.default_source_id:
+                raise CommandError(
+                    f"Record {number}: the file holds wines of cellars {self.default_source_id} and {source_id}. "
+                    "Give each of them a --cellar_map."
+                )
+        return self.default
 
 
 class Command(BaseCommand):
+    help = (
+        "Imports wines from the legacy inventory export, or with --format from a file export_wines wrote, streaming "
+        "it in batches. The whole import runs in one transaction, so a bad record leaves nothing behind."
+    )
+
     def add_arguments(self, parser: CommandParser) -> None:
-        # parser.add_argument("--cellar_id", type=str)
-        # parser.add_argument("--user_id", type=int)
-        parser.add_argument("--file_name", type=str)
+        parser.add_argument("--file_name", type=str, required=True, help=f"Relative to {FILE_DIR}, or absolute.")
+        parser.add_argument("--user_id", type=int, required=True)
+        parser.add_argument(
+            "--cellar_id", type=str, help="Cellar to put wines with a position in, when they come from one cellar."
+        )
+        parser.add_argument(
+            "--cellar_map",
+            type=str,
+            action="append",
+            default=[],
+            metavar="EXPORTED_ID=CELLAR_ID",
+            help="Cellar to put the wines of the exported cellar EXPORTED_ID in. Repeat it for each exported cellar.",
+        )
+        parser.add_argument(
+            "--format", choices=[f.value for f in WineFileFormat], help="Omit for the legacy inventory export."
+        )
+        parser.add_argument("--batch_size", type=int, default=1_000)
 
     def handle(self, *args, **options):
-        # cellar_id = options["cellar_id"]
-        # user_id = options["user_id"]
-        file_name = options["file_name"]
-
-        csv_lines = []
-        with open(f"{FILE_DIR}/{file_name}", "r", encoding="utf_8") as f:
-            for line in f:
-                if "⭐︎," in line:
-                    csv_lines.append(line)
-                else:
-                    csv_lines[-1] += line
-
-        cellar = Cellar.objects.first()
-
-        cellar_spaces = []
-
-        for line in csv_lines:
-            li = iter(line.strip().split(","))
-            _new_record_mark = next(li)
-            wine = Wine(
-                name=next(li),
-                producer=next(li),
-                country=Country.from_label(next(li)),
-                region_1=next(li),
-                region_2=next(li),
-                region_3=next(li),
-                region_4=next(li),
-                region_5=next(li),
-                vintage=int(vin) if (vin := next(li)) != "" else None,
-                bought_at=next(li),
-                bought_from=next(li),
-                price=int(price) if (price := next(li)) != "" else None,
-                drunk_at=next(li),
-                note=next(li),
-                user_id=1,
-            )
-
-            wine.bought_at = datetime.strptime(wine.bought_at, "%Y/%m/%d") if wine.bought_at else None
-            wine.drunk_at = datetime.strptime(wine.drunk_at, "%Y/%m/%d") if wine.drunk_at else None
-
-            wine.save()
-
-            # tag は 1 つのみでstr で指定
-            tag_text = next(li)
-            if tag_text != "":
-                tags = [WineTag.objects.get_or_create(user_id=1, text=tag_text)[0]]
-                wine.tags.set(tags)
-
-            position = next(li)
-            if position != "":
-                row, column = position.split("-")
-
-                cellar_space = CellarSpace.objects.get_by_cellar_row_column(cellar.id, row, column)
+        user = User.objects.filter(id=options["user_id"]).first()
+        if user is None:
+            raise CommandError(f"User {options['user_id']} does not exist.")
+        cellars = _TargetCellars(
+            self._get_cellar(user, options["cellar_id"]), self._get_mapped_cellars(user, options["cellar_map"])
+        )
+        racks = self._get_empty_racks([cellars.default, *cellars.mapped.values()])
+        file_format = options["format"]
+
+        count = 0
+        start = time.perf_counter()
+        path = Path(FILE_DIR) / options["file_name"]
+        # csv handles the line breaks inside quoted cells itself.
+        newline = "" if file_format == WineFileFormat.CSV else None
+        with transaction.atomic(), open(path, "r", encoding="utf_8", newline=newline) as f:
+            records = enumerate(self._read_records(f, file_format), start=1)
+            while batch := list(itertools.islice(records, options["batch_size"])):
+                self._register_batch(user, cellars, racks, batch, file_format)
+                count += len(batch)
+                self.stdout.write(f"{count} wines registered ({count / (time.perf_counter() - start):.0f} rows/s)")
+        user_data_cache.invalidate(user.id)
+
+        elapsed = time.perf_counter() - start
+        self.stdout.write(f"{count} wines registered in {elapsed:.1f} s ({count / elapsed:.0f} rows/s).")
+
+    def _get_cellar(self, user: User, cellar_id) -> Optional[Cellar]:
+        if cellar_id is None:
+            return None
+        cellar = Cellar.objects.filter_eq_user_id(user.id).filter(id=cellar_id).first()
+        if cellar is None:
+            raise CommandError(f"Cellar {cellar_id} of user {user.id} does not exist.")
+        return cellar
+
+    def _get_mapped_cellars(self, user: User, cellar_map: list[str]) -> dict[str, Cellar]:
+        """
+        The cellars of --cellar_map keyed by the exported cellar ids, as export_wines writes them.
+        """
+        mapped = {}
+        for pair in cellar_map:
+            source_id, _, cellar_id = pair.partition("=")
+            try:
+                source_id = str(uuid.UUID(source_id))
+                cellar_id = uuid.UUID(cellar_id)
+            except ValueError:
+                raise CommandError(f"--cellar_map {pair} is not EXPORTED_ID=CELLAR_ID.") from None
+            mapped[source_id] = self._get_cellar(user, cellar_id)
+        return mapped
+
+    def _get_empty_racks(self, cellars: list[Optional[Cellar]]) -> dict[tuple, CellarSpace]:
+        """
+        Every empty rack of the cellars keyed by (cellar id, row, column), loaded once instead of one query per
+        wine.
+        """
+        cellar_ids = [cellar.id for cellar in cellars if cellar is not None]
+        if not cellar_ids:
+            return {}
+        racks = CellarSpace.objects.filter(cellar_id__in=cellar_ids).filter_by_type(CellarSpaceType.RACK).filter_empty()
+        return {(rack.cellar_id, rack.row, rack.column): rack for rack in racks}
+
+    def _read_records(self, f: Iterable[str], file_format: Optional[str]) -> Iterator:
+        if file_format == WineFileFormat.CSV:
+            return csv.DictReader(f)
+        if file_format == WineFileFormat.JSONL:
+            return (line for line in f if line.strip())
+        return self._read_legacy_records(f)
+
+    def _read_legacy_records(self, lines: Iterable[str]) -> Iterator[str]:
+        """
+        Yields records one at a time. A record starts with NEW_RECORD_MARK; other lines continue the note of the
+        previous record.
+        """
+        record = None
+        for line in lines:
+            if NEW_RECORD_MARK in line:
+                if record is not None:
+                    yield record
+                record = line
+            elif record is not None:
+                record += line
+        if record is not None:
+            yield record
+
+    def _register_batch(self, user: User, cellars: _TargetCellars, racks: dict, batch, file_format: Optional[str]):
+        """
+        Inserts a batch of records with one COPY per table, then shifts the counters by what the batch adds.
+        """
+        wines: list[Wine] = []
+        wine_tag_texts: list[tuple[Wine, str]] = []
+        wine_cepages: list[tuple[Wine, dict]] = []
+        cellar_spaces: list[CellarSpace] = []
+        baskets: list[CellarSpace] = []
+        for number, record in batch:
+            try:
+                row = self._parse_record(record, file_format)
+                wine = self._build_wine(user, row)
+                position = self._parse_position(row["position"])
+                source_id = str(uuid.UUID(row["cellar_id"])) if row.get("cellar_id") else None
+            except (AttributeError, KeyError, StopIteration, TypeError, ValueError) as exc:
+                raise CommandError(f"Record {number} is malformed: {exc!r}") from exc
+            wines.append(wine)
+            wine_tag_texts.extend((wine, tag_text) for tag_text in row["tag_texts"])
+            wine_cepages.extend((wine, cepage) for cepage in row["cepages"])
+
+            if position is None:
+                continue
+            cellar = cellars.get(number, source_id)
+            if position == CellarSpaceType.BASKET:
+                if not cellar.has_basket:
+                    raise CommandError(f"Record {number}: the wine is in a basket, but the cellar has none.")
+                baskets.append(CellarSpace(cellar=cellar, type=CellarSpaceType.BASKET, wine=wine))
+            else:
+                if (cellar_space := racks.pop((cellar.id, *position), None)) is None:
+                    raise CommandError(f"Record {number}: rack {row['position']} is not empty or missing.")
                 cellar_space.wine = wine
                 cellar_spaces.append(cellar_space)
-        CellarSpace.objects.bulk_update(cellar_spaces, fields=["wine"])
+
+        copy_insert(wines)
+        CellarSpace.objects.set_wines({cellar_space.id: cellar_space.wine.id for cellar_space in cellar_spaces})
+        copy_insert(baskets)
+
+        tags = WineTag.objects.get_or_create_by_texts(user.id, [tag_text for _wine, tag_text in wine_tag_texts])
+        relations = [WineTagRelation(wine=wine, tag_master=tags[tag_text]) for wine, tag_text in wine_tag_texts]
+        copy_insert(relations)
+        WineTag.objects.add_counts_of_relations(relations)
+
+        grapes = GrapeMaster.objects.get_or_create_by_names(
+            user.id, {cepage["name"]: cepage.get("abbreviation") for _wine, cepage in wine_cepages}
+        )
+        copy_insert(
+            [
+                Cepage(wine=wine, grape=grapes[cepage["name"]], percentage=self._to_decimal(cepage["percentage"]))
+                for wine, cepage in wine_cepages
+            ]
+        )
+
+        count_wine_values(user.id, added=[wine.counted_values for wine in wines])
+        refresh_wine_read_models(wine.id for wine in wines)
+
+    def _parse_record(self, record, file_format: Optional[str]) -> dict:
+        """
+        Turns a record of any format into a dict shaped like the wines export_wines writes.
+        """
+        if file_format == WineFileFormat.CSV:
+            return self._parse_csv_row(record)
+        if file_format == WineFileFormat.JSONL:
+            return json.loads(record)
+        return self._parse_legacy_record(record)
+
+    def _parse_csv_row(self, row: dict) -> dict:
+        if None in row:
+            raise ValueError("more cells than columns")
+        row = {key: value or None for key, value in row.items()}
+        for key in ("tag_texts", "cepages"):
+            row[key] = json.loads(row[key]) if row[key] else []
+        for key in ("vintage", "price", "value"):
+            row[key] = int(row[key]) if row[key] else None
+        return row
+
+    def _parse_legacy_record(self, record: str) -> dict:
+        li = iter(record.strip().split(","))
+        _new_record_mark = next(li)
+        row = {
+            "name": next(li),
+            "producer": next(li),
+            "country": next(li) or None,
+            "region_1": next(li),
+            "region_2": next(li),
+            "region_3": next(li),
+            "region_4": next(li),
+            "region_5": next(li),
+            "vintage": int(vin) if (vin := next(li)) != "" else None,
+            "bought_at": self._to_iso_date(next(li)),
+            "bought_from": next(li),
+            "price": int(price) if (price := next(li)) != "" else None,
+            "drunk_at": self._to_iso_date(next(li)),
+            "note": next(li),
+            "value": None,
+            "cepages": [],
+        }
+        # tag は 1 つのみでstr で指定
+        row["tag_texts"] = [tag_text] if (tag_text := next(li)) != "" else []
+        row["position"] = next(li) or None
+        return row
+
+    def _to_iso_date(self, value: str) -> Optional[str]:
+        """
+        The legacy export writes dates as %Y/%m/%d.
+        """
+        return datetime.strptime(value, "%Y/%m/%d").date().isoformat() if value else None
+
+    def _build_wine(self, user: User, row: dict) -> Wine:
+        return Wine(
+            name=row["name"] or "",
+            producer=row["producer"] or "",
+            country=Country.from_label(row["country"]) if row["country"] else None,
+            region_1=row["region_1"] or "",
+            region_2=row["region_2"] or "",
+            region_3=row["region_3"] or "",
+            region_4=row["region_4"] or "",
+            region_5=row["region_5"] or "",
+            vintage=row["vintage"],
+            bought_at=date.fromisoformat(row["bought_at"]) if row["bought_at"] else None,
+            bought_from=row["bought_from"] or "",
+            price=row["price"],
+            drunk_at=date.fromisoformat(row["drunk_at"]) if row["drunk_at"] else None,
+            note=row["note"] or "",
+            value=row["value"],
+            user=user,
+        )
+
+    def _parse_position(self, position: Optional[str]):
+        """
+        CellarSpaceType.BASKET, the (row, column) of a rack, or None for a wine out of cellars.
+        """
+        if position is None:
+            return None
+        if position == "basket":
+            return CellarSpaceType.BASKET
+        row, column = position.split("-")
+        return int(row), int(column)
+
+    def _to_decimal(self, percentage) -> Optional[Decimal]:
+        return None if percentage is None else Decimal(str(percentage))
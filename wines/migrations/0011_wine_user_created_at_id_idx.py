@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-18 10:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wines", "0010_wine_value"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="wine",
+            index=models.Index(fields=["user", "created_at", "id"], name="wine_user_created_at_id_idx"),
+        ),
+    ]
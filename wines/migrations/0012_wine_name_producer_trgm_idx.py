@@ -0,0 +1,41 @@
+# Generated by Django 4.2.30 on 2026-10-18 10:56
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+import wines.models.functions
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wines", "0011_wine_user_created_at_id_idx"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunSQL(
+            sql="""
+            CREATE OR REPLACE FUNCTION immutable_unaccent(text) RETURNS text
+            AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$
+            LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT;
+            """,
+            reverse_sql="DROP FUNCTION IF EXISTS immutable_unaccent(text);",
+        ),
+        migrations.AddIndex(
+            model_name="wine",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(wines.models.functions.SearchKey("name"), name="gin_trgm_ops"),
+                name="wine_name_trgm_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="wine",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    wines.models.functions.SearchKey("producer"), name="gin_trgm_ops"
+                ),
+                name="wine_producer_trgm_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 4.2.30 on 2026-10-18 11:19
+
+import uuid
+from collections import Counter
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+from wines.enums import Country
+
+
+def count_wine_regions(apps, schema_editor):
+    Wine = apps.get_model("wines", "Wine")
+    WineRegion = apps.get_model("wines", "WineRegion")
+
+    counts = Counter()
+    region_values = (
+        Wine.objects.exclude(_country_str__isnull=True)
+        .exclude(_country_str="")
+        .values("user_id", "_country_str", "region_1", "region_2", "region_3", "region_4", "region_5")
+        .annotate(wine_count=models.Count("id"))
+    )
+    for r in region_values:
+        regions = [r["region_1"], r["region_2"], r["region_3"], r["region_4"], r["region_5"]]
+        label = ">".join([Country[r["_country_str"]].label, *regions]).strip(">")
+        counts[(r["user_id"], label)] += r["wine_count"]
+
+    now = timezone.now()
+    WineRegion.objects.bulk_create(
+        [
+            WineRegion(user_id=user_id, label=label, wine_count=wine_count, created_at=now, updated_at=now)
+            for (user_id, label), wine_count in counts.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("wines", "0012_wine_name_producer_trgm_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WineRegion",
+            fields=[
+                ("id", models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ("label", models.CharField(db_collation="C", max_length=1024)),
+                ("wine_count", models.IntegerField(default=0)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "user",
+                    models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="wineregion",
+            constraint=models.UniqueConstraint(fields=("user", "label"), name="unique_user_label"),
+        ),
+        migrations.RunPython(count_wine_regions, migrations.RunPython.noop),
+    ]
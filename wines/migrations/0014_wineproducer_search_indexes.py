@@ -0,0 +1,129 @@
+# Generated by Django 4.2.30 on 2026-10-18 11:27
+
+import uuid
+
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+import wines.models.functions
+
+
+def count_wine_producers(apps, schema_editor):
+    Wine = apps.get_model("wines", "Wine")
+    WineProducer = apps.get_model("wines", "WineProducer")
+
+    now = timezone.now()
+    producer_values = (
+        Wine.objects.exclude(producer="").values("user_id", "producer").annotate(wine_count=models.Count("id"))
+    )
+    WineProducer.objects.bulk_create(
+        [
+            WineProducer(
+                user_id=p["user_id"], label=p["producer"], wine_count=p["wine_count"], created_at=now, updated_at=now
+            )
+            for p in producer_values
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("wines", "0013_wineregion"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WineProducer",
+            fields=[
+                ("id", models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ("label", models.CharField(db_collation="C", max_length=1024)),
+                ("search_key", models.CharField(db_collation="C", default="", editable=False, max_length=1024)),
+                ("wine_count", models.IntegerField(default=0)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "user",
+                    models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="wineproducer",
+            constraint=models.UniqueConstraint(fields=("user", "label"), name="unique_user_producer"),
+        ),
+        migrations.AddField(
+            model_name="wineregion",
+            name="search_key",
+            field=models.CharField(db_collation="C", default="", editable=False, max_length=1024),
+        ),
+        migrations.RunPython(count_wine_producers, migrations.RunPython.noop),
+        migrations.RunSQL(
+            sql=[
+                "UPDATE wines_wineproducer SET search_key = lower(immutable_unaccent(label));",
+                "UPDATE wines_wineregion SET search_key = lower(immutable_unaccent(label));",
+            ],
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name="wineproducer",
+            index=models.Index(fields=["user", "search_key"], name="wineproducer_search_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="wineproducer",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_key"], name="wineproducer_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="wineregion",
+            index=models.Index(fields=["user", "search_key"], name="wineregion_search_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="wineregion",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_key"], name="wineregion_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="grapemaster",
+            index=models.Index(
+                models.F("user"),
+                django.contrib.postgres.indexes.OpClass(
+                    wines.models.functions.SearchKey("name"), name="text_pattern_ops"
+                ),
+                name="grape_user_name_pattern_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="grapemaster",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(wines.models.functions.SearchKey("name"), name="gin_trgm_ops"),
+                name="grapemaster_name_trgm_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="winetag",
+            index=models.Index(
+                models.F("user"),
+                django.contrib.postgres.indexes.OpClass(
+                    wines.models.functions.SearchKey("text"), name="text_pattern_ops"
+                ),
+                name="winetag_user_text_pattern_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="winetag",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(wines.models.functions.SearchKey("text"), name="gin_trgm_ops"),
+                name="winetag_text_trgm_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 4.2.30 on 2026-10-18 11:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wines", "0014_wineproducer_search_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="winetag",
+            name="wine_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="winetag",
+            name="in_stock_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunSQL(
+            sql="""
+            UPDATE wines_winetag AS t SET
+                wine_count = (SELECT count(*) FROM wines_winetagrelation AS r WHERE r.tag_master_id = t.id),
+                in_stock_count = (
+                    SELECT count(*) FROM wines_winetagrelation AS r JOIN wines_wine AS w ON w.id = r.wine_id
+                    WHERE r.tag_master_id = t.id AND w.drunk_at IS NULL
+                );
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name="winetag",
+            index=models.Index(
+                fields=["user", "text"], include=("wine_count", "in_stock_count"), name="winetag_user_text_counts_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 4.2.30 on 2026-10-18 11:49
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wines", "0015_winetag_counts"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WineReadModel",
+            fields=[
+                (
+                    "wine",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="read_model",
+                        serialize=False,
+                        to="wines.wine",
+                    ),
+                ),
+                ("document", models.JSONField()),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.30 on 2026-10-18 12:56
+
+from django.db import migrations
+
+import llwinecellar.common.fields
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wines", "0016_winereadmodel"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="cepage",
+            name="created_at",
+            field=llwinecellar.common.fields.InsertionOrderedDateTimeField(auto_now_add=True),
+        ),
+        migrations.AlterField(
+            model_name="winetagrelation",
+            name="created_at",
+            field=llwinecellar.common.fields.InsertionOrderedDateTimeField(auto_now_add=True),
+        ),
+    ]
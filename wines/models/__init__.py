@@ -1,5 +1,9 @@
 from .cepage import Cepage
 from .grape_master import GrapeMaster
 from .wine import Wine
+from .wine_producer import WineProducer
+from .wine_read_model import WineReadModel, refresh_wine_read_models
+from .wine_region import WineRegion
 from .wine_tag import WineTag
 from .wine_tag_relation import WineTagRelation
+from .wine_value_count import count_wine_values
@@ -3,6 +3,8 @@ from typing import Optional
 
 from django.db import models
 
+from llwinecellar.common.fields import InsertionOrderedDateTimeField
+
 
 class CepageQuerySet(models.QuerySet["Cepage"]):
     def get_by_id(self, id) -> Optional["Cepage"]:
@@ -11,6 +13,9 @@ class CepageQuerySet(models.QuerySet["Cepage"]):
         except Cepage.DoesNotExist:
             return None
 
+    def filter_eq_user_id(self, user_id) -> "CepageQuerySet":
+        return self.filter(wine__user_id=user_id)
+
 
 class Cepage(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -18,7 +23,7 @@ class Cepage(models.Model):
     grape = models.ForeignKey("GrapeMaster", on_delete=models.CASCADE, related_name="cepages")
     percentage = models.DecimalField(max_digits=4, decimal_places=1, blank=True, null=True)
 
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = InsertionOrderedDateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     objects: CepageQuerySet = CepageQuerySet.as_manager()
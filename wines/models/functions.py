@@ -0,0 +1,22 @@
+from django.db.models import Func, TextField
+from django.db.models.functions import Lower
+
+
+class ImmutableUnaccent(Func):
+    """
+    unaccent() is only STABLE, so it cannot be used in index expressions.
+    immutable_unaccent() is created in migration 0012 and pins the dictionary.
+    """
+
+    function = "immutable_unaccent"
+    output_field = TextField()
+
+
+class SearchKey(Lower):
+    """
+    lower(immutable_unaccent(...)): the expression the trigram indexes are built on.
+    Filters must use the same expression for the planner to pick up the indexes.
+    """
+
+    def __init__(self, expression, **extra):
+        super().__init__(ImmutableUnaccent(expression), **extra)
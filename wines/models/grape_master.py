@@ -1,12 +1,20 @@
 import uuid
 from typing import Optional
 
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery
 
 from users.models import User
 
+from .cepage import Cepage
+from .functions import SearchKey
+from .search import SearchQuerySetMixin
+
+
+class GrapeMasterQuerySet(SearchQuerySetMixin, models.QuerySet["GrapeMaster"]):
+    search_field = "name"
 
-class GrapeMasterQuerySet(models.QuerySet["GrapeMaster"]):
     def get_by_id(self, id) -> Optional["GrapeMaster"]:
         try:
             return self.get(id=id)
@@ -22,6 +30,32 @@ class GrapeMasterQuerySet(models.QuerySet["GrapeMaster"]):
     def filter_eq_user_id(self, user_id) -> "GrapeMasterQuerySet":
         return self.filter(user_id=user_id)
 
+    def get_or_create_by_names(self, user_id, abbreviations: dict[str, Optional[str]]) -> dict[str, "GrapeMaster"]:
+        """
+        Set-based get_or_create keyed by name, which is what unique_name_user constrains.
+        abbreviations maps each name to the abbreviation used when the grape has to be created.
+        """
+        grapes = {grape.name: grape for grape in self.filter(user_id=user_id, name__in=abbreviations.keys())}
+        if missing := [name for name in abbreviations if name not in grapes]:
+            self.bulk_create(
+                [GrapeMaster(user_id=user_id, name=name, abbreviation=abbreviations[name]) for name in missing],
+                ignore_conflicts=True,
+            )
+            grapes.update({grape.name: grape for grape in self.filter(user_id=user_id, name__in=missing)})
+        return grapes
+
+    def search(self, q: str) -> "GrapeMasterQuerySet":
+        """
+        Grapes matching q: prefix matches first, then the most used, counted like in WineTagQuerySet.search.
+        """
+        cepages = Cepage.objects.filter(grape=OuterRef("pk")).order_by()
+        wine_count = cepages.values("grape").annotate(wine_count=Count("id")).values("wine_count")
+        return (
+            self.filter_search(q)
+            .alias(wine_count=Subquery(wine_count, output_field=IntegerField()))
+            .order_by("-search_is_prefix", F("wine_count").desc(nulls_last=True), "name")
+        )
+
 
 class GrapeMaster(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -40,5 +74,11 @@ class GrapeMaster(models.Model):
                 name="unique_name_user",
             ),
         )
+        indexes = (
+            models.Index(
+                F("user"), OpClass(SearchKey("name"), name="text_pattern_ops"), name="grape_user_name_pattern_idx"
+            ),
+            GinIndex(OpClass(SearchKey("name"), name="gin_trgm_ops"), name="grapemaster_name_trgm_idx"),
+        )
 
     objects: GrapeMasterQuerySet = GrapeMasterQuerySet.as_manager()
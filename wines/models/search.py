@@ -0,0 +1,30 @@
+from django.db.models import BooleanField, ExpressionWrapper, Q, Value
+
+from .functions import SearchKey
+
+# pg_trgm cannot extract a trigram from shorter terms, so they are matched as prefixes only.
+MIN_INFIX_LENGTH = 3
+
+
+class SearchQuerySetMixin:
+    """
+    Typeahead on the search_field column, accent and case insensitive like filter_eq_name_or_producer.
+    Querysets using it need a btree index on the search key for prefixes and a gin_trgm_ops one for infixes.
+    """
+
+    search_field: str
+
+    def get_search_key(self):
+        return SearchKey(self.search_field)
+
+    def filter_search(self, q: str):
+        """
+        Also aliases search_is_prefix, for ranking prefix matches before infix ones.
+        """
+        search_key = SearchKey(Value(q))
+        queryset = self.alias(search_text=self.get_search_key()).alias(
+            search_is_prefix=ExpressionWrapper(Q(search_text__startswith=search_key), output_field=BooleanField())
+        )
+        if len(q) < MIN_INFIX_LENGTH:
+            return queryset.filter(search_text__startswith=search_key)
+        return queryset.filter(search_text__contains=search_key)
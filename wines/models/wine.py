@@ -1,13 +1,23 @@
 import uuid
+from decimal import Decimal
 from typing import Optional, Union
 
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
-from django.db.models import Q
+from django.db.models import Count, Prefetch, Q, Value
+from django.utils import timezone
 
 from cellars.enums import CellarSpaceType
 from users.models import User
 
 from ..enums import Country
+from .cepage import Cepage
+from .functions import SearchKey
+from .grape_master import GrapeMaster
+from .wine_producer import WineProducer
+from .wine_region import WineRegion
+from .wine_tag import WineTag
+from .wine_value_count import WineValueCount
 
 
 class WineQuerySet(models.QuerySet["Wine"]):
@@ -27,8 +37,12 @@ class WineQuerySet(models.QuerySet["Wine"]):
         return self.filter(producer=producer)
 
     def filter_eq_name_or_producer(self, name_or_producer: str) -> "WineQuerySet":
-        return self.filter(
-            Q(name__unaccent__icontains=name_or_producer) | Q(producer__unaccent__icontains=name_or_producer)
+        """
+        Accent and case insensitive infix match, served by the trigram indexes on name and producer.
+        """
+        search_key = SearchKey(Value(name_or_producer))
+        return self.alias(name_key=SearchKey("name"), producer_key=SearchKey("producer")).filter(
+            Q(name_key__contains=search_key) | Q(producer_key__contains=search_key)
         )
 
     def filter_eq_country(self, country_capital: str) -> "WineQuerySet":
@@ -46,6 +60,23 @@ class WineQuerySet(models.QuerySet["Wine"]):
     def filter_lte_drunk_at(self, lte) -> "WineQuerySet":
         return self.filter(drunk_at__lte=lte)
 
+    def filter_has_grapes(self, user_id, grape_names: list[str], match_all=True) -> "WineQuerySet":
+        """
+        Wines with every one of the user's grapes named (match_all) or with any of them, as a single
+        `id IN (SELECT wine_id ... GROUP BY wine_id HAVING count(DISTINCT grape_id) = N)` instead of a join chain per
+        grape.
+        """
+        grape_names = set(grape_names)
+        grape_ids = GrapeMaster.objects.filter_eq_user_id(user_id).filter(name__in=grape_names).values("id")
+        cepages = Cepage.objects.filter(grape_id__in=grape_ids)
+        if match_all:
+            cepages = (
+                cepages.values("wine_id")
+                .annotate(grape_count=Count("grape_id", distinct=True))
+                .filter(grape_count=len(grape_names))
+            )
+        return self.filter(id__in=cepages.values("wine_id"))
+
     def filter_eq_cellarspace__isnull(self, flag=True) -> "WineQuerySet":
         return self.filter(cellarspace__isnull=flag)
 
@@ -53,10 +84,17 @@ class WineQuerySet(models.QuerySet["Wine"]):
         return self.select_related("cellarspace")
 
     def prefetch_cepages(self) -> "WineQuerySet":
-        return self.prefetch_related("cepages").prefetch_related("cepages__grape")
+        cepages = Cepage.objects.order_by("created_at")
+        return self.prefetch_related(Prefetch("cepages", queryset=cepages)).prefetch_related("cepages__grape")
 
     def prefetch_tags(self) -> "WineQuerySet":
-        return self.prefetch_related("tags")
+        return self.prefetch_related(Prefetch("tags", queryset=WineTag.objects.order_by_attached_at()))
+
+    def filter_after_cursor(self, created_at, id) -> "WineQuerySet":
+        return self.filter(Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=id))
+
+    def order_by_created_at_and_id(self) -> "WineQuerySet":
+        return self.order_by("created_at", "id")
 
 
 class Wine(models.Model):
@@ -85,6 +123,14 @@ class Wine(models.Model):
 
     objects: WineQuerySet = WineQuerySet.as_manager()
 
+    class Meta:
+        indexes = (
+            # For keyset pagination in ListWine.
+            models.Index(fields=["user", "created_at", "id"], name="wine_user_created_at_id_idx"),
+            GinIndex(OpClass(SearchKey("name"), name="gin_trgm_ops"), name="wine_name_trgm_idx"),
+            GinIndex(OpClass(SearchKey("producer"), name="gin_trgm_ops"), name="wine_producer_trgm_idx"),
+        )
+
     @property
     def country(self):
         if self._country is None:
@@ -133,6 +179,120 @@ class Wine(models.Model):
             return "basket"
         return f"{self.row}-{self.column}"
 
+    @property
+    def counted_values(self) -> dict[type[WineValueCount], Optional[str]]:
+        """
+        The values of this wine that WineValueCount tables count, for count_wine_values.
+        """
+        return {WineRegion: self.region_label, WineProducer: self.producer}
+
+    @property
+    def region_label(self) -> Optional[str]:
+        """
+        "Country>region_1>…>region_5" without trailing empty regions, as listed by ListWineRegions.
+        None when the wine has no country.
+        """
+        if not self._country_str:
+            return None
+        regions = [self.region_1, self.region_2, self.region_3, self.region_4, self.region_5]
+        return ">".join([Country[self._country_str].label, *regions]).strip(">")
+
+    @property
+    def is_in_stock(self) -> bool:
+        return self.drunk_at is None
+
     @property
     def tag_texts(self) -> list[str]:
-        return [tag.text for tag in self.tags.all()]
+        tags = self.tags.all() if self.is_prefetched("tags") else self.tags.order_by_attached_at()
+        return [tag.text for tag in tags]
+
+    def set_cepages(self, percentages: dict[GrapeMaster, Optional[Decimal]]):
+        """
+        Makes the cepages match percentages, keyed by grape and in the order to list them, by inserting, updating
+        and deleting only the rows that differ. Unchanged cepages are left untouched, unless the order changes:
+        cepages are listed by created_at, so a new order is stored by inserting them all again. Prefetched cepages
+        are kept in step with the rows.
+        """
+        stored = {cepage.grape_id: cepage for cepage in sorted(self.cepages.all(), key=lambda c: c.created_at)}
+        grape_ids = [grape.id for grape in percentages]
+
+        kept_ids = [grape_id for grape_id in stored if grape_id in grape_ids]
+        if kept_ids != grape_ids[: len(kept_ids)]:
+            removed, stored = list(stored.values()), {}
+        else:
+            removed = [cepage for grape_id, cepage in stored.items() if grape_id not in grape_ids]
+        if removed:
+            Cepage.objects.filter(id__in=[cepage.id for cepage in removed]).delete()
+
+        changed = []
+        for grape, percentage in percentages.items():
+            if (cepage := stored.get(grape.id)) is not None and cepage.percentage != percentage:
+                cepage.percentage = percentage
+                cepage.updated_at = timezone.now()
+                changed.append(cepage)
+        if changed:
+            Cepage.objects.bulk_update(changed, fields=["percentage", "updated_at"])
+
+        if added := [
+            Cepage(wine=self, grape=grape, percentage=percentage)
+            for grape, percentage in percentages.items()
+            if grape.id not in stored
+        ]:
+            Cepage.objects.bulk_create(added)
+
+        if self.is_prefetched("cepages"):
+            kept = [cepage for grape_id, cepage in stored.items() if grape_id in grape_ids]
+            self.set_prefetched("cepages", kept + added)
+
+    def set_tags(self, tags: list["WineTag"]):
+        """
+        Same as tags.set(), except that newly attached tags are inserted in the given order, so they are listed
+        in that order, and that the counters of attached and detached tags are updated. Prefetched tags are kept in
+        step with the rows.
+        """
+        # Checked first, as remove() drops the prefetched tags.
+        was_prefetched = self.is_prefetched("tags")
+        attached = list(self.tags.all())
+        attached_ids = {tag.id for tag in attached}
+        in_stock_count = 1 if self.is_in_stock else 0
+
+        if detached_ids := attached_ids - {tag.id for tag in tags}:
+            self.tags.remove(*detached_ids)
+            WineTag.objects.filter(id__in=detached_ids).add_counts(-1, -in_stock_count)
+
+        if added := [tag for tag in tags if tag.id not in attached_ids]:
+            self.tags.through.objects.bulk_create([self.tags.through(wine=self, tag_master=tag) for tag in added])
+            WineTag.objects.filter(id__in=[tag.id for tag in added]).add_counts(1, in_stock_count)
+
+        if was_prefetched:
+            self.set_prefetched("tags", [tag for tag in attached if tag.id not in detached_ids] + added)
+
+    def is_prefetched(self, name: str) -> bool:
+        return name in getattr(self, "_prefetched_objects_cache", {})
+
+    def set_prefetched(self, name: str, objs: list):
+        """
+        Caches objs as the rows of the relation name, the way prefetch_related does, so that a wine just written can
+        be serialized without reading back what the caller already has in memory.
+        """
+        cache = self.__dict__.setdefault("_prefetched_objects_cache", {})
+        cache.pop(name, None)
+        queryset = getattr(self, name).all()
+        queryset._result_cache = list(objs)
+        queryset._prefetch_done = True
+        cache[name] = queryset
+
+    def set_no_relations_prefetched(self):
+        """
+        For a wine just inserted: it has no cepages, tags nor cellar space yet, so none of them needs to be read.
+        """
+        self.set_prefetched("cepages", [])
+        self.set_prefetched("tags", [])
+        Wine.cellarspace.related.set_cached_value(self, None)
+
+    def count_in_stock_change(self, was_in_stock: bool):
+        """
+        Call after saving drunk_at, with is_in_stock from before, to keep in_stock_count of the tags in step.
+        """
+        if self.is_in_stock != was_in_stock and (tag_ids := [tag.id for tag in self.tags.all()]):
+            WineTag.objects.filter(id__in=tag_ids).add_counts(0, 1 if self.is_in_stock else -1)
@@ -0,0 +1,17 @@
+from django.db import models
+
+from .wine_value_count import WineValueCount
+
+
+class WineProducer(WineValueCount):
+    """
+    The user's distinct non-blank Wine.producer values.
+    """
+
+    class Meta(WineValueCount.Meta):
+        constraints = (
+            models.UniqueConstraint(
+                fields=["user", "label"],
+                name="unique_user_producer",
+            ),
+        )
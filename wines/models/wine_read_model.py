@@ -0,0 +1,41 @@
+from typing import Iterable
+
+from django.conf import settings
+from django.db import models
+
+
+class WineReadModel(models.Model):
+    """
+    A wine as ListWine returns it, rendered when the wine is written: the document already holds cellar_id and
+    position, tag_texts, the cepages with their grapes and the country label, so listing needs neither joins to the
+    related tables nor prefetches. Only maintained while settings.WINE_READ_MODEL is on.
+    """
+
+    wine = models.OneToOneField("Wine", primary_key=True, on_delete=models.CASCADE, related_name="read_model")
+    document = models.JSONField()
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+
+def refresh_wine_read_models(wine_ids: Iterable) -> None:
+    """
+    Re-renders the documents of the wines in the caller's transaction. Call it after every write that changes what
+    ListWine returns for a wine, including writes to its tags, cepages, grapes and cellar space.
+    Does nothing while settings.WINE_READ_MODEL is off; run rebuild_wine_read_models after turning it on.
+    """
+    if not settings.WINE_READ_MODEL:
+        return
+
+    from ..serializers import WineListItemSerializer
+    from .wine import Wine
+
+    wines = Wine.objects.filter(id__in=set(wine_ids)).select_cellarspace().prefetch_tags().prefetch_cepages()
+    WineReadModel.objects.bulk_create(
+        [
+            WineReadModel(wine_id=document["id"], document=document)
+            for document in WineListItemSerializer(wines, many=True).data
+        ],
+        update_conflicts=True,
+        unique_fields=["wine"],
+        update_fields=["document", "updated_at"],
+    )
@@ -0,0 +1,17 @@
+from django.db import models
+
+from .wine_value_count import WineValueCount
+
+
+class WineRegion(WineValueCount):
+    """
+    The user's distinct "Country>region_1>…>region_5" paths, as built by Wine.region_label.
+    """
+
+    class Meta(WineValueCount.Meta):
+        constraints = (
+            models.UniqueConstraint(
+                fields=["user", "label"],
+                name="unique_user_label",
+            ),
+        )
@@ -1,12 +1,25 @@
 import uuid
-from typing import Optional
+from collections import defaultdict
+from typing import TYPE_CHECKING, Iterable, Optional
 
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
 
 from users.models import User
 
+from .functions import SearchKey
+from .search import SearchQuerySetMixin
+
+if TYPE_CHECKING:
+    from .wine_tag_relation import WineTagRelation
+
+
+class WineTagQuerySet(SearchQuerySetMixin, models.QuerySet["WineTag"]):
+    search_field = "text"
 
-class WineTagQuerySet(models.QuerySet["WineTag"]):
     def get_by_id(self, id) -> Optional["WineTag"]:
         try:
             return self.get(id=id)
@@ -22,14 +35,102 @@ class WineTagQuerySet(models.QuerySet["WineTag"]):
     def filter_eq_user_id(self, user_id) -> "WineTagQuerySet":
         return self.filter(user_id=user_id)
 
+    def get_or_create_by_texts(self, user_id, texts: Iterable[str]) -> dict[str, "WineTag"]:
+        """
+        Set-based get_or_create: one SELECT, one INSERT for the missing texts and one re-read of them.
+        """
+        texts = list(dict.fromkeys(texts))
+        tags = {tag.text: tag for tag in self.filter(user_id=user_id, text__in=texts)}
+        # Created in the given order, which is the order tags are listed in afterwards.
+        if missing := [text for text in texts if text not in tags]:
+            self.bulk_create([WineTag(user_id=user_id, text=text) for text in missing], ignore_conflicts=True)
+            tags.update({tag.text: tag for tag in self.filter(user_id=user_id, text__in=missing)})
+        return tags
+
     def order_by_text(self) -> "WineTagQuerySet":
         return self.order_by("text")
 
+    def order_by_attached_at(self) -> "WineTagQuerySet":
+        """
+        For Wine.tags: lists tags in the order they were attached to the wine.
+        """
+        return self.order_by("winetagrelation__created_at")
+
+    def search(self, q: str) -> "WineTagQuerySet":
+        """
+        Tags matching q: prefix matches first, then the most used.
+        """
+        return self.filter_search(q).order_by("-search_is_prefix", "-wine_count", "text")
+
+    def add_counts(self, wine_count: int, in_stock_count: int) -> int:
+        """
+        Shifts the counters of every tag in the queryset, for wines being attached, detached, drunk or restocked.
+        """
+        return self.update(
+            wine_count=F("wine_count") + wine_count,
+            in_stock_count=F("in_stock_count") + in_stock_count,
+            updated_at=timezone.now(),
+        )
+
+    def add_counts_of_relations(self, relations: Iterable["WineTagRelation"]):
+        """
+        Shifts the counters by newly created relations, with their wines set, in one UPDATE per distinct
+        (wine_count, in_stock_count) shift instead of one per tag.
+        """
+        counts = defaultdict(lambda: [0, 0])
+        for relation in relations:
+            counts[relation.tag_master_id][0] += 1
+            counts[relation.tag_master_id][1] += 1 if relation.wine.is_in_stock else 0
+
+        tag_ids_by_counts = defaultdict(list)
+        for tag_id, (wine_count, in_stock_count) in counts.items():
+            tag_ids_by_counts[(wine_count, in_stock_count)].append(tag_id)
+        for (wine_count, in_stock_count), tag_ids in tag_ids_by_counts.items():
+            self.filter(id__in=tag_ids).add_counts(wine_count, in_stock_count)
+
+    def annotate_counted(self) -> "WineTagQuerySet":
+        """
+        Annotates counted_wine_count and counted_in_stock_count: the counters as recounted from the relations.
+        """
+        return self.annotate(**self._count_relations())
+
+    def filter_inconsistent_counts(self) -> "WineTagQuerySet":
+        return self.annotate_counted().exclude(
+            wine_count=F("counted_wine_count"), in_stock_count=F("counted_in_stock_count")
+        )
+
+    def rebuild_counts(self) -> int:
+        """
+        Overwrites the counters of every tag in the queryset with counts from the relations, in one UPDATE.
+        """
+        counted = self._count_relations()
+        return self.update(
+            wine_count=counted["counted_wine_count"],
+            in_stock_count=counted["counted_in_stock_count"],
+            updated_at=timezone.now(),
+        )
+
+    def _count_relations(self) -> dict[str, Coalesce]:
+        from . import WineTagRelation
+
+        relations = WineTagRelation.objects.filter(tag_master=OuterRef("pk")).order_by().values("tag_master")
+        in_stock_relations = relations.filter(wine__drunk_at__isnull=True)
+        return {
+            "counted_wine_count": Coalesce(Subquery(relations.annotate(count=Count("id")).values("count")), 0),
+            "counted_in_stock_count": Coalesce(
+                Subquery(in_stock_relations.annotate(count=Count("id")).values("count")), 0
+            ),
+        }
+
 
 class WineTag(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     text = models.CharField(max_length=256)
     user = models.ForeignKey(User, on_delete=models.CASCADE)
+    # Wines the tag is attached to, and those of them not drunk yet. Kept up to date by Wine.set_tags and the wine
+    # update use cases; rebuild_wine_tag_counts checks and repairs them.
+    wine_count = models.IntegerField(default=0)
+    in_stock_count = models.IntegerField(default=0)
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -41,5 +142,15 @@ class WineTag(models.Model):
                 name="unique_text_user",
             ),
         )
+        indexes = (
+            # Covers listing the user's tags with their counts, in text order.
+            models.Index(
+                fields=["user", "text"], include=["wine_count", "in_stock_count"], name="winetag_user_text_counts_idx"
+            ),
+            models.Index(
+                F("user"), OpClass(SearchKey("text"), name="text_pattern_ops"), name="winetag_user_text_pattern_idx"
+            ),
+            GinIndex(OpClass(SearchKey("text"), name="gin_trgm_ops"), name="winetag_text_trgm_idx"),
+        )
 
     objects: WineTagQuerySet = WineTagQuerySet.as_manager()
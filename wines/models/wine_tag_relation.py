@@ -2,12 +2,15 @@ import uuid
 
 from django.db import models
 
+from llwinecellar.common.fields import InsertionOrderedDateTimeField
+
 from .wine import Wine
 from .wine_tag import WineTag
 
 
 class WineTagRelationQuerySet(models.QuerySet["WineTagRelation"]):
-    pass
+    def filter_eq_user_id(self, user_id) -> "WineTagRelationQuerySet":
+        return self.filter(wine__user_id=user_id)
 
 
 class WineTagRelation(models.Model):
@@ -15,7 +18,7 @@ class WineTagRelation(models.Model):
     tag_master = models.ForeignKey(WineTag, on_delete=models.CASCADE)
     wine = models.ForeignKey(Wine, on_delete=models.CASCADE)
 
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = InsertionOrderedDateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     objects: WineTagRelationQuerySet = WineTagRelationQuerySet.as_manager()
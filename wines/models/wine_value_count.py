@@ -0,0 +1,112 @@
+import uuid
+from collections import Counter, defaultdict
+from typing import Iterable, Mapping, Optional
+
+from django.contrib.postgres.indexes import GinIndex
+from django.db import connections, models
+from django.db.models import F
+from django.utils import timezone
+
+from users.models import User
+
+from .search import SearchQuerySetMixin
+
+
+class WineValueCountQuerySet(SearchQuerySetMixin, models.QuerySet):
+    def get_search_key(self):
+        return F("search_key")
+
+    def filter_eq_user_id(self, user_id) -> "WineValueCountQuerySet":
+        return self.filter(user_id=user_id)
+
+    def filter_startswith_label(self, prefix: str) -> "WineValueCountQuerySet":
+        """
+        Case sensitive, so that it is a range scan of the (user, label) index.
+        """
+        return self.filter(label__startswith=prefix)
+
+    def order_by_label(self) -> "WineValueCountQuerySet":
+        return self.order_by("label")
+
+    def search(self, q: str) -> "WineValueCountQuerySet":
+        """
+        Labels matching q: prefix matches first, then the most used.
+        """
+        return self.filter_search(q).order_by("-search_is_prefix", "-wine_count", "label")
+
+    def add_wine_counts(self, user_id, counts: Mapping[Optional[str], int]):
+        """
+        Adds counts, keyed by label, to the user's rows in one upsert, then deletes the rows no wine refers to
+        anymore. Labels are upserted in sorted order, so concurrent calls lock the rows in the same order.
+        None and blank labels are ignored.
+        """
+        counts = {label: counts[label] for label in sorted(label for label in counts if label) if counts[label]}
+        if not counts:
+            return
+
+        table = self.model._meta.db_table
+        now = timezone.now()
+        values = ", ".join(["(%s, %s, %s, lower(immutable_unaccent(%s)), %s, %s, %s)"] * len(counts))
+        params = [
+            param
+            for label, count in counts.items()
+            for param in (uuid.uuid4(), user_id, label, label, count, now, now)
+        ]
+        with connections[self.db].cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {table} (id, user_id, label, search_key, wine_count, created_at, updated_at) "
+                f"VALUES {values} ON CONFLICT (user_id, label) DO UPDATE "
+                f"SET wine_count = {table}.wine_count + EXCLUDED.wine_count, updated_at = EXCLUDED.updated_at",
+                params,
+            )
+
+        if decremented := [label for label, count in counts.items() if count < 0]:
+            self.filter(user_id=user_id, label__in=decremented, wine_count__lte=0).delete()
+
+
+class WineValueCount(models.Model):
+    """
+    One row per distinct value of a wine attribute among the user's wines, with the number of wines using it.
+    Kept up to date by the wine create, update and import paths through count_wine_values, so listing and
+    searching the values does not scan wines.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    # "C" compares bytes, which sorts like Python's str and lets LIKE 'prefix%' use the btree indexes.
+    label = models.CharField(max_length=1024, db_collation="C")
+    # SearchKey(label), stored when the row is inserted so that searches do not unaccent every candidate row.
+    search_key = models.CharField(max_length=1024, db_collation="C", default="", editable=False)
+    wine_count = models.IntegerField(default=0)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        abstract = True
+        indexes = (
+            models.Index(fields=["user", "search_key"], name="%(class)s_search_idx"),
+            GinIndex(fields=["search_key"], opclasses=["gin_trgm_ops"], name="%(class)s_trgm_idx"),
+        )
+
+    objects: WineValueCountQuerySet = WineValueCountQuerySet.as_manager()
+
+
+def count_wine_values(
+    user_id,
+    added: Iterable[Mapping[type[WineValueCount], Optional[str]]] = (),
+    removed: Iterable[Mapping[type[WineValueCount], Optional[str]]] = (),
+):
+    """
+    Applies Wine.counted_values of added and removed wines to every WineValueCount table, one upsert per table.
+    For an update, pass the values before as removed and after as added; unchanged values cancel out.
+    """
+    deltas: dict[type[WineValueCount], Counter] = defaultdict(Counter)
+    for values in added:
+        for model, label in values.items():
+            deltas[model][label] += 1
+    for values in removed:
+        for model, label in values.items():
+            deltas[model][label] -= 1
+    for model, counts in deltas.items():
+        model.objects.add_wine_counts(user_id, counts)
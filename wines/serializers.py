@@ -1,6 +1,14 @@
+import base64
+import binascii
+import json
+import uuid
+
+from django.utils.dateparse import parse_datetime
 from rest_framework import serializers
 
-from .enums import Country
+from cellars.enums import CellarSpaceType
+
+from .enums import CepageMatch, Country, WineFileFormat
 
 
 class CepageSerializer(serializers.Serializer):
@@ -51,9 +59,172 @@ class UpdateWineSerializer(WineSerializer):
     cellar_id = serializers.UUIDField(required=False, allow_null=True)
     position = serializers.CharField(required=False, allow_null=True)
 
+    def validate(self, data):
+        # A position is only meaningful within a cellar; without cellar_id it would be silently ignored.
+        if data.get("position") and "cellar_id" not in data:
+            raise serializers.ValidationError({"position": "cellar_id is required with position."})
+        return data
+
+
+class CreateWinesSerializer(serializers.Serializer):
+    class CreateWineSerializer(UpdateWineSerializer):
+        quantity = serializers.IntegerField(min_value=1, max_value=1000, default=1)
+
+        def validate(self, data):
+            data = super().validate(data)
+            if data["quantity"] > 1 and data.get("cellar_id") and data.get("position") not in (None, "basket"):
+                raise serializers.ValidationError({"quantity": "A rack holds one wine. Put several in a basket."})
+            return data
+
+    wines = CreateWineSerializer(many=True, allow_empty=False, max_length=1000)
+
+    def validate_wines(self, wines):
+        if sum(wine["quantity"] for wine in wines) > 1000:
+            raise serializers.ValidationError("Ensure this field has no more than 1000 wines in total.")
+        return wines
+
+
+class WineListItemSerializer(serializers.BaseSerializer):
+    """
+    Read-only stand-in for WineWithCellarSpaceSerializer in list responses. Renders the same JSON, but reads a Wine
+    with its cellar space selected and its tags and cepages prefetched directly instead of going through one DRF
+    field per attribute. Keep it in sync with WineSerializer: test_wine_list_serializer compares both byte for byte.
+    """
+
+    country_labels = {country.value: country.label for country in Country}
+    keys = (
+        "id",
+        "name",
+        "producer",
+        "country",
+        "region_1",
+        "region_2",
+        "region_3",
+        "region_4",
+        "region_5",
+        "cepages",
+        "vintage",
+        "bought_at",
+        "bought_from",
+        "price",
+        "drunk_at",
+        "note",
+        "tag_texts",
+        "value",
+        "cellar_id",
+        "position",
+    )
+    cepage_keys = ("name", "abbreviation", "percentage")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.to_percentage = CepageSerializer().fields["percentage"].to_representation
+        self.to_empty_rack = WineWithCellarSpaceSerializer().to_representation
+
+    def to_representation(self, instance):
+        if isinstance(instance, dict):
+            return self.to_empty_rack(instance)
+
+        space = getattr(instance, "cellarspace", None)
+        if space is None:
+            position = None
+        elif space.type == CellarSpaceType.BASKET:
+            position = "basket"
+        else:
+            position = f"{space.row}-{space.column}"
+
+        return {
+            "id": str(instance.id),
+            "name": instance.name,
+            "producer": instance.producer,
+            "country": None if instance._country is None else self.country_labels[instance._country],
+            "region_1": instance.region_1,
+            "region_2": instance.region_2,
+            "region_3": instance.region_3,
+            "region_4": instance.region_4,
+            "region_5": instance.region_5,
+            "cepages": [
+                {
+                    "name": cepage.grape.name,
+                    "abbreviation": cepage.grape.abbreviation,
+                    "percentage": None if cepage.percentage is None else self.to_percentage(cepage.percentage),
+                }
+                for cepage in instance.cepages.all()
+            ],
+            "vintage": instance.vintage,
+            "bought_at": None if instance.bought_at is None else instance.bought_at.isoformat(),
+            "bought_from": instance.bought_from,
+            "price": instance.price,
+            "drunk_at": None if instance.drunk_at is None else instance.drunk_at.isoformat(),
+            "note": instance.note,
+            "tag_texts": [tag.text for tag in instance.tags.all()],
+            "value": instance.value,
+            "cellar_id": None if space is None else str(space.cellar_id),
+            "position": position,
+        }
+
+    def from_document(self, document: dict) -> dict:
+        """
+        A WineReadModel document with its keys back in the order to_representation writes them. jsonb does not keep
+        the order of keys, so a document read back would otherwise render different bytes.
+        """
+        document = {key: document[key] for key in self.keys}
+        document["cepages"] = [{key: cepage[key] for key in self.cepage_keys} for cepage in document["cepages"]]
+        return document
+
 
 class WinesSerializer(serializers.Serializer):
-    wines = WineWithCellarSpaceSerializer(many=True, read_only=True)
+    wines = WineListItemSerializer(many=True, read_only=True)
+
+
+class WineCursorField(serializers.Field):
+    """
+    Opaque keyset cursor over (created_at, id) of Wine.
+    """
+
+    default_error_messages = {"invalid": "Invalid cursor."}
+
+    def to_internal_value(self, data):
+        try:
+            created_at, id = json.loads(base64.urlsafe_b64decode(data.encode()))
+        except (binascii.Error, TypeError, ValueError):
+            self.fail("invalid")
+        # A tampered cursor may hold any JSON values, which parse_datetime and UUID do not reject cleanly.
+        if not (isinstance(created_at, str) and isinstance(id, str)):
+            self.fail("invalid")
+        try:
+            created_at = parse_datetime(created_at)
+            id = uuid.UUID(id)
+        except ValueError:
+            self.fail("invalid")
+        if created_at is None:
+            self.fail("invalid")
+        return {"created_at": created_at, "id": id}
+
+    def to_representation(self, value):
+        data = json.dumps([value["created_at"].isoformat(), str(value["id"])])
+        return base64.urlsafe_b64encode(data.encode()).decode()
+
+
+class WinesPageSerializer(WinesSerializer):
+    next = WineCursorField(read_only=True, allow_null=True)
+
+
+class WineDocumentsSerializer(serializers.Serializer):
+    """
+    WineReadModel documents, already rendered by WineListItemSerializer.
+    """
+
+    wines = serializers.ListField(child=serializers.JSONField(), read_only=True)
+
+
+class WineDocumentsPageSerializer(WineDocumentsSerializer):
+    next = WineCursorField(read_only=True, allow_null=True)
+
+
+class ExportWineQuerySerializer(serializers.Serializer):
+    format = serializers.ChoiceField(default=WineFileFormat.CSV.value, choices=WineFileFormat.choices_for_serializer())
+    cellar_id = serializers.UUIDField(required=False)
 
 
 class ListWineQuerySerializer(serializers.Serializer):
@@ -78,10 +249,50 @@ class ListWineQuerySerializer(serializers.Serializer):
     region_4 = serializers.CharField(required=False, max_length=128)
     region_5 = serializers.CharField(required=False, max_length=128)
     cepage_names = CommaSeparatedField(child=serializers.CharField(), required=False)
+    cepage_match = serializers.ChoiceField(required=False, choices=CepageMatch.choices_for_serializer())
 
     drunk_at_gte = serializers.DateField(required=False)
     drunk_at_lte = serializers.DateField(required=False)
 
+    limit = serializers.IntegerField(required=False, min_value=1, max_value=1000)
+    cursor = WineCursorField(required=False)
+    stream = serializers.BooleanField(required=False)
+    grid = serializers.BooleanField(required=False)
+
+    def validate(self, data):
+        if "cursor" in data and "limit" not in data:
+            raise serializers.ValidationError({"cursor": "cursor requires limit."})
+        if data.get("stream") and "limit" in data:
+            raise serializers.ValidationError({"stream": "stream cannot be combined with limit."})
+        if data.get("grid") and "cellar_id" not in data:
+            raise serializers.ValidationError({"grid": "grid requires cellar_id."})
+        if data.get("grid") and "limit" in data:
+            raise serializers.ValidationError({"grid": "grid cannot be combined with limit."})
+        return data
+
+
+class WineFacetsSerializer(serializers.Serializer):
+    class FacetValueSerializer(serializers.Serializer):
+        value = serializers.CharField(allow_null=True)
+        count = serializers.IntegerField()
+
+    class StockSerializer(serializers.Serializer):
+        drunk = serializers.IntegerField()
+        in_stock = serializers.IntegerField()
+
+    class CellarFacetSerializer(serializers.Serializer):
+        id = serializers.UUIDField(allow_null=True)
+        name = serializers.CharField(allow_null=True)
+        count = serializers.IntegerField()
+
+    total = serializers.IntegerField()
+    country = FacetValueSerializer(many=True)
+    region_1 = FacetValueSerializer(many=True)
+    cepage = FacetValueSerializer(many=True)
+    tag = FacetValueSerializer(many=True)
+    stock = StockSerializer()
+    cellar = CellarFacetSerializer(many=True)
+
 
 class MoveWineSerializer(serializers.Serializer):
     id = serializers.UUIDField(read_only=True)
@@ -94,10 +305,35 @@ class MoveWineResponseSerializer(serializers.Serializer):
     wines = MoveWineSerializer(many=True)
 
 
+class MoveWinesSerializer(serializers.Serializer):
+    class MoveSerializer(MoveWineSerializer):
+        id = serializers.UUIDField()
+
+    wines = MoveSerializer(many=True, allow_empty=False, max_length=1000)
+
+
+class AutocompleteQuerySerializer(serializers.Serializer):
+    q = serializers.CharField(max_length=256, required=False)
+    limit = serializers.IntegerField(required=False, min_value=1, max_value=1000)
+
+
 class WineTagsSerializer(serializers.Serializer):
     tag_texts = serializers.ListField(allow_empty=True, child=serializers.CharField(max_length=256))
 
 
+class WineTagCountsSerializer(serializers.Serializer):
+    class WineTagCountSerializer(serializers.Serializer):
+        text = serializers.CharField(max_length=256)
+        wine_count = serializers.IntegerField()
+        in_stock_count = serializers.IntegerField()
+
+    tags = WineTagCountSerializer(many=True)
+
+
+class ListWineTagQuerySerializer(AutocompleteQuerySerializer):
+    with_counts = serializers.BooleanField(required=False, default=False)
+
+
 class DeleteWineTagQuerySerializer(serializers.Serializer):
     tag_text = serializers.CharField(max_length=256)
 
@@ -106,6 +342,14 @@ class WineRegionsSerializer(serializers.Serializer):
     regions = serializers.ListField(allow_empty=True, child=serializers.CharField())
 
 
+class ListWineRegionQuerySerializer(AutocompleteQuerySerializer):
+    prefix = serializers.CharField(max_length=1024, required=False)
+
+
+class WineProducersSerializer(serializers.Serializer):
+    producers = serializers.ListField(allow_empty=True, child=serializers.CharField())
+
+
 class GrapeMasterSerializer(serializers.Serializer):
     id = serializers.UUIDField(read_only=True)
     name = serializers.CharField()
@@ -39,6 +39,33 @@ class TestGrapeMasterViews(TestCase):
         }
         self.assertDictEqual(expected, body)
 
+    def test_list__q(self):
+        # Arrange
+        merlot = GrapeMasterFactory(name="Merlot", abbreviation="Mr", user=self.user)
+        pinot_noir = GrapeMasterFactory(name="Pinot Noir", abbreviation="PN", user=self.user)
+        pinot_gris = GrapeMasterFactory(name="Pinot Gris", abbreviation="PG", user=self.user)
+        _syrah = GrapeMasterFactory(name="Syrah", abbreviation=None, user=self.user)
+        CepageFactory(wine=WineFactory(user=self.user), grape=pinot_noir, percentage=100)
+        CepageFactory(wine=WineFactory(user=self.user), grape=merlot, percentage=100)
+
+        # Act
+        status_code, body = self._make_request(f"{self.base_path}?q=NOIR", self.user)
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, status_code)
+
+        expected = {
+            "grape_masters": [{"id": str(g.id), "name": g.name, "abbreviation": g.abbreviation} for g in [pinot_noir]],
+        }
+        self.assertDictEqual(expected, body)
+
+        # Act
+        status_code, body = self._make_request(f"{self.base_path}?q=pi", self.user)
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, status_code)
+        self.assertEqual([pinot_noir.name, pinot_gris.name], [g["name"] for g in body["grape_masters"]])
+
     def test_create(self):
         # Arrange
         params = {"name": "Cabernet Franc", "abbreviation": "CF"}
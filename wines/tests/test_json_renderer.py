@@ -0,0 +1,65 @@
+import datetime
+import logging
+import uuid
+from decimal import Decimal
+from unittest import mock
+
+from django.test import SimpleTestCase
+from rest_framework.renderers import JSONRenderer
+
+from llwinecellar.renderers import FastJSONRenderer
+
+from ..enums import CepageMatch, Country
+
+logger = logging.getLogger(__name__)
+
+JST = datetime.timezone(datetime.timedelta(hours=9))
+
+
+class TestFastJSONRenderer(SimpleTestCase):
+    payload = {
+        "wines": [
+            {
+                "id": uuid.UUID("6f1c1d4e-58a4-4d59-9f0e-2d4a8c1f3b7e"),
+                "name": "Château « Côte » 旨い\u2028\u2029",
+                "country": Country.FRANCE,
+                "cepage_match": CepageMatch.ANY,
+                "cepages": [{"name": "Pinot Noir", "percentage": Decimal("66.7")}, {"percentage": None}],
+                "bought_at": datetime.date(2024, 2, 29),
+                "created_at": datetime.datetime(2024, 2, 29, 12, 30, 5, 123456, tzinfo=datetime.timezone.utc),
+                "updated_at": datetime.datetime(2024, 2, 29, 21, 30, tzinfo=JST),
+                "price": 4_200,
+                "value": 0.5,
+                "is_drunk": False,
+                "tag_texts": ("daily",),
+            }
+        ],
+        "counts": {1: 2},
+        "next": None,
+    }
+
+    def test_same_bytes_as_json_renderer(self):
+        expected = JSONRenderer().render(self.payload)
+
+        rendered = FastJSONRenderer().render(self.payload)
+
+        self.assertEqual(expected.decode(), rendered.decode())
+
+    def test_same_bytes_as_json_renderer__indent(self):
+        media_type = "application/json; indent=4"
+        expected = JSONRenderer().render(self.payload, media_type)
+
+        rendered = FastJSONRenderer().render(self.payload, media_type)
+
+        self.assertEqual(expected.decode(), rendered.decode())
+
+    def test_same_bytes_as_json_renderer__without_orjson(self):
+        expected = JSONRenderer().render(self.payload)
+
+        with mock.patch("llwinecellar.renderers.orjson", None):
+            rendered = FastJSONRenderer().render(self.payload)
+
+        self.assertEqual(expected.decode(), rendered.decode())
+
+    def test_none(self):
+        self.assertEqual(b"", FastJSONRenderer().render(None))
@@ -0,0 +1,152 @@
+from cellars.enums import CellarSpaceType
+from cellars.models import Cellar, CellarSpace
+from llwinecellar.common.test_utils import QueryBudgetTestCase
+
+from ..enums import Country
+from ..models import GrapeMaster, Wine
+from ..use_cases import ExportWines, ListWine
+
+
+class TestWineQueryBudget(QueryBudgetTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.wine_params = {
+            "name": "Morgon Côte du Py",
+            "producer": "Jean Foillard",
+            "country": Country.FRANCE.label,
+            "region_1": "Beaujolais",
+            "region_2": "Morgon",
+            "region_3": "",
+            "region_4": "",
+            "region_5": "",
+            "cepages": [{"name": "Gamay", "abbreviation": "Ga", "percentage": "100.0"}],
+            "vintage": 2020,
+            "bought_at": "2023-05-07",
+            "bought_from": "Wine shop",
+            "price": 5200,
+            "drunk_at": None,
+            "note": "",
+            "tag_texts": ["daily", "new_tag"],
+            "value": None,
+        }
+
+    def test_list(self):
+        self.assert_query_budget("GET /api/wines/")
+
+    def test_list__page(self):
+        self.assert_query_budget("GET /api/wines/?limit=50")
+
+    def test_list__stream(self):
+        self.assert_query_budget("GET /api/wines/?stream=true", batch_size=ListWine.stream_chunk_size)
+
+    def test_list__filtered(self):
+        self.assert_query_budget(
+            "GET /api/wines/?cellar_id={id}&name_or_producer=gevrey",
+            path=lambda user: f"/api/wines/?cellar_id={self._cellar(user).id}&name_or_producer=gevrey",
+        )
+
+    def test_facets(self):
+        self.assert_query_budget("GET /api/wines/facets/")
+
+    def test_export(self):
+        self.assert_query_budget("GET /api/wines/export/?format=jsonl", batch_size=ExportWines.chunk_size)
+
+    def test_create(self):
+        self.assert_query_budget(
+            "POST /api/wines/",
+            params=lambda user: {**self.wine_params, "cellar_id": self._cellar(user).id, "position": "basket"},
+        )
+
+    def test_create_many(self):
+        self.assert_query_budget(
+            "POST /api/wines/bulk/",
+            params=lambda user: {
+                "wines": [
+                    {**self.wine_params, "cellar_id": self._cellar(user).id, "position": "basket", "quantity": 6},
+                    {**self.wine_params, "quantity": 6},
+                ]
+            },
+        )
+
+    def test_update(self):
+        self.assert_query_budget(
+            "PUT /api/wines/{id}/",
+            path=lambda user: f"/api/wines/{self._wine_in_rack(user).id}/",
+            params=lambda user: {**self.wine_params, "cellar_id": self._cellar(user).id, "position": "basket"},
+        )
+
+    def test_partial_update(self):
+        self.assert_query_budget(
+            "PATCH /api/wines/{id}/",
+            path=lambda user: f"/api/wines/{self._wine_in_rack(user).id}/",
+            params={"drunk_at": "2024-12-31", "tag_texts": ["gift"], "cellar_id": None},
+        )
+
+    def test_move(self):
+        self.assert_query_budget(
+            "PUT /api/wines/{id}/space/",
+            path=lambda user: f"/api/wines/{self._wine_in_rack(user).id}/space/",
+            params=lambda user: self._move_to_empty_rack(user),
+        )
+
+    def test_move_many(self):
+        self.assert_query_budget(
+            "PUT /api/wines/spaces/",
+            params=lambda user: {
+                "wines": [
+                    {"id": self._wine_in_rack(user).id, **self._move_to_empty_rack(user)},
+                    {"id": self._wine_out_of_cellars(user).id, "cellar_id": None, "row": None, "column": None},
+                ]
+            },
+        )
+
+    def test_list_tags(self):
+        self.assert_query_budget("GET /api/wine_tags/?with_counts=true")
+
+    def test_delete_tag(self):
+        self.assert_query_budget("DELETE /api/wine_tags/delete/", params={"tag_text": "daily"})
+
+    def test_list_regions(self):
+        self.assert_query_budget("GET /api/wine_regions/")
+
+    def test_list_producers(self):
+        self.assert_query_budget("GET /api/wine_producers/")
+
+    def test_list_grape_masters(self):
+        self.assert_query_budget("GET /api/grape_masters/")
+
+    def test_create_grape_master(self):
+        self.assert_query_budget("POST /api/grape_masters/", params={"name": "Syrah", "abbreviation": "Sy"})
+
+    def test_delete_grape_master(self):
+        self.assert_query_budget(
+            "DELETE /api/grape_masters/{id}/?force_delete=true",
+            path=lambda user: f"/api/grape_masters/{self._grape(user).id}/?force_delete=true",
+        )
+
+    """
+    Utility functions
+    """
+
+    def _cellar(self, user) -> Cellar:
+        return Cellar.objects.filter_eq_user_id(user.id).get()
+
+    def _wine_in_rack(self, user) -> Wine:
+        return Wine.objects.filter_eq_user_id(user.id).filter(cellarspace__type=CellarSpaceType.RACK).first()
+
+    def _wine_out_of_cellars(self, user) -> Wine:
+        return Wine.objects.filter_eq_user_id(user.id).filter_eq_cellarspace__isnull().first()
+
+    def _move_to_empty_rack(self, user) -> dict:
+        rack = (
+            CellarSpace.objects.filter_eq_user_id(user.id)
+            .filter_by_type(CellarSpaceType.RACK)
+            .filter_empty()
+            .order_by_position()
+            .first()
+        )
+        return {"cellar_id": rack.cellar_id, "row": rack.row, "column": rack.column}
+
+    def _grape(self, user) -> GrapeMaster:
+        return GrapeMaster.objects.filter_eq_user_id(user.id).get(name="Gamay")
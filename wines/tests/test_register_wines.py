@@ -0,0 +1,116 @@
+import tempfile
+from datetime import date
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from cellars.models import CellarSpace
+from llwinecellar.common.test_utils import CellarFactory, UserFactory, WineInRackFactory, WineTagFactory
+from wines.enums import Country
+from wines.models import Wine, WineProducer, WineRegion, WineTag
+
+
+class TestRegisterWines(TestCase):
+    maxDiff = None
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory()
+        cls.other_user = UserFactory()
+        cls.cellar = CellarFactory(user=cls.user, layout=[2, 2])
+        cls.daily = WineTagFactory(user=cls.user, text="daily")
+
+    def test_register(self):
+        # Arrange
+        file_name = self._write_file(
+            "⭐︎,Morgon,Foillard,France,Bourgogne,Beaujolais,,,,2019,2024/02/29,Shop,4200,,Line one\n",
+            "line two,daily,1-2\n",
+            "⭐︎,Barolo,Rinaldi,Italy,Piemonte,,,,,,,,,2024/12/31,,daily,\n",
+            "⭐︎,Sancerre,,France,Loire,,,,,2022,,,,,,summer,2-1\n",
+        )
+        stdout = StringIO()
+
+        # Act
+        call_command(
+            "register_wines",
+            file_name=file_name,
+            user_id=self.user.id,
+            cellar_id=str(self.cellar.id),
+            batch_size=2,
+            stdout=stdout,
+        )
+
+        # Assert
+        wines = {wine.name: wine for wine in Wine.objects.filter_eq_user_id(self.user.id).prefetch_tags()}
+        self.assertEqual({"Morgon", "Barolo", "Sancerre"}, wines.keys())
+        morgon = wines["Morgon"]
+        self.assertEqual(
+            (Country.FRANCE, "Beaujolais", 2019, date(2024, 2, 29), 4200, "Line one\nline two"),
+            (morgon.country, morgon.region_2, morgon.vintage, morgon.bought_at, morgon.price, morgon.note),
+        )
+        self.assertEqual(["daily"], morgon.tag_texts)
+        self.assertEqual((None, date(2024, 12, 31)), (wines["Barolo"].vintage, wines["Barolo"].drunk_at))
+        self.assertEqual(["summer"], wines["Sancerre"].tag_texts)
+
+        positions = CellarSpace.objects.filter(cellar=self.cellar, wine__isnull=False).values_list(
+            "wine__name", "row", "column"
+        )
+        self.assertCountEqual([("Morgon", 1, 2), ("Sancerre", 2, 1)], positions)
+
+        self.daily.refresh_from_db()
+        self.assertEqual((2, 1), (self.daily.wine_count, self.daily.in_stock_count))
+        self.assertFalse(WineTag.objects.filter_inconsistent_counts().exists())
+        self.assertEqual(
+            {"France>Bourgogne>Beaujolais": 1, "Italy>Piemonte": 1, "France>Loire": 1},
+            dict(WineRegion.objects.filter(user=self.user).values_list("label", "wine_count")),
+        )
+        self.assertEqual(
+            {"Foillard": 1, "Rinaldi": 1},
+            dict(WineProducer.objects.filter(user=self.user).values_list("label", "wine_count")),
+        )
+        self.assertIn("3 wines registered in", stdout.getvalue())
+
+    def test_register__occupied_rack(self):
+        # Arrange
+        WineInRackFactory(row=1, column=1, cellar=self.cellar, user=self.user)
+        file_name = self._write_file(
+            "⭐︎,Morgon,,France,,,,,,,,,,,,,2-2\n",
+            "⭐︎,Barolo,,Italy,,,,,,,,,,,,,1-1\n",
+        )
+
+        # Act & Assert
+        with self.assertRaisesMessage(CommandError, "Record 2: rack 1-1 is not empty or missing."):
+            call_command("register_wines", file_name=file_name, user_id=self.user.id, cellar_id=str(self.cellar.id))
+        self.assertFalse(Wine.objects.filter(name__in=["Morgon", "Barolo"]).exists())
+
+    def test_register__malformed_record(self):
+        # Arrange
+        file_name = self._write_file("⭐︎,Morgon,,Atlantis,,,,,,,,,,,,,\n")
+
+        # Act & Assert
+        with self.assertRaisesMessage(CommandError, "Record 1 is malformed"):
+            call_command("register_wines", file_name=file_name, user_id=self.user.id)
+
+    def test_register__cellar_of_other_user(self):
+        # Arrange
+        file_name = self._write_file("⭐︎,Morgon,,France,,,,,,,,,,,,,\n")
+
+        # Act & Assert
+        with self.assertRaisesMessage(CommandError, "does not exist"):
+            call_command(
+                "register_wines", file_name=file_name, user_id=self.other_user.id, cellar_id=str(self.cellar.id)
+            )
+
+    """
+    Utility functions
+    """
+
+    def _write_file(self, *lines: str) -> str:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = Path(directory.name) / "wines.csv"
+        path.write_text("".join(lines), encoding="utf_8")
+        return str(path)
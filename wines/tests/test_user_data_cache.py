@@ -0,0 +1,113 @@
+import logging
+
+from django.core.cache import caches
+from django.test import Client, TestCase, override_settings
+from rest_framework import status
+
+from llwinecellar.common.test_utils import CellarFactory, UserFactory, WineFactory, WineTagFactory
+from llwinecellar.common.user_data_cache import UserDataCache, user_data_cache
+
+logger = logging.getLogger(__name__)
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class TestUserDataCache(TestCase):
+    maxDiff = None
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory()
+
+    def setUp(self):
+        caches["default"].clear()
+
+    def test_second_list_is_served_from_cache(self):
+        # Arrange
+        WineTagFactory(text="tag_a", user=self.user)
+
+        before = user_data_cache.stats()
+
+        # Act
+        _status_code, first = self._make_get_request("/api/wine_tags/", self.user)
+        WineTagFactory(text="tag_b", user=self.user)  # Factories bypass the use cases, so this stays invisible.
+        status_code, second = self._make_get_request("/api/wine_tags/", self.user)
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, status_code)
+        self.assertEqual({"tag_texts": ["tag_a"]}, first)
+        self.assertEqual(first, second)
+        after = user_data_cache.stats()
+        self.assertEqual({"hits": 1, "misses": 1}, {key: after[key] - before[key] for key in ("hits", "misses")})
+
+    def test_stats_are_logged_every_interval(self):
+        # Arrange
+        cache = UserDataCache()
+        cache.STATS_LOG_INTERVAL = 2
+
+        # Act
+        with self.assertLogs("llwinecellar.common.user_data_cache", level="INFO") as logs:
+            for _ in range(4):
+                cache.get_or_set(self.user.id, "test", None, lambda: "value")
+
+        # Assert
+        self.assertEqual({"hits": 3, "misses": 1}, cache.stats())
+        self.assertEqual([(1, 1), (3, 1)], [(record.hits, record.misses) for record in logs.records])
+
+    def test_write_use_case_invalidates(self):
+        # Arrange
+        wine = WineFactory(user=self.user)
+        cellar = CellarFactory(user=self.user)
+        _status_code, before = self._make_get_request("/api/wines/", self.user)
+
+        # Act
+        client = Client()
+        client.force_login(self.user)
+        client.put(
+            f"/api/wines/{wine.id}/space/",
+            {"cellar_id": str(cellar.id), "row": 1, "column": 1},
+            content_type="application/json",
+        )
+        _status_code, after = self._make_get_request("/api/wines/", self.user)
+
+        # Assert
+        self.assertIsNone(before["wines"][0]["position"])
+        self.assertEqual("1-1", after["wines"][0]["position"])
+
+    def test_cache_is_per_user(self):
+        # Arrange
+        another_user = UserFactory()
+        WineTagFactory(text="mine", user=self.user)
+        WineTagFactory(text="theirs", user=another_user)
+
+        # Act
+        _status_code, mine = self._make_get_request("/api/wine_tags/", self.user)
+        _status_code, theirs = self._make_get_request("/api/wine_tags/", another_user)
+
+        # Assert
+        self.assertEqual({"tag_texts": ["mine"]}, mine)
+        self.assertEqual({"tag_texts": ["theirs"]}, theirs)
+
+    def test_queries_are_part_of_the_key(self):
+        # Arrange
+        _wine = WineFactory(user=self.user, name="target wine")
+        _another_wine = WineFactory(user=self.user)
+
+        # Act
+        _status_code, all_wines = self._make_get_request("/api/wines/", self.user)
+        _status_code, filtered = self._make_get_request("/api/wines/?name=target wine", self.user)
+
+        # Assert
+        self.assertEqual(2, len(all_wines["wines"]))
+        self.assertEqual(1, len(filtered["wines"]))
+
+    """
+    Utility functions
+    """
+
+    def _make_get_request(self, path, user):
+        client = Client()
+        client.force_login(user)
+
+        response = client.get(path)
+
+        return (response.status_code, response.json())
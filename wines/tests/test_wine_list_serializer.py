@@ -0,0 +1,81 @@
+import logging
+from datetime import date
+
+from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
+
+from llwinecellar.common.test_utils import (
+    CellarFactory,
+    CepageFactory,
+    DrunkWineFactory,
+    GrapeMasterFactory,
+    UserFactory,
+    WineFactory,
+    WineInBasketFactory,
+    WineInRackFactory,
+    WineTagFactory,
+)
+
+from ..enums import Country
+from ..serializers import WineListItemSerializer, WineWithCellarSpaceSerializer
+from ..use_cases import ListWine
+
+logger = logging.getLogger(__name__)
+
+
+class TestWineListItemSerializer(TestCase):
+    """
+    Golden test: the fast list serializer must render the same bytes as WineWithCellarSpaceSerializer.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory()
+        cls.cellar = CellarFactory(user=cls.user, layout=[2, 2], has_basket=True)
+
+        pinot_noir = GrapeMasterFactory(user=cls.user, name="Pinot Noir", abbreviation="PN")
+        gamay = GrapeMasterFactory(user=cls.user, name="Gamay", abbreviation=None)
+        in_rack = WineInRackFactory(
+            row=2,
+            column=1,
+            cellar=cls.cellar,
+            user=cls.user,
+            name="Côte de Brouilly « Vieilles Vignes »",
+            country=Country.NEW_ZEALAND,
+            region_2="Brouilly",
+            vintage=2019,
+            bought_at=date(2024, 2, 29),
+            price=4_200,
+            value=95,
+            note='Line one\nline "two"',
+        )
+        CepageFactory(wine=in_rack, grape=pinot_noir, percentage=66.7)
+        CepageFactory(wine=in_rack, grape=gamay, percentage=None)
+        in_rack.set_tags([WineTagFactory(user=cls.user, text="旨い"), WineTagFactory(user=cls.user, text="daily")])
+        in_basket = WineInBasketFactory(cellar=cls.cellar, user=cls.user)
+        CepageFactory(wine=in_basket, grape=pinot_noir, percentage=100)
+        DrunkWineFactory(user=cls.user, country=None, region_1="", drunk_at=date(2024, 12, 31))
+        WineFactory(user=cls.user)
+
+    def test_list(self):
+        self._assert_same_bytes(ListWine().execute(user=self.user, queries={}))
+
+    def test_cellar_with_empty_racks(self):
+        self._assert_same_bytes(ListWine().execute(user=self.user, queries={"cellar_id": self.cellar.id}))
+
+    def test_cellar_grid(self):
+        self._assert_same_bytes(ListWine().execute(user=self.user, queries={"cellar_id": self.cellar.id, "grid": True}))
+
+    """
+    Utility functions
+    """
+
+    def _assert_same_bytes(self, wines):
+        wines = list(wines)
+        renderer = JSONRenderer()
+
+        expected = renderer.render({"wines": WineWithCellarSpaceSerializer(wines, many=True).data})
+        rendered = renderer.render({"wines": WineListItemSerializer(wines, many=True).data})
+
+        self.assertGreater(len(wines), 0)
+        self.assertEqual(expected.decode(), rendered.decode())
@@ -1,7 +1,19 @@
+from decimal import Decimal
+from unittest import mock
+
 from django.test import TestCase
+from django.utils import timezone
 
-from llwinecellar.common.test_utils import CellarFactory, DrunkWineFactory, UserFactory, WineFactory, WineInRackFactory
-from wines.models import Wine
+from llwinecellar.common.test_utils import (
+    CellarFactory,
+    DrunkWineFactory,
+    GrapeMasterFactory,
+    UserFactory,
+    WineFactory,
+    WineInRackFactory,
+    WineTagFactory,
+)
+from wines.models import Cepage, Wine, WineTag, WineTagRelation
 
 
 class TestWineModel(TestCase):
@@ -58,6 +70,33 @@ class TestWineModel(TestCase):
 
         self._assert_filtered_wines(expected, wines_not_in_cellar)
 
+    def test_set_cepages_and_set_tags__stamped_in_insertion_order(self):
+        wine = WineFactory(user=self.user)
+        grapes = [GrapeMasterFactory(user=self.user, name=name) for name in ("Syrah", "Grenache", "Cinsault")]
+        tags = [WineTagFactory(user=self.user, text=text) for text in ("rhone", "daily", "gift")]
+
+        # Rows inserted by one bulk_create within the same microsecond still get distinct, increasing created_at.
+        with mock.patch.object(timezone, "now", return_value=timezone.now()):
+            wine.set_cepages({grape: Decimal("10.0") for grape in grapes})
+            wine.set_tags(tags)
+
+        cepages = Cepage.objects.filter(wine=wine).order_by("created_at")
+        self.assertEqual([grape.id for grape in grapes], [cepage.grape_id for cepage in cepages])
+        self.assertEqual(len(grapes), len({cepage.created_at for cepage in cepages}))
+        relations = WineTagRelation.objects.filter(wine=wine).order_by("created_at")
+        self.assertEqual([tag.id for tag in tags], [relation.tag_master_id for relation in relations])
+        self.assertEqual(len(tags), len({relation.created_at for relation in relations}))
+
+    def test_tag_texts__in_attached_order(self):
+        wine = WineFactory(user=self.user)
+        gift, daily = WineTagFactory(user=self.user, text="gift"), WineTagFactory(user=self.user, text="daily")
+        # Updating a tag row, as the tag counters do, moves it behind the others in the table.
+        WineTag.objects.filter(id=gift.id).add_counts(1, 1)
+
+        wine.set_tags([gift, daily])
+
+        self.assertEqual(["gift", "daily"], Wine.objects.get(id=wine.id).tag_texts)
+
     """
     Utility Functions
     """
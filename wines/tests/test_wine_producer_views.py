@@ -0,0 +1,91 @@
+import logging
+
+from django.test import Client, TestCase
+from rest_framework import status
+
+from llwinecellar.common.test_utils import UserFactory, WineFactory
+
+from ..models import WineProducer
+from ..use_cases import PartialUpdateWine
+
+logger = logging.getLogger(__name__)
+
+
+class TestWineProducerViews(TestCase):
+    maxDiff = None
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.base_path = "/api/wine_producers/"
+        cls.user = UserFactory()
+
+    def test_list(self):
+        # Arrange
+        WineFactory(user=self.user, producer="Domaine Leflaive")
+        WineFactory.create_batch(2, user=self.user, producer="Château Margaux")
+        WineFactory(user=self.user, producer="")
+        _wine_different_user = WineFactory(producer="Other producer")
+
+        # Act
+        status_code, body = self._make_request(self.base_path, self.user)
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, status_code)
+        self.assertEqual({"producers": ["Château Margaux", "Domaine Leflaive"]}, body)
+
+    def test_list__q(self):
+        """
+        Prefix matches come first, then the producers with the most wines.
+        """
+        # Arrange
+        WineFactory(user=self.user, producer="Domaine de la Romanée-Conti")
+        WineFactory.create_batch(3, user=self.user, producer="Château Clos de Sarpe")
+        WineFactory.create_batch(2, user=self.user, producer="Domaine du Clos des Lambrays")
+        WineFactory(user=self.user, producer="Clos Rougeard")
+        WineFactory(user=self.user, producer="Domaine Leflaive")
+
+        # Act
+        status_code, body = self._make_request(f"{self.base_path}?q=CLOS&limit=3", self.user)
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, status_code)
+        self.assertEqual(
+            {"producers": ["Clos Rougeard", "Château Clos de Sarpe", "Domaine du Clos des Lambrays"]},
+            body,
+        )
+
+    def test_list__follows_wine_updates(self):
+        # Arrange
+        wine = WineFactory(user=self.user, producer="Domaine Leflaive")
+        WineFactory(user=self.user, producer="Clos Rougeard")
+
+        # Act
+        PartialUpdateWine().execute(user=self.user, wine_id=wine.id, data={"producer": "Clos Rougeard"})
+        status_code, body = self._make_request(self.base_path, self.user)
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, status_code)
+        self.assertEqual({"producers": ["Clos Rougeard"]}, body)
+
+        producer = WineProducer.objects.filter_eq_user_id(self.user.id).get()
+        self.assertEqual(2, producer.wine_count)
+
+    def test_list__invalid_limit__400(self):
+        # Act
+        status_code, body = self._make_request(f"{self.base_path}?q=clos&limit=0", self.user)
+
+        # Assert
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, status_code)
+        self.assertIn("limit", body)
+
+    """
+    Utility functions
+    """
+
+    def _make_request(self, path, user):
+        client = Client()
+        client.force_login(user)
+
+        response = client.get(path)
+
+        return (response.status_code, response.json())
@@ -7,6 +7,8 @@ from rest_framework import status
 from llwinecellar.common.test_utils import UserFactory, WineFactory
 
 from ..enums import Country
+from ..models import WineRegion
+from ..use_cases import PartialUpdateWine
 
 if TYPE_CHECKING:
     from ..models import Wine
@@ -118,6 +120,73 @@ class TestWineRegionViews(TestCase):
         }
         self.assertEqual(expected, body)
 
+    def test_list__prefix(self):
+        # Arrange
+        WineFactory(user=self.user, country=Country.FRANCE, region_1="Bourgogne", region_2="Côte de Beaune")
+        WineFactory(user=self.user, country=Country.FRANCE, region_1="Bourgogne", region_2="Côte de Nuits")
+        WineFactory(user=self.user, country=Country.FRANCE, region_1="Bordeaux", region_2="Pauillac")
+        WineFactory(user=self.user, country=Country.ITALY, region_1="Piemonte", region_2="Barolo")
+
+        # Act
+        status_code, body = self._make_request(f"{self.base_path}?prefix=France>Bourgogne", self.user)
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, status_code)
+        self.assertEqual(
+            {
+                "regions": [
+                    "France>Bourgogne>Côte de Beaune>Gevrey Chambertin",
+                    "France>Bourgogne>Côte de Nuits>Gevrey Chambertin",
+                ]
+            },
+            body,
+        )
+
+    def test_list__q(self):
+        # Arrange
+        WineFactory(user=self.user, country=Country.FRANCE, region_1="Bourgogne", region_2="", region_3="")
+        WineFactory.create_batch(
+            2, user=self.user, country=Country.FRANCE, region_1="Rhône", region_2="Côte Rôtie", region_3=""
+        )
+        WineFactory(user=self.user, country=Country.FRANCE, region_1="Rhône", region_2="Hermitage", region_3="")
+        WineFactory(user=self.user, country=Country.AUSTRALIA, region_1="Rhone Valley", region_2="", region_3="")
+
+        # Act
+        status_code, body = self._make_request(f"{self.base_path}?q=rhone&limit=2", self.user)
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, status_code)
+        self.assertEqual({"regions": ["France>Rhône>Côte Rôtie", "Australia>Rhone Valley"]}, body)
+
+    def test_list__follows_wine_updates(self):
+        # Arrange
+        wine = WineFactory(user=self.user, country=Country.FRANCE, region_1="Bordeaux", region_2="", region_3="")
+        WineFactory(user=self.user, country=Country.FRANCE, region_1="Alsace", region_2="", region_3="")
+
+        # Act
+        PartialUpdateWine().execute(user=self.user, wine_id=wine.id, data={"region_1": "Alsace"})
+        status_code, body = self._make_request(self.base_path, self.user)
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, status_code)
+        self.assertEqual({"regions": ["France>Alsace"]}, body)
+
+        region = WineRegion.objects.filter_eq_user_id(self.user.id).get()
+        self.assertEqual(2, region.wine_count)
+
+    def test_list__country_removed(self):
+        # Arrange
+        wine = WineFactory(user=self.user, country=Country.FRANCE, region_1="Bordeaux", region_2="", region_3="")
+
+        # Act
+        PartialUpdateWine().execute(user=self.user, wine_id=wine.id, data={"country": None})
+        status_code, body = self._make_request(self.base_path, self.user)
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, status_code)
+        self.assertEqual({"regions": []}, body)
+        self.assertFalse(WineRegion.objects.filter_eq_user_id(self.user.id).exists())
+
     """
     Utility functions
     """
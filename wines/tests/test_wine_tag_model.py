@@ -1,6 +1,12 @@
+from datetime import date
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
 from django.test import TestCase
 
-from llwinecellar.common.test_utils import UserFactory, WineTagFactory
+from llwinecellar.common.test_utils import UserFactory, WineFactory, WineTagFactory
+from llwinecellar.common.user_data_cache import user_data_cache
 from wines.models import WineTag
 
 
@@ -45,3 +51,43 @@ class TestWineModel(TestCase):
         result = list(WineTag.objects.order_by_text().all())
 
         self.assertEqual(expected, result)
+
+    def test_counts_follow_set_tags_and_drinking(self):
+        # Arrange
+        tag, other_tag = WineTagFactory.create_batch(2, user=self.user)
+        wine, other_wine = WineFactory.create_batch(2, user=self.user)
+
+        # Act
+        wine.set_tags([tag, other_tag])
+        other_wine.set_tags([tag])
+        wine.drunk_at = date(2024, 1, 1)
+        wine.save()
+        wine.count_in_stock_change(was_in_stock=True)
+        other_wine.set_tags([other_tag])
+
+        # Assert
+        tag.refresh_from_db()
+        self.assertEqual((1, 0), (tag.wine_count, tag.in_stock_count))
+        other_tag.refresh_from_db()
+        self.assertEqual((2, 1), (other_tag.wine_count, other_tag.in_stock_count))
+        self.assertFalse(WineTag.objects.filter_inconsistent_counts().exists())
+
+    def test_rebuild_wine_tag_counts(self):
+        # Arrange
+        tag, consistent_tag = WineTagFactory.create_batch(2, user=self.user)
+        wine = WineFactory(user=self.user)
+        wine.tags.add(tag)
+        stdout = StringIO()
+
+        # Act
+        with mock.patch.object(user_data_cache, "invalidate") as invalidate:
+            call_command("rebuild_wine_tag_counts", stdout=stdout)
+
+        # Assert
+        tag.refresh_from_db()
+        self.assertEqual((1, 1), (tag.wine_count, tag.in_stock_count))
+        consistent_tag.refresh_from_db()
+        self.assertEqual((0, 0), (consistent_tag.wine_count, consistent_tag.in_stock_count))
+        self.assertIn("1 inconsistent tags rebuilt.", stdout.getvalue())
+        invalidate.assert_called_once_with(self.user.id)
+        self.assertFalse(WineTag.objects.filter_inconsistent_counts().exists())
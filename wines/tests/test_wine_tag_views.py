@@ -3,7 +3,7 @@ import logging
 from django.test import Client, TestCase
 from rest_framework import status
 
-from llwinecellar.common.test_utils import UserFactory, WineTagFactory
+from llwinecellar.common.test_utils import DrunkWineFactory, UserFactory, WineFactory, WineTagFactory
 
 from ..models import WineTag
 
@@ -34,6 +34,90 @@ class TestWineTagViews(TestCase):
         }
         self.assertEqual(expected, body)
 
+    def test_list__not_modified(self):
+        # Arrange
+        _tags = WineTagFactory.create_batch(3, user=self.user)
+        client = self._get_client(self.user)
+        etag = client.get(self.base_path)["ETag"]
+
+        # Act
+        response = client.get(self.base_path, HTTP_IF_NONE_MATCH=etag)
+
+        # Assert
+        self.assertEqual(status.HTTP_304_NOT_MODIFIED, response.status_code)
+        self.assertEqual(b"", response.content)
+
+    def test_list__modified(self):
+        # Arrange
+        _tags = WineTagFactory.create_batch(3, user=self.user)
+        client = self._get_client(self.user)
+        etag = client.get(self.base_path)["ETag"]
+        new_tag = WineTagFactory(user=self.user)
+
+        # Act
+        response = client.get(self.base_path, HTTP_IF_NONE_MATCH=etag)
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertNotEqual(etag, response["ETag"])
+        self.assertIn(new_tag.text, response.json()["tag_texts"])
+
+    def test_list__q(self):
+        """
+        Accent and case insensitive. Prefix matches come first, then the tags attached to the most wines.
+        """
+        # Arrange
+        rare = WineTagFactory(user=self.user, text="rosé rare")
+        popular = WineTagFactory(user=self.user, text="Très rosé")
+        prefix = WineTagFactory(user=self.user, text="Rosé unused")
+        _not_matching = WineTagFactory(user=self.user, text="Rouge")
+        _different_user_tag = WineTagFactory(text="Rosé")
+        for wine in WineFactory.create_batch(2, user=self.user):
+            wine.set_tags([popular])
+        WineFactory(user=self.user).set_tags([rare])
+
+        # Act
+        status_code, body = self._make_request(f"{self.base_path}?q=ROSE", self.user)
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, status_code)
+        self.assertEqual({"tag_texts": [rare.text, prefix.text, popular.text]}, body)
+
+    def test_list__short_q__prefix_only_with_limit(self):
+        # Arrange
+        WineTagFactory(user=self.user, text="Rouge")
+        WineTagFactory(user=self.user, text="Rosé")
+        WineTagFactory(user=self.user, text="Rose Wine")
+        WineTagFactory(user=self.user, text="Pro")
+
+        # Act
+        status_code, body = self._make_request(f"{self.base_path}?q=ro&limit=2", self.user)
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, status_code)
+        self.assertEqual({"tag_texts": ["Rose Wine", "Rosé"]}, body)
+
+    def test_list__with_counts(self):
+        # Arrange
+        tag = WineTagFactory(user=self.user, text="birthday")
+        unused_tag = WineTagFactory(user=self.user, text="drink_soon")
+        WineFactory(user=self.user).set_tags([tag])
+        DrunkWineFactory(user=self.user).set_tags([tag])
+
+        # Act
+        status_code, body = self._make_request(f"{self.base_path}?with_counts=1", self.user)
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, status_code)
+
+        expected = {
+            "tags": [
+                {"text": tag.text, "wine_count": 2, "in_stock_count": 1},
+                {"text": unused_tag.text, "wine_count": 0, "in_stock_count": 0},
+            ]
+        }
+        self.assertEqual(expected, body)
+
     def test_delete(self):
         # Arrange
         tags = WineTagFactory.create_batch(10, user=self.user)
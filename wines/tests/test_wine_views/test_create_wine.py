@@ -1,13 +1,24 @@
 import logging
 from decimal import Decimal
 
+from django.db import connection
 from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 
-from llwinecellar.common.test_utils import CellarFactory, UserFactory, WineInRackFactory
+from llwinecellar.common.test_utils import (
+    CellarFactory,
+    GrapeMasterFactory,
+    QueryRecorder,
+    UserFactory,
+    WineInRackFactory,
+    WineTagFactory,
+)
 
 from ...enums import Country
-from ...models import Wine
+from ...models import GrapeMaster, Wine, WineTag
+from ...serializers import UpdateWineSerializer
+from ...use_cases import CreateWine
 
 logger = logging.getLogger(__name__)
 
@@ -83,6 +94,64 @@ class TestCreateWine(TestCase):
         self.assertEqual(params["tag_texts"], wine.tag_texts)
         self.assertEqual(params["value"], wine.value)
 
+    def test_create__reuses_existing_grapes_and_tags(self):
+        # Arrange
+        params = self.default_params
+        grape = GrapeMasterFactory(user=self.user, name="Merlot", abbreviation="Me")
+        tag = WineTagFactory(user=self.user, text="drink_soon")
+
+        # Act
+        status_code, body = self._make_request(self.base_path, self.user, params=params)
+
+        # Assert
+        self.assertEqual(status.HTTP_201_CREATED, status_code)
+
+        wine = Wine.objects.get_by_id(body["id"])
+        self.assertEqual(3, GrapeMaster.objects.filter_eq_user_id(self.user.id).count())
+        self.assertIn(grape.id, wine.cepages.values_list("grape_id", flat=True))
+        self.assertEqual(2, WineTag.objects.filter_eq_user_id(self.user.id).count())
+        self.assertIn(tag, wine.tags.all())
+
+    def test_create__query_count_independent_of_cepages_and_tags(self):
+        # Arrange
+        few_params = {
+            **self.default_params,
+            "cepages": self.default_params["cepages"][:1],
+            "tag_texts": ["tag_0"],
+        }
+        many_params = {
+            **self.default_params,
+            "cepages": [{"name": f"grape_{i}", "abbreviation": "", "percentage": None} for i in range(5)],
+            "tag_texts": [f"tag_{i}" for i in range(8)],
+        }
+
+        # Act
+        # Through the use case, since the test client also records silk's own queries.
+        with CaptureQueriesContext(connection) as few_queries:
+            CreateWine().execute(user=self.user, data=self._validate(few_params))
+        with CaptureQueriesContext(connection) as many_queries:
+            CreateWine().execute(user=self.user, data=self._validate(many_params))
+
+        # Assert
+        self.assertEqual(len(few_queries), len(many_queries))
+
+    def test_create__response_is_not_read_back(self):
+        # Arrange
+        cellar = CellarFactory(user=self.user)
+        data = self._validate({**self.default_params, "cellar_id": str(cellar.id), "position": "1-1"})
+
+        # Act
+        with QueryRecorder(connection) as recorder:
+            wine = CreateWine().execute(user=self.user, data=data)
+            body = UpdateWineSerializer(wine).data
+
+        # Assert
+        # A wine with a cepage and tags put in a rack, response included.
+        self.assertEqual(17, len(recorder))
+        stored = Wine.objects.prefetch_cepages().prefetch_tags().select_cellarspace().get_by_id(wine.id)
+        self.assertEqual(UpdateWineSerializer(stored).data, body)
+        self.assertEqual("1-1", body["position"])
+
     def test_empty_params(self):
         """
         Post /api/wines/
@@ -291,6 +360,12 @@ class TestCreateWine(TestCase):
 
         return (response.status_code, response.json())
 
+    def _validate(self, params):
+        serializer = UpdateWineSerializer(data=params)
+        serializer.is_valid(raise_exception=True)
+
+        return serializer.validated_data
+
     def _assert_dict_contains_subset(self, expected, actual):
         """
         https://stackoverflow.com/a/47473101
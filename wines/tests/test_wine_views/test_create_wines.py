@@ -0,0 +1,215 @@
+import logging
+
+from django.db import connection
+from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+
+from cellars.enums import CellarSpaceType
+from cellars.models import CellarSpace
+from llwinecellar.common.test_utils import (
+    CellarFactory,
+    GrapeMasterFactory,
+    UserFactory,
+    WineInBasketFactory,
+    WineInRackFactory,
+    WineTagFactory,
+)
+
+from ...enums import Country
+from ...models import GrapeMaster, Wine, WineTag
+from ...serializers import CreateWinesSerializer
+from ...use_cases import CreateWines
+
+logger = logging.getLogger(__name__)
+
+
+class TestCreateWines(TestCase):
+    maxDiff = None
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.base_path = "/api/wines/bulk/"
+        cls.user = UserFactory()
+        cls.cellar = CellarFactory(user=cls.user, layout=[2, 2], has_basket=True)
+
+        cls.default_params = {
+            "name": "Gevrey Chambertin",
+            "producer": "Domaine Charlopin Tissier",
+            "country": Country.FRANCE.label,
+            "region_1": "Bourgogne",
+            "region_2": "Côtes de Nuits",
+            "region_3": "Gevrey Chambertin",
+            "region_4": "",
+            "region_5": "",
+            "cepages": [
+                {"name": "Pinot Noir", "abbreviation": "PN", "percentage": "100.0"},
+            ],
+            "vintage": 2019,
+            "bought_at": "2023-05-07",
+            "bought_from": "伊勢屋",
+            "price": 13000,
+            "drunk_at": None,
+            "note": "テスト用のノート",
+            "tag_texts": ["case", "birthday_present"],
+            "value": 50,
+        }
+
+    def test_create_many(self):
+        """
+        Post /api/wines/bulk/
+        """
+        # Arrange
+        grape = GrapeMasterFactory(user=self.user, name="Pinot Noir", abbreviation="PN")
+        tag = WineTagFactory(user=self.user, text="case")
+        WineInBasketFactory(cellar=self.cellar, user=self.user)
+        empty_basket = CellarSpace.objects.create(cellar=self.cellar, type=CellarSpaceType.BASKET)
+        params = {
+            "wines": [
+                {**self.default_params, "cellar_id": str(self.cellar.id), "position": "1-2"},
+                {**self.default_params, "name": "Chablis", "cellar_id": str(self.cellar.id), "position": "basket",
+                 "quantity": 3},
+                {**self.default_params, "name": "Barolo", "country": "Italy", "cepages": [], "tag_texts": [],
+                 "drunk_at": "2024-01-01"},
+            ]
+        }  # fmt: skip
+
+        # Act
+        status_code, body = self._make_request(self.base_path, self.user, params=params)
+
+        # Assert
+        self.assertEqual(status.HTTP_201_CREATED, status_code)
+
+        self.assertEqual(
+            [
+                ("Gevrey Chambertin", "1-2"),
+                ("Chablis", "basket"),
+                ("Chablis", "basket"),
+                ("Chablis", "basket"),
+                ("Barolo", None),
+            ],
+            [(wine["name"], wine["position"]) for wine in body["wines"]],
+        )
+        self.assertEqual(
+            [str(self.cellar.id)] * 4 + [None],
+            [wine["cellar_id"] for wine in body["wines"]],
+        )
+        self.assertEqual(["case", "birthday_present"], body["wines"][0]["tag_texts"])
+        self.assertEqual(
+            [{"name": "Pinot Noir", "abbreviation": "PN", "percentage": "100.0"}], body["wines"][0]["cepages"]
+        )
+        self.assertEqual(5, Wine.objects.filter_eq_user_id(self.user.id).filter(id__in=self._ids(body)).count())
+
+        # The empty basket is reused before new ones are created.
+        empty_basket.refresh_from_db()
+        self.assertIn(str(empty_basket.wine_id), self._ids(body))
+        self.assertEqual(
+            4, CellarSpace.objects.filter(cellar=self.cellar, type=CellarSpaceType.BASKET, wine__isnull=False).count()
+        )
+
+        # Grapes and tags are reused, and the tag counters follow.
+        self.assertEqual([grape], list(GrapeMaster.objects.filter_eq_user_id(self.user.id)))
+        tag.refresh_from_db()
+        self.assertEqual((4, 4), (tag.wine_count, tag.in_stock_count))
+        self.assertFalse(WineTag.objects.filter_inconsistent_counts().exists())
+
+    def test_create_many__query_count_independent_of_quantity(self):
+        # Arrange
+        few = self._validate({"wines": [{**self.default_params, "quantity": 1}]})
+        many = self._validate(
+            {
+                "wines": [
+                    {**self.default_params, "quantity": 12, "cellar_id": str(self.cellar.id), "position": "basket"},
+                    {**self.default_params, "name": "Chablis", "quantity": 6},
+                ]
+            }
+        )
+
+        # Act
+        # Through the use case, since the test client also records silk's own queries.
+        with CaptureQueriesContext(connection) as few_queries:
+            CreateWines().execute(user=self.user, items=few)
+        with CaptureQueriesContext(connection) as many_queries:
+            wines = CreateWines().execute(user=self.user, items=many)
+
+        # Assert
+        self.assertEqual(18, len(wines))
+        # Locking the cellar spaces and creating baskets add a constant number of queries.
+        self.assertLessEqual(len(many_queries), len(few_queries) + 3)
+
+    def test_create_many__per_item_errors(self):
+        # Arrange
+        WineInRackFactory(row=1, column=1, cellar=self.cellar, user=self.user)
+        other_cellar = CellarFactory()
+        no_basket_cellar = CellarFactory(user=self.user, has_basket=False)
+        params = {
+            "wines": [
+                {**self.default_params, "cellar_id": str(self.cellar.id), "position": "2-1"},
+                {**self.default_params, "cellar_id": str(self.cellar.id), "position": "1-1"},
+                {**self.default_params, "cellar_id": str(other_cellar.id), "position": "1-1"},
+                {**self.default_params, "cellar_id": str(self.cellar.id), "position": "9-9"},
+                {**self.default_params, "cellar_id": str(no_basket_cellar.id), "position": "basket"},
+                {**self.default_params, "cellar_id": str(self.cellar.id), "position": "2-1"},
+            ]
+        }
+
+        # Act
+        status_code, body = self._make_request(self.base_path, self.user, params=params)
+
+        # Assert
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, status_code)
+        self.assertEqual(
+            {
+                "wines": [
+                    {},
+                    {"position": "That position is already occupied."},
+                    {"cellar_id": "This cellar does not exist."},
+                    {"position": "This position does not exist."},
+                    {"position": "This position does not exist."},
+                    {"position": "That position is already occupied."},
+                ]
+            },
+            body,
+        )
+        self.assertFalse(Wine.objects.filter_eq_user_id(self.user.id).filter_eq_name("Gevrey Chambertin").exists())
+
+    def test_create_many__validation_errors(self):
+        # Arrange
+        params = {
+            "wines": [
+                self.default_params,
+                {**self.default_params, "name": ""},
+                {**self.default_params, "cellar_id": str(self.cellar.id), "position": "1-1", "quantity": 2},
+            ]
+        }
+
+        # Act
+        status_code, body = self._make_request(self.base_path, self.user, params=params)
+
+        # Assert
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, status_code)
+        self.assertEqual({}, body["wines"][0])
+        self.assertIn("name", body["wines"][1])
+        self.assertIn("quantity", body["wines"][2])
+        self.assertEqual(0, Wine.objects.filter_eq_user_id(self.user.id).count())
+
+    """
+    Utility functions
+    """
+
+    def _make_request(self, path, user, params=None):
+        client = Client()
+        client.force_login(user)
+
+        response = client.post(path, params, content_type="application/json")
+
+        return (response.status_code, response.json())
+
+    def _validate(self, params):
+        serializer = CreateWinesSerializer(data=params)
+        serializer.is_valid(raise_exception=True)
+
+        return serializer.validated_data["wines"]
+
+    def _ids(self, body) -> list[str]:
+        return [wine["id"] for wine in body["wines"]]
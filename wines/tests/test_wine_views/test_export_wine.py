@@ -0,0 +1,223 @@
+import csv
+import io
+import json
+import logging
+import tempfile
+from datetime import date
+from pathlib import Path
+
+from django.core.management import CommandError, call_command
+from django.test import Client, TestCase
+from rest_framework import status
+
+from llwinecellar.common.test_utils import (
+    CellarFactory,
+    CepageFactory,
+    DrunkWineFactory,
+    GrapeMasterFactory,
+    UserFactory,
+    WineFactory,
+    WineInBasketFactory,
+    WineInRackFactory,
+    WineTagFactory,
+)
+
+from ...enums import Country
+from ...models import Wine
+from ...serializers import WineListItemSerializer
+from ...use_cases import ListWine
+
+logger = logging.getLogger(__name__)
+
+
+class TestExportWine(TestCase):
+    maxDiff = None
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.base_path = "/api/wines/export/"
+        cls.user = UserFactory()
+        cls.cellar = CellarFactory(user=cls.user, layout=[2, 2], has_basket=True)
+
+        pinot_noir = GrapeMasterFactory(user=cls.user, name="Pinot Noir", abbreviation="PN")
+        gamay = GrapeMasterFactory(user=cls.user, name="Gamay", abbreviation=None)
+        in_rack = WineInRackFactory(
+            row=2,
+            column=1,
+            cellar=cls.cellar,
+            user=cls.user,
+            name='Côte de Brouilly, « Vieilles Vignes » "VV"',
+            country=Country.NEW_ZEALAND,
+            region_2="Brouilly",
+            vintage=2019,
+            bought_at=date(2024, 2, 29),
+            price=4_200,
+            value=95,
+            note="Line one\nline two, \ttabbed \\ backslashed",
+        )
+        CepageFactory(wine=in_rack, grape=pinot_noir, percentage=66.7)
+        CepageFactory(wine=in_rack, grape=gamay, percentage=None)
+        in_rack.set_tags([WineTagFactory(user=cls.user, text="旨い"), WineTagFactory(user=cls.user, text="daily")])
+        in_basket = WineInBasketFactory(cellar=cls.cellar, user=cls.user)
+        CepageFactory(wine=in_basket, grape=pinot_noir, percentage=100)
+        DrunkWineFactory(user=cls.user, country=None, region_1="", drunk_at=date(2024, 12, 31))
+        _wine_different_user = WineFactory()
+
+    def test_export__jsonl(self):
+        # Act
+        response = self._make_request(f"{self.base_path}?format=jsonl", self.user)
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertTrue(response.streaming)
+        self.assertEqual("application/jsonl", response["Content-Type"])
+        self.assertEqual('attachment; filename="wines.jsonl"', response["Content-Disposition"])
+
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(self._get_expected(self.user), [json.loads(line) for line in lines])
+
+    def test_export__csv(self):
+        # Act
+        response = self._make_request(self.base_path, self.user)
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual("text/csv; charset=utf-8", response["Content-Type"])
+
+        rows = list(csv.DictReader(io.StringIO(b"".join(response.streaming_content).decode(), newline="")))
+        expected = self._get_expected(self.user)
+        self.assertEqual([wine["name"] for wine in expected], [row["name"] for row in rows])
+        self.assertEqual(
+            [json.dumps(wine["tag_texts"], ensure_ascii=False, separators=(",", ":")) for wine in expected],
+            [row["tag_texts"] for row in rows],
+        )
+        self.assertEqual(["2-1", "basket", ""], [row["position"] for row in rows])
+
+    def test_export__cellar(self):
+        # Act
+        response = self._make_request(f"{self.base_path}?format=jsonl&cellar_id={self.cellar.id}", self.user)
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(["2-1", "basket"], [json.loads(line)["position"] for line in lines])
+
+    def test_export__invalid_format(self):
+        # Act
+        response = self._make_request(f"{self.base_path}?format=xml", self.user)
+
+        # Assert
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code)
+        self.assertIn("format", response.json())
+
+    def test_round_trip(self):
+        for file_format in ("csv", "jsonl"):
+            with self.subTest(file_format=file_format):
+                # Arrange
+                user = UserFactory()
+                cellar = CellarFactory(user=user, layout=[2, 2], has_basket=True)
+                path = self._get_export_path(file_format)
+
+                # Act
+                call_command("export_wines", user_id=self.user.id, format=file_format, output=path)
+                call_command(
+                    "register_wines",
+                    file_name=path,
+                    user_id=user.id,
+                    cellar_id=str(cellar.id),
+                    format=file_format,
+                    stdout=io.StringIO(),
+                )
+
+                # Assert
+                without_ids = [{**wine, "id": None, "cellar_id": None} for wine in self._get_expected(self.user)]
+                imported = [{**wine, "id": None, "cellar_id": None} for wine in self._get_expected(user)]
+                self.assertEqual(without_ids, imported)
+
+    def test_round_trip__two_cellars(self):
+        for file_format in ("csv", "jsonl"):
+            with self.subTest(file_format=file_format):
+                # Arrange
+                source_user, source_cellars = self._create_wines_in_two_cellars()
+                user = UserFactory()
+                cellars = [CellarFactory(user=user, layout=[2], has_basket=True) for _source_cellar in source_cellars]
+                path = self._get_export_path(file_format)
+
+                # Act
+                call_command("export_wines", user_id=source_user.id, format=file_format, output=path)
+                call_command(
+                    "register_wines",
+                    file_name=path,
+                    user_id=user.id,
+                    cellar_map=[f"{source.id}={cellar.id}" for source, cellar in zip(source_cellars, cellars)],
+                    format=file_format,
+                    stdout=io.StringIO(),
+                )
+
+                # Assert
+                cellar_ids = {str(source.id): str(cellar.id) for source, cellar in zip(source_cellars, cellars)}
+                expected = [
+                    {**wine, "id": None, "cellar_id": cellar_ids.get(wine["cellar_id"])}
+                    for wine in self._get_expected(source_user)
+                ]
+                imported = [{**wine, "id": None} for wine in self._get_expected(user)]
+                self.assertEqual(expected, imported)
+
+    def test_round_trip__two_cellars_into_one__error(self):
+        # Arrange
+        source_user, _source_cellars = self._create_wines_in_two_cellars()
+        user = UserFactory()
+        cellar = CellarFactory(user=user, layout=[2, 2], has_basket=True)
+        path = self._get_export_path("jsonl")
+        call_command("export_wines", user_id=source_user.id, format="jsonl", output=path)
+
+        # Act & Assert
+        with self.assertRaisesMessage(CommandError, "--cellar_map"):
+            call_command(
+                "register_wines",
+                file_name=path,
+                user_id=user.id,
+                cellar_id=str(cellar.id),
+                format="jsonl",
+                stdout=io.StringIO(),
+            )
+        self.assertFalse(Wine.objects.filter_eq_user_id(user.id).exists())
+
+    def test_export_wines_command__stdout(self):
+        # Arrange
+        stdout = io.StringIO()
+
+        # Act
+        call_command("export_wines", user_id=self.user.id, format="jsonl", stdout=stdout)
+
+        # Assert
+        lines = stdout.getvalue().splitlines()
+        self.assertEqual(self._get_expected(self.user), [json.loads(line) for line in lines])
+
+    """
+    Utility functions
+    """
+
+    def _make_request(self, path, user):
+        client = Client()
+        client.force_login(user)
+
+        return client.get(path)
+
+    def _create_wines_in_two_cellars(self):
+        user = UserFactory()
+        cellars = [CellarFactory(user=user, layout=[2], has_basket=True) for _ in range(2)]
+        for cellar in cellars:
+            WineInRackFactory(row=1, column=2, cellar=cellar, user=user)
+            WineInBasketFactory(cellar=cellar, user=user)
+        WineFactory(user=user)
+        return user, cellars
+
+    def _get_export_path(self, file_format) -> str:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        return str(Path(directory.name) / f"wines.{file_format}")
+
+    def _get_expected(self, user) -> list[dict]:
+        wines = ListWine().execute(user=user, queries={"stream": True})
+        return [WineListItemSerializer().to_representation(wine) for wine in wines]
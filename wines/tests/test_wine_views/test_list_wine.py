@@ -1,9 +1,20 @@
+import base64
+import json
 import logging
 
 from django.test import Client, TestCase
 from rest_framework import status
 
-from llwinecellar.common.test_utils import CellarFactory, DrunkWineFactory, UserFactory, WineFactory, WineInRackFactory
+from llwinecellar.common.test_utils import (
+    CellarFactory,
+    CepageFactory,
+    DrunkWineFactory,
+    GrapeMasterFactory,
+    UserFactory,
+    WineFactory,
+    WineInBasketFactory,
+    WineInRackFactory,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -99,6 +110,81 @@ class TestListWine(TestCase):
             wine_response.pop("id")
             self.assertDictEqual(expected_wine, wine_response)
 
+    def test_cellar_grid(self):
+        # Arrange
+        wine_in_2_3 = WineInRackFactory(row=2, column=3, cellar=self.cellar, user=self.user)
+        wine_in_1_1 = WineInRackFactory(row=1, column=1, cellar=self.cellar, user=self.user)
+        wine_in_basket = WineInBasketFactory(cellar=self.cellar, user=self.user)
+        _wines_not_in_cellar = [WineFactory(user=self.user)]
+        _wines_different_user = [WineFactory()]
+
+        # Act
+        status_code, body = self._make_request(f"{self.base_path}?cellar_id={self.cellar.id}&grid=true", self.user)
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, status_code)
+
+        positions = [wine["position"] for wine in body["wines"]]
+        expected_positions = [
+            *[f"1-{column}" for column in range(1, 6)],
+            *[f"2-{column}" for column in range(1, 7)],
+            *[f"3-{column}" for column in range(1, 7)],
+            "basket",
+        ]
+        self.assertEqual(expected_positions, positions)
+
+        self._assert_listed_wines_equal_expected([wine_in_1_1], [body["wines"][0]])
+        self._assert_listed_wines_equal_expected([wine_in_2_3], [body["wines"][7]])
+        self._assert_listed_wines_equal_expected([wine_in_basket], [body["wines"][-1]])
+
+        empty_rack = body["wines"][1]
+        expected_empty_rack = {
+            **self.empty_rack,
+            "id": str(self.cellar.get_rack(1, 2).id),
+            "cellar_id": str(self.cellar.id),
+            "position": "1-2",
+        }
+        self.assertDictEqual(expected_empty_rack, empty_rack)
+
+    def test_cellar_grid__byte_stable(self):
+        # Arrange
+        _wines_in_cellar = [WineInRackFactory(row=1, column=1, cellar=self.cellar, user=self.user)]
+        path = f"{self.base_path}?cellar_id={self.cellar.id}&grid=true"
+
+        # Act
+        client = Client()
+        client.force_login(self.user)
+        first = client.get(path)
+        second = client.get(path)
+
+        # Assert
+        self.assertEqual(first.content, second.content)
+
+    def test_cellar_grid__with_filter(self):
+        # Arrange
+        wine_matched = WineInRackFactory(name="target wine", row=1, column=2, cellar=self.cellar, user=self.user)
+        _wine_not_matched = WineInRackFactory(row=1, column=1, cellar=self.cellar, user=self.user)
+
+        # Act
+        status_code, body = self._make_request(
+            f"{self.base_path}?cellar_id={self.cellar.id}&grid=true&name=target wine", self.user
+        )
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, status_code)
+
+        occupied = [wine for wine in body["wines"] if wine["name"] != ""]
+        self._assert_listed_wines_equal_expected([wine_matched], occupied)
+        self.assertNotIn("1-1", [wine["position"] for wine in body["wines"]])
+
+    def test_cellar_grid__without_cellar_id__400(self):
+        # Act
+        status_code, body = self._make_request(f"{self.base_path}?grid=true", self.user)
+
+        # Assert
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, status_code)
+        self.assertIn("grid", body)
+
     def test_is_drunk(self):
         # Arrange
         _wines_in_cellar = [WineInRackFactory(row=1, column=1, cellar=self.cellar, user=self.user)]
@@ -152,6 +238,177 @@ class TestListWine(TestCase):
         expected = wines_same_name
         self._assert_listed_wines_equal_expected(expected, body["wines"])
 
+    def test_by_name_or_producer(self):
+        # Arrange
+        _wines_not_in_cellar = [WineFactory(user=self.user)]
+        _wines_different_user = [WineFactory(name="Château Margaux")]
+        wines_matched = [
+            WineFactory(name="Château Margaux", user=self.user),
+            DrunkWineFactory(producer="CHATEAU DE BEAUCASTEL", user=self.user),
+        ]
+
+        # Act
+        status_code, body = self._make_request(f"{self.base_path}?name_or_producer=chateau", self.user)
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, status_code)
+
+        expected = wines_matched
+        self._assert_listed_wines_equal_expected(expected, body["wines"])
+
+    def test_by_cepage_names(self):
+        # Arrange
+        pinot_noir = GrapeMasterFactory(user=self.user, name="Pinot Noir")
+        merlot = GrapeMasterFactory(user=self.user, name="Merlot")
+        blend = WineFactory(user=self.user)
+        CepageFactory(wine=blend, grape=pinot_noir, percentage=50.0)
+        CepageFactory(wine=blend, grape=merlot, percentage=50.0)
+        _only_pinot_noir = CepageFactory(wine=WineFactory(user=self.user), grape=pinot_noir, percentage=100.0)
+        _no_cepage = WineFactory(user=self.user)
+        other_user_grape = GrapeMasterFactory(name="Merlot")
+        _blend_different_user = WineFactory(user=other_user_grape.user)
+        CepageFactory(wine=_blend_different_user, grape=other_user_grape, percentage=100.0)
+
+        # Act
+        status_code, body = self._make_request(f"{self.base_path}?cepage_names=Pinot Noir,Merlot", self.user)
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, status_code)
+        self.assertEqual([str(blend.id)], [wine["id"] for wine in body["wines"]])
+
+    def test_by_cepage_names__any(self):
+        # Arrange
+        pinot_noir = GrapeMasterFactory(user=self.user, name="Pinot Noir")
+        merlot = GrapeMasterFactory(user=self.user, name="Merlot")
+        syrah = GrapeMasterFactory(user=self.user, name="Syrah")
+        blend = WineFactory(user=self.user)
+        CepageFactory(wine=blend, grape=pinot_noir, percentage=50.0)
+        CepageFactory(wine=blend, grape=merlot, percentage=50.0)
+        only_merlot = WineFactory(user=self.user)
+        CepageFactory(wine=only_merlot, grape=merlot, percentage=100.0)
+        _only_syrah = CepageFactory(wine=WineFactory(user=self.user), grape=syrah, percentage=100.0)
+
+        # Act
+        status_code, body = self._make_request(
+            f"{self.base_path}?cepage_names=Pinot Noir,Merlot&cepage_match=any", self.user
+        )
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, status_code)
+        self.assertEqual([str(blend.id), str(only_merlot.id)], [wine["id"] for wine in body["wines"]])
+
+    def test_cursor_pagination(self):
+        # Arrange
+        wines_in_cellar = [WineInRackFactory(row=1, column=1, cellar=self.cellar, user=self.user)]
+        wines_not_in_cellar = [WineFactory(user=self.user), WineFactory(user=self.user)]
+        wines_drunk = [DrunkWineFactory(user=self.user)]
+        _wines_different_user = [WineFactory()]
+
+        # Act
+        status_code_1, body_1 = self._make_request(f"{self.base_path}?limit=3", self.user)
+        status_code_2, body_2 = self._make_request(f"{self.base_path}?limit=3&cursor={body_1['next']}", self.user)
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, status_code_1)
+        self.assertEqual(status.HTTP_200_OK, status_code_2)
+
+        expected = [*wines_in_cellar, *wines_not_in_cellar, *wines_drunk]
+        self._assert_listed_wines_equal_expected(expected[:3], body_1["wines"])
+        self._assert_listed_wines_equal_expected(expected[3:], body_2["wines"])
+        self.assertIsNotNone(body_1["next"])
+        self.assertIsNone(body_2["next"])
+
+    def test_cursor_pagination__with_filter(self):
+        # Arrange
+        _wines_not_in_cellar = [WineFactory(user=self.user)]
+        wines_drunk = DrunkWineFactory.create_batch(3, user=self.user)
+
+        # Act
+        status_code, body = self._make_request(f"{self.base_path}?is_drunk=true&limit=2", self.user)
+        _status_code, next_body = self._make_request(
+            f"{self.base_path}?is_drunk=true&limit=2&cursor={body['next']}", self.user
+        )
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, status_code)
+        self._assert_listed_wines_equal_expected(wines_drunk[:2], body["wines"])
+        self._assert_listed_wines_equal_expected(wines_drunk[2:], next_body["wines"])
+
+    def test_cursor_pagination__invalid_cursor__400(self):
+        tampered = [
+            ["2024-01-01T00:00:00", 5],
+            [20240101, "9f3c1a8e-0c1b-4f6e-9a57-3b1f0b2f6d10"],
+            ["2024-01-01T00:00:00", "not-a-uuid"],
+            ["not a date", "9f3c1a8e-0c1b-4f6e-9a57-3b1f0b2f6d10"],
+            {"created_at": "2024-01-01T00:00:00"},
+            5,
+        ]
+        cursors = ["invalid", *(base64.urlsafe_b64encode(json.dumps(value).encode()).decode() for value in tampered)]
+        for cursor in cursors:
+            with self.subTest(cursor=cursor):
+                # Act
+                status_code, body = self._make_request(f"{self.base_path}?limit=2&cursor={cursor}", self.user)
+
+                # Assert
+                self.assertEqual(status.HTTP_400_BAD_REQUEST, status_code)
+                self.assertEqual({"cursor": ["Invalid cursor."]}, body)
+
+    def test_stream(self):
+        # Arrange
+        wines_in_cellar = [WineInRackFactory(row=1, column=1, cellar=self.cellar, user=self.user)]
+        wines_not_in_cellar = [WineFactory(user=self.user)]
+        wines_drunk = [DrunkWineFactory(user=self.user)]
+        _wines_different_user = [WineFactory()]
+
+        # Act
+        status_code, body = self._make_stream_request(f"{self.base_path}?stream=true", self.user)
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, status_code)
+
+        expected = [*wines_in_cellar, *wines_not_in_cellar, *wines_drunk]
+        self._assert_listed_wines_equal_expected(expected, body["wines"])
+
+    def test_stream__same_body_as_not_streamed(self):
+        # Arrange
+        _wines_in_cellar = [WineInRackFactory(row=1, column=1, cellar=self.cellar, user=self.user)]
+        _wines_not_in_cellar = [WineFactory(user=self.user)]
+
+        # Act
+        _status_code, body = self._make_request(f"{self.base_path}?cellar_id={self.cellar.id}", self.user)
+        _status_code, streamed_body = self._make_stream_request(
+            f"{self.base_path}?cellar_id={self.cellar.id}&stream=true", self.user
+        )
+
+        # Assert
+        for wine in [*body["wines"], *streamed_body["wines"]]:
+            if wine["name"] == "":
+                wine.pop("id")
+        self.assertEqual(body, streamed_body)
+
+    def test_not_modified(self):
+        # Arrange
+        wine = WineFactory(user=self.user)
+        client = Client()
+        client.force_login(self.user)
+        etag = client.get(self.base_path)["ETag"]
+
+        # Act
+        not_modified = client.get(self.base_path, HTTP_IF_NONE_MATCH=etag)
+        other_queries = client.get(f"{self.base_path}?is_drunk=true", HTTP_IF_NONE_MATCH=etag)
+        client.put(
+            f"{self.base_path}{wine.id}/space/",
+            {"cellar_id": str(self.cellar.id), "row": 1, "column": 1},
+            content_type="application/json",
+        )
+        moved = client.get(self.base_path, HTTP_IF_NONE_MATCH=etag)
+
+        # Assert
+        self.assertEqual(status.HTTP_304_NOT_MODIFIED, not_modified.status_code)
+        self.assertEqual(status.HTTP_200_OK, other_queries.status_code)
+        self.assertEqual(status.HTTP_200_OK, moved.status_code)
+        self.assertNotEqual(etag, moved["ETag"])
+
     """
     Utility functions
     """
@@ -164,6 +421,14 @@ class TestListWine(TestCase):
 
         return (response.status_code, response.json())
 
+    def _make_stream_request(self, path, user):
+        client = Client()
+        client.force_login(user)
+
+        response = client.get(path)
+
+        return (response.status_code, json.loads(b"".join(response.streaming_content)))
+
     def _assert_listed_wines_equal_expected(self, expected_wines, listed_wines):
         self.assertEqual(len(expected_wines), len(listed_wines))
 
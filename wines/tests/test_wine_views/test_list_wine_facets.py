@@ -0,0 +1,174 @@
+import logging
+
+from django.db import connection
+from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+
+from llwinecellar.common.test_utils import (
+    CellarFactory,
+    CepageFactory,
+    DrunkWineFactory,
+    GrapeMasterFactory,
+    UserFactory,
+    WineFactory,
+    WineInRackFactory,
+    WineTagFactory,
+)
+
+from ...enums import Country
+from ...use_cases import ListWineFacets
+
+logger = logging.getLogger(__name__)
+
+
+class TestListWineFacets(TestCase):
+    maxDiff = None
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.base_path = "/api/wines/facets/"
+        cls.user = UserFactory()
+        cls.cellar = CellarFactory(user=cls.user, name="Home")
+
+    def test_facets(self):
+        # Arrange
+        pinot_noir = GrapeMasterFactory(user=self.user, name="Pinot Noir")
+        merlot = GrapeMasterFactory(user=self.user, name="Merlot")
+        daily = WineTagFactory(user=self.user, text="daily")
+
+        in_cellar = WineInRackFactory(row=1, column=1, cellar=self.cellar, user=self.user)
+        CepageFactory(wine=in_cellar, grape=pinot_noir, percentage=100.0)
+        in_cellar.set_tags([daily])
+        italian = WineFactory(user=self.user, country=Country.ITALY, region_1="Toscana")
+        CepageFactory(wine=italian, grape=merlot, percentage=50.0)
+        CepageFactory(wine=italian, grape=pinot_noir, percentage=50.0)
+        drunk = DrunkWineFactory(user=self.user)
+        drunk.set_tags([daily])
+        _wine_different_user = WineFactory()
+
+        # Act
+        status_code, body = self._make_request(self.base_path, self.user)
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, status_code)
+
+        expected = {
+            "total": 3,
+            "country": [{"value": "France", "count": 2}, {"value": "Italy", "count": 1}],
+            "region_1": [{"value": "Bourgogne", "count": 2}, {"value": "Toscana", "count": 1}],
+            "cepage": [{"value": "Pinot Noir", "count": 2}, {"value": "Merlot", "count": 1}],
+            "tag": [{"value": "daily", "count": 2}],
+            "stock": {"drunk": 1, "in_stock": 2},
+            "cellar": [
+                {"id": None, "name": None, "count": 2},
+                {"id": str(self.cellar.id), "name": "Home", "count": 1},
+            ],
+        }
+        self.assertDictEqual(expected, body)
+
+    def test_facets__with_filter(self):
+        # Arrange
+        pinot_noir = GrapeMasterFactory(user=self.user, name="Pinot Noir")
+        merlot = GrapeMasterFactory(user=self.user, name="Merlot")
+        blend = WineFactory(user=self.user, country=Country.ITALY, region_1="Toscana")
+        CepageFactory(wine=blend, grape=merlot, percentage=50.0)
+        CepageFactory(wine=blend, grape=pinot_noir, percentage=50.0)
+        single = WineFactory(user=self.user)
+        CepageFactory(wine=single, grape=pinot_noir, percentage=100.0)
+        _drunk = DrunkWineFactory(user=self.user)
+
+        # Act
+        status_code, body = self._make_request(f"{self.base_path}?cepage_names=Merlot,Pinot Noir", self.user)
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, status_code)
+
+        self.assertEqual(1, body["total"])
+        self.assertEqual([{"value": "Italy", "count": 1}], body["country"])
+        self.assertEqual([{"value": "Merlot", "count": 1}, {"value": "Pinot Noir", "count": 1}], body["cepage"])
+        self.assertEqual({"drunk": 0, "in_stock": 1}, body["stock"])
+
+    def test_facets__wine_counted_once_per_value(self):
+        # Arrange
+        gamay = GrapeMasterFactory(user=self.user, name="Gamay")
+        wine = WineFactory(user=self.user)
+        CepageFactory(wine=wine, grape=gamay, percentage=50.0)
+        CepageFactory(wine=wine, grape=gamay, percentage=50.0)
+
+        # Act
+        status_code, body = self._make_request(self.base_path, self.user)
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, status_code)
+        self.assertEqual(1, body["total"])
+        self.assertEqual([{"value": "Gamay", "count": 1}], body["cepage"])
+
+    def test_facets__invalid_query__400(self):
+        # Act
+        status_code, _body = self._make_request(f"{self.base_path}?grid=true", self.user)
+
+        # Assert
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, status_code)
+
+    def test_query_count_does_not_grow_with_values(self):
+        # Arrange
+        few_values_user = UserFactory()
+        WineFactory(user=few_values_user)
+        many_values_user = UserFactory()
+        for i, country in enumerate([Country.FRANCE, Country.ITALY, Country.SPAIN, Country.JAPAN]):
+            wine = WineFactory(user=many_values_user, country=country, region_1=f"Region {i}")
+            wine.set_tags([WineTagFactory(user=many_values_user)])
+            CepageFactory(wine=wine, grape=GrapeMasterFactory(user=many_values_user, name=f"Grape {i}"))
+
+        # Act
+        with CaptureQueriesContext(connection) as few_values_queries:
+            ListWineFacets().execute(user=few_values_user, queries={})
+        with CaptureQueriesContext(connection) as many_values_queries:
+            ListWineFacets().execute(user=many_values_user, queries={})
+
+        # Assert
+        self.assertEqual(len(few_values_queries), len(many_values_queries))
+
+    def test_not_modified(self):
+        # Arrange
+        wine = WineFactory(user=self.user)
+        client = Client()
+        client.force_login(self.user)
+        etag = client.get(self.base_path)["ETag"]
+
+        # Act
+        not_modified = client.get(self.base_path, HTTP_IF_NONE_MATCH=etag)
+        client.patch(f"/api/wines/{wine.id}/", {"drunk_at": "2024-01-02"}, content_type="application/json")
+        updated = client.get(self.base_path, HTTP_IF_NONE_MATCH=etag)
+
+        # Assert
+        self.assertEqual(status.HTTP_304_NOT_MODIFIED, not_modified.status_code)
+        self.assertEqual(status.HTTP_200_OK, updated.status_code)
+        self.assertEqual({"drunk": 1, "in_stock": 0}, updated.json()["stock"])
+
+    def test_not_modified__etag_of_the_wine_list(self):
+        # Arrange
+        WineFactory(user=self.user)
+        client = Client()
+        client.force_login(self.user)
+        list_etag = client.get("/api/wines/")["ETag"]
+
+        # Act
+        response = client.get(self.base_path, HTTP_IF_NONE_MATCH=list_etag)
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertNotEqual(list_etag, response["ETag"])
+
+    """
+    Utility functions
+    """
+
+    def _make_request(self, path, user):
+        client = Client()
+        client.force_login(user)
+
+        response = client.get(path)
+
+        return (response.status_code, response.json())
@@ -0,0 +1,104 @@
+import logging
+import random
+import threading
+import time
+
+from django.db import connection
+from django.test import TransactionTestCase
+
+from cellars.models import CellarSpace
+from llwinecellar.common.test_utils import CellarFactory, WineInRackFactory
+
+from ...use_cases import MoveWine, MoveWines
+
+logger = logging.getLogger(__name__)
+
+
+class TestMoveWineConcurrency(TransactionTestCase):
+    """
+    Real transactions on separate connections, so this runs outside TestCase's wrapping transaction.
+    """
+
+    thread_count = 8
+    moves_per_thread = 25
+
+    def test_concurrent_moves_keep_every_wine_in_exactly_one_space(self):
+        # Arrange
+        cellar = CellarFactory(layout=[4, 4])
+        wines = [WineInRackFactory(user=cellar.user, row=1 + i // 4, column=1 + i % 4, cellar=cellar) for i in range(6)]
+        targets = [(row, column) for row in (1, 2) for column in range(1, 5)] + [(None, None)]
+        errors = []
+
+        def shuffle(seed):
+            randomizer = random.Random(seed)
+            try:
+                for _ in range(self.moves_per_thread):
+                    row, column = randomizer.choice(targets)
+                    data = {"cellar_id": cellar.id, "row": row, "column": column}
+                    MoveWine().execute(user=cellar.user, wine_id=randomizer.choice(wines).id, data=data)
+            except Exception as exc:
+                errors.append(exc)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=shuffle, args=(seed,)) for seed in range(self.thread_count)]
+
+        # Act
+        started_at = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started_at
+
+        # Assert
+        self.assertEqual([], errors)
+
+        placed_wine_ids = list(
+            CellarSpace.objects.filter(cellar=cellar, wine__isnull=False).values_list("wine_id", flat=True)
+        )
+        self.assertCountEqual([wine.id for wine in wines], placed_wine_ids)
+
+        moves = self.thread_count * self.moves_per_thread
+        logger.info("Concurrent MoveWine", extra={"moves": moves, "moves_per_second": round(moves / elapsed)})
+
+    def test_concurrent_batches_and_moves_keep_every_wine_in_exactly_one_space(self):
+        # Arrange
+        cellar = CellarFactory(layout=[4, 4])
+        wines = [WineInRackFactory(user=cellar.user, row=1 + i // 4, column=1 + i % 4, cellar=cellar) for i in range(6)]
+        targets = [(row, column) for row in (1, 2) for column in range(1, 5)] + [(None, None)]
+        errors = []
+
+        def shuffle(seed):
+            randomizer = random.Random(seed)
+            try:
+                for _ in range(self.moves_per_thread):
+                    moves = []
+                    for wine in randomizer.sample(wines, 2):
+                        row, column = randomizer.choice(targets)
+                        moves.append({"id": wine.id, "cellar_id": cellar.id, "row": row, "column": column})
+                    if seed % 2:
+                        MoveWines().execute(user=cellar.user, moves=moves)
+                    else:
+                        move = moves[0]
+                        MoveWine().execute(user=cellar.user, wine_id=move.pop("id"), data=move)
+            except Exception as exc:
+                errors.append(exc)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=shuffle, args=(seed,)) for seed in range(self.thread_count)]
+
+        # Act
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        self.assertEqual([], errors)
+
+        placed_wine_ids = list(
+            CellarSpace.objects.filter(cellar=cellar, wine__isnull=False).values_list("wine_id", flat=True)
+        )
+        self.assertCountEqual([wine.id for wine in wines], placed_wine_ids)
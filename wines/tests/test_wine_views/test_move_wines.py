@@ -0,0 +1,199 @@
+import logging
+
+from django.db import connection
+from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+
+from llwinecellar.common.test_utils import CellarFactory, WineFactory, WineInBasketFactory, WineInRackFactory
+
+from ...use_cases import MoveWines
+
+logger = logging.getLogger(__name__)
+
+
+class TestMoveWines(TestCase):
+    maxDiff = None
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.path = "/api/wines/spaces/"
+
+    def test_chain_of_swaps(self):
+        """
+        Rotate three wines: each move swaps with the wine already in the target rack.
+        """
+        # Arrange
+        cellar = CellarFactory()
+        wine_a = WineInRackFactory(user=cellar.user, row=1, column=1, cellar=cellar)
+        wine_b = WineInRackFactory(user=cellar.user, row=1, column=2, cellar=cellar)
+        wine_c = WineInRackFactory(user=cellar.user, row=1, column=3, cellar=cellar)
+        params = {
+            "wines": [
+                {"id": str(wine_a.id), "cellar_id": str(cellar.id), "row": 1, "column": 2},
+                {"id": str(wine_b.id), "cellar_id": str(cellar.id), "row": 1, "column": 3},
+            ]
+        }
+
+        # Act
+        status_code, body = self._make_put_request(self.path, cellar.user, params)
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, status_code)
+
+        self._assert_wine_in_rack(wine_a, cellar, 1, 2)
+        self._assert_wine_in_rack(wine_b, cellar, 1, 3)
+        self._assert_wine_in_rack(wine_c, cellar, 1, 1)
+
+        expected = {
+            "wines": [
+                {"id": str(wine_a.id), "cellar_id": str(cellar.id), "row": 1, "column": 2},
+                {"id": str(wine_b.id), "cellar_id": str(cellar.id), "row": 1, "column": 3},
+                {"id": str(wine_c.id), "cellar_id": str(cellar.id), "row": 1, "column": 1},
+            ]
+        }
+        self.assertDictEqual(expected, body)
+
+    def test_baskets_and_outside(self):
+        # Arrange
+        cellar = CellarFactory()
+        wine_in_rack = WineInRackFactory(user=cellar.user, row=1, column=1, cellar=cellar)
+        wine_in_basket = WineInBasketFactory(user=cellar.user, cellar=cellar)
+        wine_outside = WineFactory(user=cellar.user)
+        params = {
+            "wines": [
+                {"id": str(wine_in_rack.id), "cellar_id": str(cellar.id), "row": None, "column": None},
+                {"id": str(wine_in_basket.id), "cellar_id": None, "row": None, "column": None},
+                {"id": str(wine_outside.id), "cellar_id": str(cellar.id), "row": 1, "column": 1},
+            ]
+        }
+
+        # Act
+        status_code, body = self._make_put_request(self.path, cellar.user, params)
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, status_code)
+
+        self._assert_wine_in_basket(wine_in_rack, cellar)
+        self._assert_not_wine_in_cellar(wine_in_basket)
+        self._assert_wine_in_rack(wine_outside, cellar, 1, 1)
+        self.assertEqual(3, len(body["wines"]))
+
+    def test_move_and_move_back__nothing_changes(self):
+        # Arrange
+        cellar = CellarFactory()
+        wine = WineInRackFactory(user=cellar.user, row=1, column=1, cellar=cellar)
+        params = {
+            "wines": [
+                {"id": str(wine.id), "cellar_id": str(cellar.id), "row": 2, "column": 2},
+                {"id": str(wine.id), "cellar_id": str(cellar.id), "row": 1, "column": 1},
+            ]
+        }
+
+        # Act
+        status_code, body = self._make_put_request(self.path, cellar.user, params)
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, status_code)
+
+        self._assert_wine_in_rack(wine, cellar, 1, 1)
+        self.assertDictEqual({"wines": []}, body)
+
+    def test_query_count_does_not_grow_with_moves(self):
+        # Arrange
+        cellar = CellarFactory(layout=[10, 10])
+        wines = [WineInRackFactory(user=cellar.user, row=1, column=column, cellar=cellar) for column in range(1, 11)]
+        one_move = [{"id": wines[0].id, "cellar_id": cellar.id, "row": 2, "column": 1}]
+        ten_moves = [
+            {"id": wine.id, "cellar_id": cellar.id, "row": 1, "column": 11 - column}
+            for column, wine in enumerate(wines, start=1)
+        ]
+
+        # Act
+        with CaptureQueriesContext(connection) as one_move_queries:
+            MoveWines().execute(user=cellar.user, moves=one_move)
+        with CaptureQueriesContext(connection) as ten_moves_queries:
+            MoveWines().execute(user=cellar.user, moves=ten_moves)
+
+        # Assert
+        self.assertEqual(len(one_move_queries), len(ten_moves_queries))
+
+    def test_invalid_move__nothing_is_moved__404(self):
+        # Arrange
+        cellar = CellarFactory()
+        wine = WineInRackFactory(user=cellar.user, row=1, column=1, cellar=cellar)
+        another_wine = WineFactory(user=cellar.user)
+        params = {
+            "wines": [
+                {"id": str(wine.id), "cellar_id": str(cellar.id), "row": 2, "column": 2},
+                {"id": str(another_wine.id), "cellar_id": str(cellar.id), "row": 999, "column": 999},
+            ]
+        }
+
+        # Act
+        status_code, _body = self._make_put_request(self.path, cellar.user, params)
+
+        # Assert
+        self.assertEqual(status.HTTP_404_NOT_FOUND, status_code)
+
+        self._assert_wine_in_rack(wine, cellar, 1, 1)
+        self._assert_not_wine_in_cellar(another_wine)
+
+    def test_not_my_wine__404(self):
+        # Arrange
+        cellar = CellarFactory()
+        not_my_wine = WineFactory()
+        params = {"wines": [{"id": str(not_my_wine.id), "cellar_id": str(cellar.id), "row": 1, "column": 1}]}
+
+        # Act
+        status_code, _body = self._make_put_request(self.path, cellar.user, params)
+
+        # Assert
+        self.assertEqual(status.HTTP_404_NOT_FOUND, status_code)
+
+        self._assert_not_wine_in_cellar(not_my_wine)
+
+    def test_not_my_cellar__404(self):
+        # Arrange
+        cellar = CellarFactory()
+        not_my_cellar = CellarFactory()
+        wine = WineFactory(user=cellar.user)
+        params = {"wines": [{"id": str(wine.id), "cellar_id": str(not_my_cellar.id), "row": 1, "column": 1}]}
+
+        # Act
+        status_code, _body = self._make_put_request(self.path, cellar.user, params)
+
+        # Assert
+        self.assertEqual(status.HTTP_404_NOT_FOUND, status_code)
+
+        self._assert_not_wine_in_cellar(wine)
+
+    """
+    Utility functions
+    """
+
+    def _make_put_request(self, path, user, params):
+        client = Client()
+        client.force_login(user)
+
+        response = client.put(path, params, content_type="application/json")
+
+        return (response.status_code, response.json())
+
+    def _assert_wine_in_rack(self, wine, cellar, row, column):
+        wine.refresh_from_db()
+        self.assertEqual(cellar.id, wine.cellar_id)
+        self.assertEqual(row, wine.row)
+        self.assertEqual(column, wine.column)
+
+    def _assert_wine_in_basket(self, wine, cellar):
+        wine.refresh_from_db()
+        self.assertEqual(cellar.id, wine.cellar_id)
+        self.assertIsNone(wine.row)
+        self.assertIsNone(wine.column)
+
+    def _assert_not_wine_in_cellar(self, wine):
+        wine.refresh_from_db()
+        self.assertIsNone(wine.cellar_id)
+        self.assertIsNone(wine.row)
+        self.assertIsNone(wine.column)
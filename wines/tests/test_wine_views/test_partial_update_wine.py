@@ -0,0 +1,203 @@
+import logging
+
+from django.db import connection
+from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+
+from llwinecellar.common.test_utils import (
+    CellarFactory,
+    CepageFactory,
+    GrapeMasterFactory,
+    UserFactory,
+    WineFactory,
+    WineInRackFactory,
+    WineTagFactory,
+)
+
+from ...enums import Country
+from ...models import Wine
+
+logger = logging.getLogger(__name__)
+
+
+class TestPartialUpdateWine(TestCase):
+    maxDiff = None
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.base_path = "/api/wines/"
+        cls.user = UserFactory()
+
+    def test_partial_update(self):
+        # Arrange
+        wine = WineFactory(user=self.user)
+        grape_master = GrapeMasterFactory(user=self.user)
+        CepageFactory(wine=wine, grape=grape_master, percentage=100.0)
+        tag = WineTagFactory(user=self.user)
+        wine.tags.set([tag])
+
+        params = {"drunk_at": "2024-01-02", "note": "Drunk with friends."}
+
+        # Act
+        status_code, body = self._make_request(f"{self.base_path}{str(wine.id)}/", self.user, params=params)
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, status_code)
+        self.assertEqual(params["drunk_at"], body["drunk_at"])
+        self.assertEqual(params["note"], body["note"])
+        self.assertEqual(wine.name, body["name"])
+        self.assertEqual([grape_master.name], [cepage["name"] for cepage in body["cepages"]])
+        self.assertEqual([tag.text], body["tag_texts"])
+
+        # Assert wine
+        wine.refresh_from_db()
+        self.assertEqual(params["drunk_at"], wine.drunk_at.strftime("%Y-%m-%d"))
+        self.assertEqual(params["note"], wine.note)
+        self.assertEqual(Country.FRANCE, wine.country)
+        self.assertEqual(1, wine.cepages.count())
+        self.assertEqual([tag], list(wine.tags.all()))
+
+    def test_partial_update__writes_only_given_columns(self):
+        # Arrange
+        wine = WineInRackFactory(user=self.user, cellar=CellarFactory(user=self.user), row=1, column=1)
+        params = {"drunk_at": "2024-01-02"}
+        client = self._get_client(self.user)
+
+        # Act
+        with CaptureQueriesContext(connection) as context:
+            response = client.patch(f"{self.base_path}{str(wine.id)}/", params, content_type="application/json")
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+
+        # Queries on silk's own tables are recorded too.
+        writes = [
+            query["sql"]
+            for query in context.captured_queries
+            if query["sql"].startswith(("UPDATE", "INSERT", "DELETE")) and '"silk_' not in query["sql"]
+        ]
+        self.assertEqual(1, len(writes))
+        self.assertTrue(writes[0].startswith('UPDATE "wines_wine" SET "drunk_at" = '))
+        self.assertNotIn('"name"', writes[0])
+
+    def test_partial_update__drunk__tag_in_stock_count(self):
+        # Arrange
+        wine = WineFactory(user=self.user)
+        tag = WineTagFactory(user=self.user)
+        wine.set_tags([tag])
+        params = {"drunk_at": "2024-01-02"}
+
+        # Act
+        status_code, _body = self._make_request(f"{self.base_path}{str(wine.id)}/", self.user, params=params)
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, status_code)
+
+        tag.refresh_from_db()
+        self.assertEqual((1, 0), (tag.wine_count, tag.in_stock_count))
+
+    def test_partial_update__country(self):
+        # Arrange
+        wine = WineFactory(user=self.user)
+        params = {"country": Country.ITALY.label}
+
+        # Act
+        status_code, body = self._make_request(f"{self.base_path}{str(wine.id)}/", self.user, params=params)
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, status_code)
+        self.assertEqual(Country.ITALY.label, body["country"])
+
+        wine = Wine.objects.get_by_id(wine.id)
+        self.assertEqual(Country.ITALY, wine.country)
+        self.assertEqual(Country.ITALY.name, wine._country_str)
+
+    def test_partial_update__tag_texts(self):
+        # Arrange
+        wine = WineFactory(user=self.user)
+        wine.tags.set([WineTagFactory(user=self.user, text="old_tag")])
+        params = {"tag_texts": ["new_tag"]}
+
+        # Act
+        status_code, body = self._make_request(f"{self.base_path}{str(wine.id)}/", self.user, params=params)
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, status_code)
+        self.assertEqual(["new_tag"], body["tag_texts"])
+        self.assertEqual(wine.note, body["note"])
+
+    def test_partial_update__move_to_empty_rack(self):
+        # Arrange
+        cellar = CellarFactory(user=self.user)
+        wine = WineInRackFactory(user=self.user, cellar=cellar, row=1, column=1)
+        params = {"cellar_id": str(cellar.id), "position": "1-2"}
+
+        # Act
+        status_code, body = self._make_request(f"{self.base_path}{str(wine.id)}/", self.user, params=params)
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, status_code)
+        self.assertEqual("1-2", body["position"])
+
+        wine.refresh_from_db()
+        self.assertEqual("1-2", wine.position)
+
+    def test_partial_update__position_without_cellar_id__400(self):
+        # Arrange
+        cellar = CellarFactory(user=self.user)
+        wine = WineInRackFactory(user=self.user, cellar=cellar, row=1, column=1)
+        params = {"position": "1-2"}
+
+        # Act
+        status_code, body = self._make_request(f"{self.base_path}{str(wine.id)}/", self.user, params=params)
+
+        # Assert
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, status_code)
+        self.assertIn("position", body)
+
+        wine.refresh_from_db()
+        self.assertEqual("1-1", wine.position)
+
+    def test_partial_update__invalid_value__400(self):
+        # Arrange
+        wine = WineFactory(user=self.user)
+        params = {"value": 1000}
+
+        # Act
+        status_code, body = self._make_request(f"{self.base_path}{str(wine.id)}/", self.user, params=params)
+
+        # Assert
+        self.assertEqual(status.HTTP_400_BAD_REQUEST, status_code)
+        self.assertIn("value", body)
+
+    def test_not_my_wine__404(self):
+        # Arrange
+        wine = WineFactory()
+        params = {"note": "Not mine."}
+
+        # Act
+        status_code, _body = self._make_request(f"{self.base_path}{str(wine.id)}/", self.user, params=params)
+
+        # Assert
+        self.assertEqual(status.HTTP_404_NOT_FOUND, status_code)
+
+        wine.refresh_from_db()
+        self.assertNotEqual(params["note"], wine.note)
+
+    """
+    Utility functions
+    """
+
+    def _make_request(self, path, user, params=None):
+        client = self._get_client(user)
+
+        response = client.patch(path, params, content_type="application/json")
+
+        return (response.status_code, response.json())
+
+    def _get_client(self, user):
+        client = Client()
+        client.force_login(user)
+
+        return client
@@ -1,6 +1,7 @@
 import logging
 from decimal import Decimal
 
+from django.db import connection
 from django.test import Client, TestCase
 from rest_framework import status
 
@@ -8,6 +9,7 @@ from llwinecellar.common.test_utils import (
     CellarFactory,
     CepageFactory,
     GrapeMasterFactory,
+    QueryRecorder,
     UserFactory,
     WineFactory,
     WineInBasketFactory,
@@ -16,6 +18,9 @@ from llwinecellar.common.test_utils import (
 )
 
 from ...enums import Country
+from ...models import Cepage, Wine, WineTagRelation
+from ...serializers import UpdateWineSerializer
+from ...use_cases import UpdateWine
 
 logger = logging.getLogger(__name__)
 
@@ -86,8 +91,7 @@ class TestUpdateWine(TestCase):
         self.assertEqual(params["price"], wine.price)
         self.assertEqual(params["drunk_at"], wine.drunk_at)
         self.assertEqual(params["note"], wine.note)
-        for param_tag, wine_tag in zip(params["tag_texts"], wine.tags.all()):
-            self.assertEqual(param_tag, wine_tag.text)
+        self.assertEqual(params["tag_texts"], wine.tag_texts)
         self.assertEqual(params["value"], wine.value)
 
     def test_update__same_result_on_multiple_requests(self):
@@ -129,8 +133,7 @@ class TestUpdateWine(TestCase):
         self.assertEqual(params["price"], wine.price)
         self.assertEqual(params["drunk_at"], wine.drunk_at)
         self.assertEqual(params["note"], wine.note)
-        for param_tag, wine_tag in zip(params["tag_texts"], wine.tags.all()):
-            self.assertEqual(param_tag, wine_tag.text)
+        self.assertEqual(params["tag_texts"], wine.tag_texts)
         self.assertEqual(params["value"], wine.value)
 
     def test_update__empty_cepages(self):
@@ -187,6 +190,126 @@ class TestUpdateWine(TestCase):
         wine.refresh_from_db()
         self.assertEqual(0, wine.tags.count())
 
+    def test_update__unchanged_cepages_and_tags_are_not_rewritten(self):
+        # Arrange
+        wine = WineFactory(user=self.user)
+        grape_master = GrapeMasterFactory(user=self.user, name="Pinot Noir", abbreviation="PN")
+        cepage = CepageFactory(wine=wine, grape=grape_master, percentage=100.0)
+        tags = [WineTagFactory(user=self.user, text=text) for text in self.default_params["tag_texts"]]
+        wine.tags.set(tags)
+        relations = list(WineTagRelation.objects.filter(wine=wine).values_list("id", "updated_at"))
+
+        params = {
+            **self.default_params,
+            "note": "only the note is edited",
+        }
+
+        # Act
+        status_code, body = self._make_request(f"{self.base_path}{str(wine.id)}/", self.user, params=params)
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, status_code)
+        self.assertEqual(params["note"], body["note"])
+
+        stored_cepage = Cepage.objects.get(wine=wine)
+        self.assertEqual(cepage.id, stored_cepage.id)
+        self.assertEqual(cepage.updated_at, stored_cepage.updated_at)
+        self.assertCountEqual(relations, WineTagRelation.objects.filter(wine=wine).values_list("id", "updated_at"))
+
+    def test_update__only_changed_cepages_are_written(self):
+        # Arrange
+        wine = WineFactory(user=self.user)
+        merlot = GrapeMasterFactory(user=self.user, name="Merlot", abbreviation="Me")
+        cabernet_sauvignon = GrapeMasterFactory(user=self.user, name="Cabernet Sauvignon", abbreviation="CS")
+        cabernet_franc = GrapeMasterFactory(user=self.user, name="Cabernet Franc", abbreviation="CF")
+        kept = CepageFactory(wine=wine, grape=merlot, percentage=50.0)
+        changed = CepageFactory(wine=wine, grape=cabernet_sauvignon, percentage=30.0)
+        removed = CepageFactory(wine=wine, grape=cabernet_franc, percentage=20.0)
+
+        params = {
+            **self.default_params,
+            "cepages": [
+                {"name": "Merlot", "abbreviation": "Me", "percentage": "50.0"},
+                {"name": "Cabernet Sauvignon", "abbreviation": "CS", "percentage": "40.0"},
+                {"name": "Petit Verdot", "abbreviation": "PV", "percentage": "10.0"},
+            ],
+        }
+
+        # Act
+        status_code, body = self._make_request(f"{self.base_path}{str(wine.id)}/", self.user, params=params)
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, status_code)
+        self.assertEqual(params["cepages"], body["cepages"])
+
+        cepages = {cepage.name: cepage for cepage in Cepage.objects.filter(wine=wine).select_related("grape")}
+        self.assertEqual({"Merlot", "Cabernet Sauvignon", "Petit Verdot"}, set(cepages.keys()))
+        self.assertEqual(kept.id, cepages["Merlot"].id)
+        self.assertEqual(kept.updated_at, cepages["Merlot"].updated_at)
+        self.assertEqual(changed.id, cepages["Cabernet Sauvignon"].id)
+        self.assertEqual(Decimal("40.0"), cepages["Cabernet Sauvignon"].percentage)
+        self.assertLess(changed.updated_at, cepages["Cabernet Sauvignon"].updated_at)
+        self.assertFalse(Cepage.objects.filter(id=removed.id).exists())
+
+    def test_update__reordered_cepages(self):
+        # Arrange
+        wine = WineFactory(user=self.user)
+        gamay = GrapeMasterFactory(user=self.user, name="Gamay", abbreviation="Ga")
+        pinot_noir = GrapeMasterFactory(user=self.user, name="Pinot Noir", abbreviation="PN")
+        CepageFactory(wine=wine, grape=gamay, percentage=50.0)
+        CepageFactory(wine=wine, grape=pinot_noir, percentage=50.0)
+
+        params = {
+            **self.default_params,
+            "cepages": [
+                {"name": "Pinot Noir", "abbreviation": "PN", "percentage": "50.0"},
+                {"name": "Gamay", "abbreviation": "Ga", "percentage": "50.0"},
+            ],
+        }
+
+        # Act
+        status_code, body = self._make_request(f"{self.base_path}{str(wine.id)}/", self.user, params=params)
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, status_code)
+        self.assertEqual(params["cepages"], body["cepages"])
+
+        client = Client()
+        client.force_login(self.user)
+        listed = client.get(self.base_path).json()["wines"][0]
+        self.assertEqual(params["cepages"], listed["cepages"])
+
+    def test_update__response_is_not_read_back(self):
+        # Arrange
+        cellar = CellarFactory(user=self.user)
+        wine = WineInRackFactory(user=self.user, cellar=cellar, row=1, column=1)
+        CepageFactory(wine=wine, grape=GrapeMasterFactory(user=self.user, name="Merlot"), percentage=100.0)
+        wine.set_tags([WineTagFactory(user=self.user, text="updated_tag2"), WineTagFactory(user=self.user)])
+        params = {
+            **self.default_params,
+            "drunk_at": "2024-01-01",
+            "cellar_id": str(cellar.id),
+            "position": "1-2",
+        }
+        data = self._validate(params)
+
+        # Act
+        with QueryRecorder(connection) as recorder:
+            wine = UpdateWine().execute(user=self.user, wine_id=wine.id, data=data)
+            body = UpdateWineSerializer(wine).data
+
+        # Assert
+        # Every kind of write at once: the cepage is replaced, one tag swapped for another, the wine is drunk, which
+        # updates the in-stock counts of its tags, and moved to another rack. Giving new cepages and tags to a wine
+        # out of cellars takes 19.
+        self.assertEqual(26, len(recorder))
+        stored = Wine.objects.prefetch_cepages().prefetch_tags().select_cellarspace().get_by_id(wine.id)
+        self.assertEqual(UpdateWineSerializer(stored).data, body)
+        self.assertEqual(
+            (params["cepages"], ["updated_tag2", "updated_tag1"], "1-2"),
+            (body["cepages"], body["tag_texts"], body["position"]),
+        )
+
     def test_update__move_to_empty_rack(self):
         # Arrange
         cellar = CellarFactory(user=self.user)
@@ -412,6 +535,12 @@ class TestUpdateWine(TestCase):
 
         return (response.status_code, response.json())
 
+    def _validate(self, params):
+        serializer = UpdateWineSerializer(data=params)
+        serializer.is_valid(raise_exception=True)
+
+        return serializer.validated_data
+
     def _assert_dict_contains_subset(self, expected, actual):
         """
         https://stackoverflow.com/a/47473101
@@ -0,0 +1,213 @@
+import io
+import logging
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import Client, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+
+from llwinecellar.common.test_utils import (
+    CellarFactory,
+    CepageFactory,
+    DrunkWineFactory,
+    GrapeMasterFactory,
+    UserFactory,
+    WineFactory,
+    WineInRackFactory,
+    WineTagFactory,
+)
+from llwinecellar.common.user_data_cache import user_data_cache
+
+from ...models import WineReadModel
+from ...use_cases import DeleteGrapeMaster, DeleteWineTag, ListWine
+
+logger = logging.getLogger(__name__)
+
+
+@override_settings(WINE_READ_MODEL=True)
+class TestWineReadModel(TestCase):
+    maxDiff = None
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.base_path = "/api/wines/"
+        cls.user = UserFactory()
+        cls.cellar = CellarFactory(user=cls.user, layout=[2, 2])
+
+    def test_list__same_body_as_without_read_model(self):
+        # Arrange
+        self._create_wines()
+        paths = [self.base_path, f"{self.base_path}?cellar_id={self.cellar.id}"]
+
+        # Act
+        with override_settings(WINE_READ_MODEL=False):
+            expected = [self._make_request(path, self.user) for path in paths]
+        responses = [self._make_request(path, self.user) for path in paths]
+
+        # Assert
+        self.assertEqual(expected, responses)
+        self.assertEqual([status.HTTP_200_OK] * len(paths), [status_code for status_code, _body in responses])
+
+    def test_list__cellar__same_bytes_as_without_read_model(self):
+        # Arrange
+        self._create_wines()
+        path = f"{self.base_path}?cellar_id={self.cellar.id}"
+        client = Client()
+        client.force_login(self.user)
+
+        # Act
+        with override_settings(WINE_READ_MODEL=False):
+            expected = client.get(path).content
+        response = client.get(path)
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual(expected, response.content)
+
+    def test_list_page__same_body_as_without_read_model(self):
+        # Arrange
+        self._create_wines()
+
+        # Act
+        with override_settings(WINE_READ_MODEL=False):
+            _status_code, expected = self._make_request(f"{self.base_path}?limit=2", self.user)
+            _status_code, expected_next = self._make_request(
+                f"{self.base_path}?limit=2&cursor={expected['next']}", self.user
+            )
+        status_code, body = self._make_request(f"{self.base_path}?limit=2", self.user)
+        _status_code, next_body = self._make_request(f"{self.base_path}?limit=2&cursor={body['next']}", self.user)
+
+        # Assert
+        self.assertEqual(status.HTTP_200_OK, status_code)
+        self.assertEqual(expected, body)
+        self.assertEqual(expected_next, next_body)
+
+    def test_list__one_query(self):
+        # Arrange
+        self._create_wines()
+        ListWine().execute(user=self.user, queries={})
+
+        # Act
+        with CaptureQueriesContext(connection) as context:
+            ListWine().execute(user=self.user, queries={})
+
+        # Assert
+        queries = [
+            query["sql"]
+            for query in context.captured_queries
+            if '"silk_' not in query["sql"] and not query["sql"].startswith("EXPLAIN")
+        ]
+        self.assertEqual(1, len(queries))
+
+    def test_write_use_cases_refresh_documents(self):
+        # Arrange
+        client = Client()
+        client.force_login(self.user)
+        params = {**self._get_create_params(), "tag_texts": ["daily"]}
+
+        # Act
+        created = client.post(self.base_path, params, content_type="application/json").json()
+        client.put(
+            f"{self.base_path}{created['id']}/space/",
+            {"cellar_id": str(self.cellar.id), "row": 2, "column": 1},
+            content_type="application/json",
+        )
+        client.patch(f"{self.base_path}{created['id']}/", {"note": "Opened"}, content_type="application/json")
+        client.delete("/api/wine_tags/", {"tag_text": "daily"}, content_type="application/json")
+
+        # Assert
+        document = WineReadModel.objects.get(wine_id=created["id"]).document
+        self.assertEqual(str(self.cellar.id), document["cellar_id"])
+        self.assertEqual("2-1", document["position"])
+        self.assertEqual("Opened", document["note"])
+        self.assertEqual([], document["tag_texts"])
+
+    def test_write_use_cases__read_model_off__no_documents(self):
+        # Arrange
+        client = Client()
+        client.force_login(self.user)
+
+        # Act
+        with override_settings(WINE_READ_MODEL=False):
+            response = client.post(self.base_path, self._get_create_params(), content_type="application/json")
+
+        # Assert
+        self.assertEqual(status.HTTP_201_CREATED, response.status_code)
+        self.assertFalse(WineReadModel.objects.exists())
+
+    def test_delete_use_cases__read_model_off__wine_ids_not_read(self):
+        # Arrange
+        wine = WineFactory(user=self.user)
+        wine.set_tags([WineTagFactory(user=self.user, text="daily")])
+        grape = GrapeMasterFactory(user=self.user, name="Gamay")
+        CepageFactory(wine=wine, grape=grape, percentage=100.0)
+
+        # Act
+        with override_settings(WINE_READ_MODEL=False), CaptureQueriesContext(connection) as queries:
+            DeleteWineTag().execute(user=self.user, tag_text="daily")
+            DeleteGrapeMaster().execute(user=self.user, grape_master_id=grape.id, force_delete=True)
+
+        # Assert
+        selects = [query["sql"] for query in queries if query["sql"].startswith("SELECT")]
+        id_selects = [sql for sql in selects if '"wines_winetagrelation"' in sql or '"wines_cepage"."wine_id"' in sql]
+        self.assertEqual([], id_selects)
+
+    def test_rebuild_command(self):
+        # Arrange
+        wines = self._create_wines()
+        _wine_different_user = WineFactory()
+
+        # Act
+        stdout = io.StringIO()
+        with mock.patch.object(user_data_cache, "invalidate") as invalidate:
+            call_command("rebuild_wine_read_models", user_id=self.user.id, batch_size=2, stdout=stdout)
+
+        # Assert
+        invalidate.assert_called_once_with(self.user.id)
+        self.assertIn(f"{len(wines)} wine documents rebuilt.", stdout.getvalue())
+        self.assertCountEqual([wine.id for wine in wines], WineReadModel.objects.values_list("wine_id", flat=True))
+
+    """
+    Utility functions
+    """
+
+    def _create_wines(self):
+        """
+        Written by factories, so their documents are rendered on the first read.
+        """
+        pinot_noir = GrapeMasterFactory(user=self.user, name="Pinot Noir")
+        in_rack = WineInRackFactory(row=1, column=1, cellar=self.cellar, user=self.user)
+        CepageFactory(wine=in_rack, grape=pinot_noir, percentage=100.0)
+        in_rack.set_tags([WineTagFactory(user=self.user, text="daily")])
+        return [in_rack, WineFactory(user=self.user), DrunkWineFactory(user=self.user)]
+
+    def _get_create_params(self):
+        return {
+            "name": "Bourgogne Rouge",
+            "producer": "Domaine",
+            "country": "France",
+            "region_1": "Bourgogne",
+            "region_2": "",
+            "region_3": "",
+            "region_4": "",
+            "region_5": "",
+            "cepages": [{"name": "Pinot Noir", "abbreviation": "PN", "percentage": "100.0"}],
+            "vintage": 2020,
+            "bought_at": "2024-01-01",
+            "bought_from": "",
+            "price": 3000,
+            "drunk_at": None,
+            "note": "",
+            "tag_texts": [],
+            "value": None,
+        }
+
+    def _make_request(self, path, user):
+        client = Client()
+        client.force_login(user)
+
+        response = client.get(path)
+
+        return (response.status_code, response.json())
@@ -1,8 +1,14 @@
 from .create_wine import CreateWine
+from .create_wines import CreateWines
 from .delete_wine_tag import DeleteWineTag
+from .export_wines import ExportWines
 from .grape_master import CreateGrapeMaster, DeleteGrapeMaster, ListGrapeMasters
 from .list_wine import ListWine
+from .list_wine_facets import ListWineFacets
+from .list_wine_producers import ListWineProducers
 from .list_wine_regions import ListWineRegions
 from .list_wine_tags import ListWineTags
 from .move_wine import MoveWine
+from .move_wines import MoveWines
+from .partial_update_wine import PartialUpdateWine
 from .update_wine import UpdateWine
@@ -4,9 +4,10 @@ from django.db import transaction
 from rest_framework import exceptions
 
 from cellars.models import CellarSpace
+from llwinecellar.common.user_data_cache import user_data_cache
 from users.models import User
 
-from ..models import Cepage, GrapeMaster, Wine, WineTag
+from ..models import Cepage, GrapeMaster, Wine, WineTag, count_wine_values, refresh_wine_read_models
 
 logger = logging.getLogger(__name__)
 
@@ -19,37 +20,25 @@ class CreateWine:
     def execute(self, user: User, data: dict):
         logger.info(self.__class__.__name__, extra={"user": user, "data": data})
 
-        wine = Wine(
-            name=data["name"],
-            producer=data["producer"],
-            country=data["country"],
-            region_1=data["region_1"],
-            region_2=data["region_2"],
-            region_3=data["region_3"],
-            region_4=data["region_4"],
-            region_5=data["region_5"],
-            vintage=data["vintage"],
-            bought_at=data["bought_at"],
-            bought_from=data["bought_from"],
-            price=data["price"],
-            drunk_at=data["drunk_at"],
-            note=data["note"],
-            user_id=user.id,
-            value=data["value"],
-        )
+        wine = self.build_wine(user, data)
         wine.save()
+        # The response is assembled from what is written here instead of being read back.
+        wine.set_no_relations_prefetched()
+        count_wine_values(user.id, added=[wine.counted_values])
         if len(data["cepages"]) > 0:
-            cepages = []
-            for cepage in data["cepages"]:
-                grape_master = GrapeMaster.objects.get_or_create(
-                    user_id=user.id, name=cepage["name"], abbreviation=cepage["abbreviation"]
-                )[0]
-                cepages.append(Cepage(wine_id=wine.id, grape_id=grape_master.id, percentage=cepage["percentage"]))
+            grapes = GrapeMaster.objects.get_or_create_by_names(
+                user.id, {cepage["name"]: cepage["abbreviation"] for cepage in data["cepages"]}
+            )
+            cepages = [
+                Cepage(wine=wine, grape=grapes[cepage["name"]], percentage=cepage["percentage"])
+                for cepage in data["cepages"]
+            ]
             Cepage.objects.bulk_create(cepages)
+            wine.set_prefetched("cepages", cepages)
 
         if len(tag_texts := data["tag_texts"]) > 0:
-            tags = [WineTag.objects.get_or_create(user_id=user.id, text=text)[0] for text in tag_texts]
-            wine.tags.set(tags)
+            tags = WineTag.objects.get_or_create_by_texts(user.id, tag_texts)
+            wine.set_tags([tags[text] for text in dict.fromkeys(tag_texts)])
 
         if (cellar_id := data.get("cellar_id")) and (position := data.get("position")):
             if not user.has_cellar(cellar_id):
@@ -66,6 +55,31 @@ class CreateWine:
             to_space.wine = wine
             to_space.save(update_fields=["wine_id", "updated_at"])
 
-        wine = Wine.objects.prefetch_cepages().prefetch_tags().get_by_id(wine.id)
+        refresh_wine_read_models([wine.id])
+        user_data_cache.invalidate(user.id)
 
         return wine
+
+    def build_wine(self, user: User, data: dict) -> Wine:
+        """
+        The unsaved Wine of validated data, without its cepages, tags and cellar space. CreateWines builds its wines
+        with it too.
+        """
+        return Wine(
+            name=data["name"],
+            producer=data["producer"],
+            country=data["country"],
+            region_1=data["region_1"],
+            region_2=data["region_2"],
+            region_3=data["region_3"],
+            region_4=data["region_4"],
+            region_5=data["region_5"],
+            vintage=data["vintage"],
+            bought_at=data["bought_at"],
+            bought_from=data["bought_from"],
+            price=data["price"],
+            drunk_at=data["drunk_at"],
+            note=data["note"],
+            user_id=user.id,
+            value=data["value"],
+        )
@@ -0,0 +1,167 @@
+import logging
+from typing import TYPE_CHECKING, Optional
+
+from rest_framework import exceptions
+
+from cellars.enums import CellarSpaceType
+from cellars.models import Cellar, CellarSpace
+from llwinecellar.common.transactions import atomic_with_retry
+from llwinecellar.common.user_data_cache import user_data_cache
+from users.models import User
+
+from ..models import (
+    Cepage,
+    GrapeMaster,
+    Wine,
+    WineTag,
+    WineTagRelation,
+    count_wine_values,
+    refresh_wine_read_models,
+)
+from .create_wine import CreateWine
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+
+class CreateWines:
+    """
+    Batch version of CreateWine, for entering a whole case at once: each item is created `quantity` times.
+    Every position is checked against one locked snapshot of the cellars the items refer to before anything is
+    written, and errors are reported per item, in the shape of DRF's list validation errors. Grapes and tags are
+    resolved once for the batch, and each table is written with one INSERT or UPDATE.
+    """
+
+    def __init__(self):
+        self.exception_log_title = f"{__class__.__name__}_exception"
+
+    @atomic_with_retry()
+    def execute(self, user: User, items: list[dict]) -> list[Wine]:
+        logger.info(self.__class__.__name__, extra={"user": user, "items": items})
+
+        spaces = self._get_spaces(user, items)
+
+        create_wine = CreateWine()
+        wines = []
+        filled_spaces = {}
+        new_baskets = []
+        for item, item_spaces in zip(items, spaces):
+            for index in range(item["quantity"]):
+                wine = create_wine.build_wine(user, item)
+                wines.append(wine)
+                if item_spaces is None:
+                    continue
+                space = item_spaces[index]
+                space.wine = wine
+                if space._state.adding:
+                    new_baskets.append(space)
+                else:
+                    filled_spaces[space.id] = wine.id
+        Wine.objects.bulk_create(wines)
+        CellarSpace.objects.set_wines(filled_spaces)
+        CellarSpace.objects.bulk_create(new_baskets)
+
+        items_of_wines = [item for item in items for _ in range(item["quantity"])]
+        self._create_cepages(user, wines, items_of_wines)
+        self._create_tag_relations(user, wines, items_of_wines)
+
+        count_wine_values(user.id, added=[wine.counted_values for wine in wines])
+        refresh_wine_read_models(wine.id for wine in wines)
+        user_data_cache.invalidate(user.id)
+
+        wines_by_id = (
+            Wine.objects.select_cellarspace().prefetch_cepages().prefetch_tags().in_bulk([wine.id for wine in wines])
+        )
+        return [wines_by_id[wine.id] for wine in wines]
+
+    def _get_spaces(self, user: User, items: list[dict]) -> list[Optional[list[CellarSpace]]]:
+        """
+        The spaces each item's wines go to, or None for items without a position. Baskets that do not exist yet
+        are returned unsaved. Raises a ValidationError with one dict of errors per item if any position is wrong.
+        """
+        cellar_ids = {item["cellar_id"] for item in items if item.get("cellar_id") and item.get("position")}
+        cellars = {cellar.id: cellar for cellar in Cellar.objects.filter_eq_user_id(user.id).filter(id__in=cellar_ids)}
+        # Locks in id order, like MoveWine and MoveWines, so that concurrent writers cannot deadlock.
+        locked = CellarSpace.objects.filter(cellar_id__in=cellars.keys()).select_for_update().order_by("id")
+        racks = {}
+        empty_baskets: dict["UUID", list[CellarSpace]] = {}
+        for space in locked:
+            if space.type == CellarSpaceType.RACK:
+                racks[(space.cellar_id, space.row, space.column)] = space
+            elif space.wine_id is None:
+                empty_baskets.setdefault(space.cellar_id, []).append(space)
+
+        spaces = []
+        errors = []
+        taken_rack_ids = set()
+        for item in items:
+            cellar_id = item.get("cellar_id")
+            position = item.get("position")
+            if not (cellar_id and position):
+                spaces.append(None)
+                errors.append({})
+            elif cellar_id not in cellars:
+                spaces.append(None)
+                errors.append({"cellar_id": "This cellar does not exist."})
+            elif position == "basket":
+                baskets = self._get_empty_baskets(cellars[cellar_id], empty_baskets, item["quantity"])
+                spaces.append(baskets)
+                errors.append({} if baskets else {"position": "This position does not exist."})
+            else:
+                rack = racks.get((cellar_id, *self._parse_rack_position(position)))
+                spaces.append([rack])
+                if rack is None:
+                    errors.append({"position": "This position does not exist."})
+                elif rack.wine_id is not None or rack.id in taken_rack_ids:
+                    errors.append({"position": "That position is already occupied."})
+                else:
+                    taken_rack_ids.add(rack.id)
+                    errors.append({})
+
+        if any(errors):
+            raise exceptions.ValidationError(detail={"wines": errors})
+        return spaces
+
+    def _get_empty_baskets(self, cellar: Cellar, empty_baskets: dict, count: int) -> list[CellarSpace]:
+        """
+        count empty baskets of the cellar: existing ones first, then new ones. Empty if it has no basket.
+        """
+        if not cellar.has_basket:
+            return []
+        available = empty_baskets.get(cellar.id, [])
+        baskets, empty_baskets[cellar.id] = available[:count], available[count:]
+        baskets += [CellarSpace(cellar=cellar, type=CellarSpaceType.BASKET) for _ in range(count - len(baskets))]
+        return baskets
+
+    def _parse_rack_position(self, position: str) -> tuple[Optional[int], Optional[int]]:
+        row, _, column = position.partition("-")
+        try:
+            return int(row), int(column)
+        except ValueError:
+            return None, None
+
+    def _create_cepages(self, user: User, wines: list[Wine], items_of_wines: list[dict]):
+        grapes = GrapeMaster.objects.get_or_create_by_names(
+            user.id,
+            {cepage["name"]: cepage["abbreviation"] for item in items_of_wines for cepage in item["cepages"]},
+        )
+        Cepage.objects.bulk_create(
+            [
+                Cepage(wine_id=wine.id, grape_id=grapes[cepage["name"]].id, percentage=cepage["percentage"])
+                for wine, item in zip(wines, items_of_wines)
+                for cepage in item["cepages"]
+            ]
+        )
+
+    def _create_tag_relations(self, user: User, wines: list[Wine], items_of_wines: list[dict]):
+        texts = [text for item in items_of_wines for text in item["tag_texts"]]
+        tags = WineTag.objects.get_or_create_by_texts(user.id, texts)
+        relations = [
+            WineTagRelation(wine=wine, tag_master=tags[text])
+            for wine, item in zip(wines, items_of_wines)
+            for text in dict.fromkeys(item["tag_texts"])
+        ]
+        WineTagRelation.objects.bulk_create(relations)
+        WineTag.objects.add_counts_of_relations(relations)
@@ -1,10 +1,13 @@
 import logging
 
+from django.conf import settings
+from django.db import transaction
 from rest_framework import exceptions
 
+from llwinecellar.common.user_data_cache import user_data_cache
 from users.models import User
 
-from ..models import WineTag
+from ..models import WineTag, refresh_wine_read_models
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +16,7 @@ class DeleteWineTag:
     def __init__(self):
         self.exception_log_title = f"{__class__.__name__}_exception"
 
+    @transaction.atomic
     def execute(self, user: User, tag_text: str):
         logger.info(self.__class__.__name__, extra={"user": user, "tag_text": tag_text})
 
@@ -21,4 +25,10 @@ class DeleteWineTag:
         if tag_to_delete is None:
             raise exceptions.NotFound()
 
-        return tag_to_delete.delete()
+        # Read only to refresh documents, which are not kept while the read model is off.
+        wine_ids = list(tag_to_delete.wine_set.values_list("id", flat=True)) if settings.WINE_READ_MODEL else []
+        result = tag_to_delete.delete()
+        refresh_wine_read_models(wine_ids)
+        user_data_cache.invalidate(user.id)
+
+        return result
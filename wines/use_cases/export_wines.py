@@ -0,0 +1,35 @@
+import logging
+from typing import TYPE_CHECKING, Iterator, Optional
+
+from users.models import User
+
+from ..models import Wine
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+
+class ExportWines:
+    """
+    Every wine of the user, or of one cellar, with cellar space, tags and cepages, for export_wines and
+    GET /api/wines/export. The wines are read through a server-side cursor, one chunk at a time, so memory use does
+    not grow with the collection.
+    """
+
+    chunk_size = 500
+
+    def __init__(self):
+        self.exception_log_title = f"{__class__.__name__}_exception"
+
+    def execute(self, user: User, cellar_id: Optional["UUID"] = None) -> Iterator[Wine]:
+        logger.info(self.__class__.__name__, extra={"user": user, "cellar_id": cellar_id})
+
+        wines = Wine.objects.filter_eq_user_id(user.id)
+        if cellar_id:
+            wines = wines.filter_eq_cellar_id(cellar_id)
+
+        # Prefetches are applied per chunk.
+        wines = wines.select_cellarspace().prefetch_tags().prefetch_cepages().order_by_created_at_and_id()
+        return wines.iterator(chunk_size=self.chunk_size)
@@ -2,6 +2,7 @@ import logging
 
 from rest_framework.exceptions import ValidationError
 
+from llwinecellar.common.user_data_cache import user_data_cache
 from users.models import User
 
 from ...models import GrapeMaster
@@ -20,5 +21,6 @@ class CreateGrapeMaster:
             raise ValidationError(detail="Grape master with this name already exists.")
 
         grape_master = GrapeMaster.objects.create(**data, user=user)
+        user_data_cache.invalidate(user.id)
 
         return grape_master
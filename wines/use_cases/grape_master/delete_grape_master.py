@@ -1,10 +1,13 @@
 import logging
 
+from django.conf import settings
+from django.db import transaction
 from rest_framework import exceptions
 
+from llwinecellar.common.user_data_cache import user_data_cache
 from users.models import User
 
-from ...models import GrapeMaster
+from ...models import GrapeMaster, refresh_wine_read_models
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +16,7 @@ class DeleteGrapeMaster:
     def __init__(self):
         self.exception_log_title = f"{__class__.__name__}_exception"
 
+    @transaction.atomic
     def execute(self, user: User, grape_master_id: str, force_delete: bool):
         logger.info(
             self.__class__.__name__, extra={"user": user, "tag_text": grape_master_id, "force_delete": force_delete}
@@ -23,10 +27,13 @@ class DeleteGrapeMaster:
         if grape_to_delete is None:
             return
 
-        if grape_to_delete.cepages.exists():
-            if force_delete:
-                return grape_to_delete.delete()
-            else:
-                raise exceptions.ValidationError(detail="Assigned grape, use force_delete.")
+        if grape_to_delete.cepages.exists() and not force_delete:
+            raise exceptions.ValidationError(detail="Assigned grape, use force_delete.")
 
-        return grape_to_delete.delete()
+        # Read only to refresh documents, which are not kept while the read model is off.
+        wine_ids = list(grape_to_delete.cepages.values_list("wine_id", flat=True)) if settings.WINE_READ_MODEL else []
+        result = grape_to_delete.delete()
+        refresh_wine_read_models(wine_ids)
+        user_data_cache.invalidate(user.id)
+
+        return result
@@ -1,5 +1,7 @@
 import logging
+from typing import Optional
 
+from llwinecellar.common.user_data_cache import user_data_cache
 from users.models import User
 
 from ...models import GrapeMaster
@@ -11,9 +13,16 @@ class ListGrapeMasters:
     def __init__(self):
         self.exception_log_title = f"{__class__.__name__}_exception"
 
-    def execute(self, user: User):
-        logger.info(self.__class__.__name__, extra={"user": user})
+    def execute(self, user: User, q: Optional[str] = None, limit: Optional[int] = None):
+        logger.info(self.__class__.__name__, extra={"user": user, "q": q, "limit": limit})
 
-        grape_masters = GrapeMaster.objects.filter_eq_user_id(user.id).all()
+        return user_data_cache.get_or_set(
+            user.id, self.__class__.__name__, {"q": q, "limit": limit}, lambda: self._list_grapes(user, q, limit)
+        )
 
-        return grape_masters
+    def _list_grapes(self, user: User, q: Optional[str], limit: Optional[int]) -> list[GrapeMaster]:
+        grapes = GrapeMaster.objects.filter_eq_user_id(user.id)
+        if q:
+            grapes = grapes.search(q)
+
+        return list(grapes[:limit])
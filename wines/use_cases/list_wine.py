@@ -1,14 +1,21 @@
+import itertools
 import logging
-import uuid
-from typing import TYPE_CHECKING, TypedDict
+from typing import TYPE_CHECKING, Iterable, Optional, TypedDict
+
+from django.conf import settings
+from django.db.models import Prefetch, Q
 
 from cellars.enums import CellarSpaceType
 from cellars.models import CellarSpace
+from llwinecellar.common.user_data_cache import user_data_cache
 from users.models import User
 
-from ..models import Wine
+from ..enums import CepageMatch
+from ..models import Cepage, Wine, WineReadModel, WineTag, refresh_wine_read_models
+from ..serializers import WineListItemSerializer
 
 if TYPE_CHECKING:
+    from datetime import datetime
     from uuid import UUID
 
     from ..models.wine import WineQuerySet
@@ -29,12 +36,27 @@ if TYPE_CHECKING:
         region_4: str
         region_5: str
         cepage_names: list[str]
+        cepage_match: str
+        limit: int
+        cursor: "WineCursor"
+        stream: bool
+        grid: bool
+
+    class WineCursor(TypedDict):
+        created_at: "datetime"
+        id: "UUID"
+
+    class ListWinePage(TypedDict):
+        wines: list[Wine]
+        next: Optional[WineCursor]
 
 
 logger = logging.getLogger(__name__)
 
 
 class ListWine:
+    stream_chunk_size = 500
+
     def __init__(self):
         self.exception_log_title = f"{__class__.__name__}_exception"
 
@@ -61,7 +83,51 @@ class ListWine:
     def execute(self, user: User, queries: "ListWineQuery"):
         logger.info(self.__class__.__name__, extra={"user": user, "queries": queries})
 
-        qs = Wine.objects.filter_eq_user_id(user.id).select_cellarspace()
+        if queries.get("stream"):
+            return self._list_wines(user, queries)
+
+        return user_data_cache.get_or_set(
+            user.id, self.__class__.__name__, queries, lambda: self._list_wines(user, queries)
+        )
+
+    def reads_documents(self, queries: "ListWineQuery") -> bool:
+        """
+        Whether execute returns WineReadModel documents, already rendered, instead of Wine instances.
+        Streams and grids are always read from Wine.
+        """
+        return settings.WINE_READ_MODEL and not queries.get("stream") and not queries.get("grid")
+
+    def _list_wines(self, user: User, queries: "ListWineQuery"):
+        documents = self.reads_documents(queries)
+        qs = self._filter_wines(user, queries)
+        cellar_id = queries.get("cellar_id")
+
+        if limit := queries.get("limit"):
+            return self._get_page(qs, limit, queries.get("cursor"), documents)
+
+        if cellar_id and queries.get("grid"):
+            return self._get_cellar_grid(qs, cellar_id, queries.get("stream", False))
+
+        stream = queries.get("stream", False)
+        if documents:
+            wines = [document for _created_at, _id, document in self._get_documents(qs.order_by("created_at"))]
+        else:
+            wines = qs.select_cellarspace().prefetch_tags().prefetch_cepages().order_by("created_at")
+            if stream:
+                # Prefetches are applied per chunk.
+                wines = wines.iterator(chunk_size=self.stream_chunk_size)
+            else:
+                wines = wines.all()
+
+        if cellar_id and not queries.get("is_drunk"):
+            return self._get_wines_with_empty_racks(wines, cellar_id, stream, documents)
+        elif stream:
+            return wines
+        else:
+            return list(wines)
+
+    def _filter_wines(self, user: User, queries: "ListWineQuery") -> "WineQuerySet":
+        qs = Wine.objects.filter_eq_user_id(user.id)
 
         if cellar_id := queries.get("cellar_id"):
             qs = qs.filter_eq_cellar_id(cellar_id)
@@ -76,8 +142,8 @@ class ListWine:
             qs = qs.filter_eq_name_or_producer(name_or_producer)
 
         if cepage_names := queries.get("cepage_names"):
-            for cepage_name in cepage_names:
-                qs = qs.filter(cepages__grape__name=cepage_name)
+            match_all = queries.get("cepage_match", CepageMatch.ALL) == CepageMatch.ALL
+            qs = qs.filter_has_grapes(user.id, cepage_names, match_all=match_all)
 
         if (out_of_cellars := queries.get("out_of_cellars")) is not None:
             qs = qs.filter_eq_cellarspace__isnull(out_of_cellars)
@@ -86,12 +152,7 @@ class ListWine:
         qs = self._filter_by_drunk_status(qs, queries)
         qs = self._filter_by_drunk_at(qs, queries)
 
-        wines = qs.prefetch_tags().prefetch_cepages().order_by("created_at").all()
-
-        if cellar_id and not queries.get("is_drunk"):
-            return self._get_wines_with_empty_racks(wines, cellar_id)
-        else:
-            return wines
+        return qs
 
     def _filter_by_regions(self, qs: "WineQuerySet", queries: "ListWineQuery") -> "WineQuerySet":
         if country := queries.get("country"):
@@ -136,22 +197,93 @@ class ListWine:
 
         return qs
 
-    def _get_wines_with_empty_racks(self, wines: "WineQuerySet", cellar_id: "UUID"):
+    def _get_page(
+        self, qs: "WineQuerySet", limit: int, cursor: Optional["WineCursor"], documents: bool = False
+    ) -> "ListWinePage":
+        """
+        Keyset pagination over (created_at, id). Empty racks are not included.
+        """
+        if cursor:
+            qs = qs.filter_after_cursor(cursor["created_at"], cursor["id"])
+        qs = qs.order_by_created_at_and_id()[: limit + 1]
+
+        if documents:
+            rows = self._get_documents(qs)
+            wines = [document for _created_at, _id, document in rows]
+            keys = [(created_at, id) for created_at, id, _document in rows]
+        else:
+            wines = list(qs.select_cellarspace().prefetch_tags().prefetch_cepages())
+            keys = [(wine.created_at, wine.id) for wine in wines]
+
+        if len(wines) > limit:
+            wines = wines[:limit]
+            created_at, id = keys[limit - 1]
+            next = {"created_at": created_at, "id": id}
+        else:
+            next = None
+
+        return {"wines": wines, "next": next}
+
+    def _get_documents(self, qs: "WineQuerySet") -> list[tuple["datetime", "UUID", dict]]:
+        """
+        (created_at, id, document) of the wines, in one query joining WineReadModel on its primary key.
+        Wines written before the read model was turned on get their documents rendered here. Keys are put back in
+        the order of WineListItemSerializer.
+        """
+        rows = list(qs.values_list("created_at", "id", "read_model__document"))
+        if missing_ids := [id for _created_at, id, document in rows if document is None]:
+            refresh_wine_read_models(missing_ids)
+            documents = dict(WineReadModel.objects.filter(wine_id__in=missing_ids).values_list("wine_id", "document"))
+            rows = [(created_at, id, document or documents[id]) for created_at, id, document in rows]
+        from_document = WineListItemSerializer().from_document
+        return [(created_at, id, from_document(document)) for created_at, id, document in rows]
+
+    def _get_wines_with_empty_racks(
+        self, wines: Iterable[Wine], cellar_id: "UUID", stream: bool = False, documents: bool = False
+    ):
+        """
+        With documents, the empty racks are rendered here like the documents, as the view passes both through as is.
+        """
         empty_racks = (
             CellarSpace.objects.filter(cellar_id=cellar_id)
             .filter_by_type(CellarSpaceType.RACK)
             .filter_empty()
             .order_by_position()
         )
-        return (
-            *wines,
-            *(
-                {
-                    **self.empty_rack,
-                    "id": uuid.uuid4(),
-                    "cellar_id": cellar_id,
-                    "position": f"{rack.row}-{rack.column}",
-                }
-                for rack in empty_racks
-            ),
+        empty_rack_dicts = (self._get_empty_rack(rack) for rack in empty_racks)
+        if documents:
+            to_representation = WineListItemSerializer().to_representation
+            empty_rack_dicts = (to_representation(rack) for rack in empty_rack_dicts)
+        if stream:
+            return itertools.chain(wines, empty_rack_dicts)
+        return (*wines, *empty_rack_dicts)
+
+    def _get_cellar_grid(self, wines: "WineQuerySet", cellar_id: "UUID", stream: bool = False):
+        """
+        Occupied and empty slots of the cellar in (row, column) order, from one LEFT JOIN of CellarSpace to Wine.
+        Basket wines come after the racks. Empty baskets are skipped, as in the default listing.
+        """
+        spaces = (
+            CellarSpace.objects.filter(cellar_id=cellar_id)
+            .filter(Q(wine__isnull=True, type=CellarSpaceType.RACK) | Q(wine_id__in=wines.values("id")))
+            .select_related("wine")
+            .prefetch_related(
+                Prefetch("wine__tags", queryset=WineTag.objects.order_by_attached_at()),
+                Prefetch("wine__cepages", queryset=Cepage.objects.order_by("created_at")),
+                "wine__cepages__grape",
+            )
+            .order_by_position()
         )
+        if stream:
+            spaces = spaces.iterator(chunk_size=self.stream_chunk_size)
+            return (space.wine if space.wine_id else self._get_empty_rack(space) for space in spaces)
+        return [space.wine if space.wine_id else self._get_empty_rack(space) for space in spaces]
+
+    def _get_empty_rack(self, rack: CellarSpace) -> dict:
+        # The id of the space keeps responses byte-stable between requests.
+        return {
+            **self.empty_rack,
+            "id": rack.id,
+            "cellar_id": rack.cellar_id,
+            "position": f"{rack.row}-{rack.column}",
+        }
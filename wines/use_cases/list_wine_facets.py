@@ -0,0 +1,83 @@
+import logging
+from typing import TYPE_CHECKING
+
+from django.db.models import Count, Q
+
+from llwinecellar.common.user_data_cache import user_data_cache
+from users.models import User
+
+from ..enums import Country
+from ..models import Cepage, WineTagRelation
+from .list_wine import ListWine
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+
+    from .list_wine import ListWineQuery
+
+logger = logging.getLogger(__name__)
+
+
+class ListWineFacets(ListWine):
+    """
+    Counts of the wines ListWine would return, per country, region_1, cepage, tag, drunk status and cellar.
+    Every dimension is one grouped aggregate over the filtered wines, so the number of queries does not depend on
+    how many values there are. Pagination, stream and grid queries do not change the set of wines and are ignored.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.exception_log_title = f"{__class__.__name__}_exception"
+
+    def execute(self, user: User, queries: "ListWineQuery"):
+        logger.info(self.__class__.__name__, extra={"user": user, "queries": queries})
+
+        queries = {key: value for key, value in queries.items() if key not in ("limit", "cursor", "stream", "grid")}
+        return user_data_cache.get_or_set(
+            user.id, self.__class__.__name__, queries, lambda: self._list_facets(user, queries)
+        )
+
+    def _list_facets(self, user: User, queries: "ListWineQuery") -> dict:
+        wines = self._filter_wines(user, queries)
+        wine_ids = wines.values("id")
+
+        stock = wines.aggregate(
+            total=Count("id", distinct=True),
+            drunk=Count("id", distinct=True, filter=Q(drunk_at__isnull=False)),
+        )
+
+        return {
+            "total": stock["total"],
+            "country": [
+                {"value": Country(row["_country"]).label if row["_country"] else None, "count": row["count"]}
+                for row in self._count_by(wines, "_country")
+            ],
+            "region_1": [
+                {"value": row["region_1"], "count": row["count"]}
+                for row in self._count_by(wines.exclude(region_1=""), "region_1")
+            ],
+            "cepage": [
+                {"value": row["grape__name"], "count": row["count"]}
+                for row in self._count_by(Cepage.objects.filter(wine_id__in=wine_ids), "grape__name", counted="wine")
+            ],
+            "tag": [
+                {"value": row["tag_master__text"], "count": row["count"]}
+                for row in self._count_by(
+                    WineTagRelation.objects.filter(wine_id__in=wine_ids), "tag_master__text", counted="wine"
+                )
+            ],
+            "stock": {"drunk": stock["drunk"], "in_stock": stock["total"] - stock["drunk"]},
+            "cellar": [
+                {"id": row["cellarspace__cellar_id"], "name": row["cellarspace__cellar__name"], "count": row["count"]}
+                for row in self._count_by(wines, "cellarspace__cellar_id", "cellarspace__cellar__name")
+            ],
+        }
+
+    def _count_by(self, qs: "QuerySet", *fields: str, counted: str = "id") -> list[dict]:
+        """
+        Counts distinct wines per value of fields, so that a wine reached through more than one joined row, such as
+        two cepages of the same grape, is counted once.
+        """
+        return list(
+            qs.order_by().values(*fields).annotate(count=Count(counted, distinct=True)).order_by("-count", fields[0])
+        )
@@ -0,0 +1,27 @@
+import logging
+from typing import Optional
+
+from llwinecellar.common.user_data_cache import user_data_cache
+from users.models import User
+
+from ..models import WineProducer
+
+logger = logging.getLogger(__name__)
+
+
+class ListWineProducers:
+    def __init__(self):
+        self.exception_log_title = f"{__class__.__name__}_exception"
+
+    def execute(self, user: User, q: Optional[str] = None, limit: Optional[int] = None):
+        logger.info(self.__class__.__name__, extra={"user": user, "q": q, "limit": limit})
+
+        return user_data_cache.get_or_set(
+            user.id, self.__class__.__name__, {"q": q, "limit": limit}, lambda: self._list_producers(user, q, limit)
+        )
+
+    def _list_producers(self, user: User, q: Optional[str], limit: Optional[int]) -> list[str]:
+        producers = WineProducer.objects.filter_eq_user_id(user.id)
+        producers = producers.search(q) if q else producers.order_by_label()
+
+        return list(producers.values_list("label", flat=True)[:limit])
@@ -1,9 +1,10 @@
 import logging
+from typing import Optional
 
+from llwinecellar.common.user_data_cache import user_data_cache
 from users.models import User
 
-from ..enums import Country
-from ..models import Wine
+from ..models import WineRegion
 
 logger = logging.getLogger(__name__)
 
@@ -12,23 +13,20 @@ class ListWineRegions:
     def __init__(self):
         self.exception_log_title = f"{__class__.__name__}_exception"
 
-    def execute(self, user: User):
-        logger.info(self.__class__.__name__, extra={"user": user})
+    def execute(self, user: User, prefix: Optional[str] = None, q: Optional[str] = None, limit: Optional[int] = None):
+        logger.info(self.__class__.__name__, extra={"user": user, "prefix": prefix, "q": q, "limit": limit})
 
-        region_values = (
-            Wine.objects.filter_eq_user_id(user.id)
-            .values("_country_str", "region_1", "region_2", "region_3", "region_4", "region_5")
-            .distinct()
+        return user_data_cache.get_or_set(
+            user.id,
+            self.__class__.__name__,
+            {"prefix": prefix, "q": q, "limit": limit},
+            lambda: self._list_regions(user, prefix, q, limit),
         )
 
-        regions = sorted(
-            [
-                f"{Country[r['_country_str']].label}>{r['region_1']}>{r['region_2']}>{r['region_3']}>{r['region_4']}>{r['region_5']}".strip(
-                    ">"
-                )
-                for r in region_values
-                if r["_country_str"]
-            ]
-        )
+    def _list_regions(self, user: User, prefix: Optional[str], q: Optional[str], limit: Optional[int]) -> list[str]:
+        regions = WineRegion.objects.filter_eq_user_id(user.id)
+        if prefix:
+            regions = regions.filter_startswith_label(prefix)
+        regions = regions.search(q) if q else regions.order_by_label()
 
-        return regions
+        return list(regions.values_list("label", flat=True)[:limit])
@@ -1,5 +1,7 @@
 import logging
+from typing import Optional, Union
 
+from llwinecellar.common.user_data_cache import user_data_cache
 from users.models import User
 
 from ..models import WineTag
@@ -11,7 +13,25 @@ class ListWineTags:
     def __init__(self):
         self.exception_log_title = f"{__class__.__name__}_exception"
 
-    def execute(self, user: User):
-        logger.info(self.__class__.__name__, extra={"user": user})
+    def execute(self, user: User, q: Optional[str] = None, limit: Optional[int] = None, with_counts: bool = False):
+        logger.info(self.__class__.__name__, extra={"user": user, "q": q, "limit": limit, "with_counts": with_counts})
 
-        return WineTag.objects.filter_eq_user_id(user.id).order_by_text().values_list("text", flat=True)
+        return user_data_cache.get_or_set(
+            user.id,
+            self.__class__.__name__,
+            {"q": q, "limit": limit, "with_counts": with_counts},
+            lambda: self._list_tags(user, q, limit, with_counts),
+        )
+
+    def _list_tags(
+        self, user: User, q: Optional[str], limit: Optional[int], with_counts: bool
+    ) -> Union[list[str], list[dict]]:
+        """
+        Texts, or with_counts dicts of text, wine_count and in_stock_count read from the tags' counters.
+        """
+        tags = WineTag.objects.filter_eq_user_id(user.id)
+        tags = tags.search(q) if q else tags.order_by_text()
+
+        if with_counts:
+            return list(tags.values("text", "wine_count", "in_stock_count")[:limit])
+        return list(tags.values_list("text", flat=True)[:limit])
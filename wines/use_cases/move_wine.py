@@ -5,9 +5,11 @@ from rest_framework import exceptions
 
 from cellars.enums import CellarSpaceType
 from cellars.models import CellarSpace
+from llwinecellar.common.transactions import RetryableConflict, atomic_with_retry
+from llwinecellar.common.user_data_cache import user_data_cache
 from users.models import User
 
-from ..models import Wine
+from ..models import Wine, refresh_wine_read_models
 
 if TYPE_CHECKING:
     from uuid import UUID
@@ -18,17 +20,23 @@ class MoveWine:
     def __init__(self):
         self.exception_log_title = f"{__class__.__name__}_exception"
 
+    @atomic_with_retry()
     def execute(self, user: User, wine_id: str, data: dict):
+        """
+        Locks the wine, then only the affected spaces in id order, so concurrent moves neither interleave nor
+        deadlock. Spaces are re-read under the lock; if another move got there first, the whole move is retried.
+        """
         logger.info(self.__class__.__name__, extra={"user": user, "wine_id": wine_id, "data": data})
 
-        wine = Wine.objects.filter_eq_user_id(user.id).select_cellarspace().get_by_id(wine_id)
+        # NO KEY UPDATE does not block the FK checks of other moves placing this wine, e.g. when swapping it.
+        wine = Wine.objects.filter_eq_user_id(user.id).select_for_update(no_key=True).get_by_id(wine_id)
         if not wine:
             raise exceptions.NotFound
 
         if data["cellar_id"] and not user.has_cellar(data["cellar_id"]):
             raise exceptions.NotFound
 
-        from_space: Optional[CellarSpace] = wine.cellarspace if hasattr(wine, "cellarspace") else None
+        from_space: Optional[CellarSpace] = CellarSpace.objects.get_by_wine_id(wine.id)
 
         is_from_basket = from_space is not None and from_space.type == CellarSpaceType.BASKET
         is_to_basket = data["row"] is None and data["column"] is None and data["cellar_id"] is not None
@@ -45,6 +53,8 @@ class MoveWine:
             if to_space is None:
                 raise exceptions.NotFound
 
+        from_space, to_space = self._lock(wine, from_space, to_space, is_to_basket)
+
         plans = [
             {
                 "id": wine.id,
@@ -56,6 +66,8 @@ class MoveWine:
         ]
 
         if plans[0]["to_space"] and (other_wine_id := plans[0]["to_space"].wine_id):
+            if other_wine_id == wine.id:
+                return []
             plans.append(
                 {
                     "id": other_wine_id,
@@ -73,8 +85,31 @@ class MoveWine:
             if plan["to_space"]:
                 self._place_wine(plan["id"], plan["to_space"])
 
+        refresh_wine_read_models(plan["id"] for plan in plans)
+        user_data_cache.invalidate(user.id)
+
         return plans
 
+    def _lock(
+        self, wine: Wine, from_space: Optional[CellarSpace], to_space: Optional[CellarSpace], is_to_basket: bool
+    ) -> tuple[Optional[CellarSpace], Optional[CellarSpace]]:
+        """
+        Locks from_space and to_space in id order and returns their current state.
+        Raises RetryableConflict when a concurrent move changed them since they were read.
+        """
+        space_ids = [space.id for space in (from_space, to_space) if space is not None]
+        locked = {space.id: space for space in CellarSpace.objects.lock_by_ids(space_ids)}
+
+        if from_space is not None:
+            from_space = locked[from_space.id]
+            if from_space.wine_id != wine.id:
+                raise RetryableConflict
+        if to_space is not None and to_space.id in locked:
+            to_space = locked[to_space.id]
+            if is_to_basket and to_space.wine_id is not None:
+                raise RetryableConflict
+        return from_space, to_space
+
     def _take_wine_out(self, space: Optional[CellarSpace]):
         space.wine_id = None
         space.save(update_fields=["wine_id", "updated_at"])
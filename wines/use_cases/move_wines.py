@@ -0,0 +1,182 @@
+import logging
+from typing import TYPE_CHECKING, Optional
+
+from django.db.models import Q
+from rest_framework import exceptions
+
+from cellars.enums import CellarSpaceType
+from cellars.models import Cellar, CellarSpace
+from llwinecellar.common.transactions import RetryableConflict, atomic_with_retry
+from llwinecellar.common.user_data_cache import user_data_cache
+from users.models import User
+
+from ..models import Wine, refresh_wine_read_models
+
+if TYPE_CHECKING:
+    from uuid import UUID
+logger = logging.getLogger(__name__)
+
+
+class MoveWines:
+    """
+    Batch version of MoveWine. Moves are applied in order with the same rules (moving onto an occupied rack swaps
+    the two wines), against one snapshot of the affected cellar spaces held in memory, so chains and swaps resolve
+    without touching the database. Only spaces whose wine changed are written.
+
+    As in MoveWine, the moved wines are locked first, then only the spaces a move can touch, in id order: the
+    spaces of the moved wines, the target racks and the baskets of the target cellars. A wine displaced by a move
+    ends up in one of those spaces, so the snapshot covers every chain of moves. A moved wine that a concurrent move
+    displaced into another space is missing from the snapshot; the whole batch is then retried.
+    """
+
+    def __init__(self):
+        self.exception_log_title = f"{__class__.__name__}_exception"
+
+    @atomic_with_retry()
+    def execute(self, user: User, moves: list[dict]):
+        logger.info(self.__class__.__name__, extra={"user": user, "moves": moves})
+
+        cellars = {cellar.id: cellar for cellar in Cellar.objects.filter_eq_user_id(user.id)}
+        wine_ids = {move["id"] for move in moves}
+        # NO KEY UPDATE, as in MoveWine, does not block the FK checks of moves placing these wines.
+        wines = Wine.objects.filter_eq_user_id(user.id).filter(id__in=wine_ids).select_for_update(no_key=True)
+        if len(wines.order_by("id")) != len(wine_ids):
+            raise exceptions.NotFound(detail={"id": "This wine does not exist."})
+
+        spaces = (
+            CellarSpace.objects.filter_eq_user_id(user.id)
+            .filter(self._get_affected_spaces(moves))
+            .select_for_update(of=("self",))
+            .order_by("id")
+        )
+        snapshot = _SpaceSnapshot(list(spaces), cellars)
+        if outside := wine_ids - snapshot.space_of_wine.keys():
+            if CellarSpace.objects.filter(wine_id__in=outside).exists():
+                raise RetryableConflict
+        moved_wine_ids = {}
+        for move in moves:
+            for wine_id in snapshot.move(move):
+                moved_wine_ids[wine_id] = None
+
+        self._save(snapshot)
+
+        refresh_wine_read_models(moved_wine_ids)
+        user_data_cache.invalidate(user.id)
+
+        return [
+            self._get_response_dict(wine_id, snapshot.space_of_wine.get(wine_id))
+            for wine_id in moved_wine_ids
+            if snapshot.has_moved(wine_id)
+        ]
+
+    def _get_affected_spaces(self, moves: list[dict]) -> Q:
+        basket_cellar_ids = set()
+        affected = Q(wine_id__in=[move["id"] for move in moves])
+        for move in moves:
+            if move["cellar_id"] is None:
+                continue
+            if move["row"] is None and move["column"] is None:
+                basket_cellar_ids.add(move["cellar_id"])
+            else:
+                affected |= Q(cellar_id=move["cellar_id"], row=move["row"], column=move["column"])
+        if basket_cellar_ids:
+            affected |= Q(cellar_id__in=basket_cellar_ids, type=CellarSpaceType.BASKET)
+        return affected
+
+    def _save(self, snapshot: "_SpaceSnapshot"):
+        """
+        Writes in two UPDATEs: spaces that lose their wine are emptied first, because the unique constraint on
+        CellarSpace.wine is checked row by row and a swap would collide within a single statement.
+        """
+        original_wine_ids = snapshot.original_wine_ids
+        changed = [space for space in snapshot.spaces if space.wine_id != original_wine_ids[space.id]]
+
+        CellarSpace.objects.set_wines({space.id: None for space in changed if original_wine_ids[space.id] is not None})
+        if new_baskets := [basket for basket in snapshot.new_baskets if basket.wine_id]:
+            CellarSpace.objects.bulk_create(new_baskets)
+        CellarSpace.objects.set_wines({space.id: space.wine_id for space in changed if space.wine_id})
+
+    def _get_response_dict(self, wine_id: "UUID", space: Optional[CellarSpace]) -> dict:
+        return {
+            "id": wine_id,
+            "cellar_id": space.cellar_id if space else None,
+            "row": space.row if space else None,
+            "column": space.column if space else None,
+        }
+
+
+class _SpaceSnapshot:
+    """
+    The user's cellar spaces, indexed for applying moves in memory.
+    """
+
+    def __init__(self, spaces: list[CellarSpace], cellars: dict["UUID", Cellar]):
+        self.spaces = spaces
+        self.cellars = cellars
+        self.original_wine_ids = {space.id: space.wine_id for space in spaces}
+        self.original_space_ids = {space.wine_id: space.id for space in spaces if space.wine_id}
+        self.space_of_wine = {space.wine_id: space for space in spaces if space.wine_id}
+        self.racks = {(space.cellar_id, space.row, space.column): space for space in spaces if self._is_rack(space)}
+        self.empty_baskets: dict["UUID", list[CellarSpace]] = {}
+        for space in spaces:
+            if not self._is_rack(space) and space.wine_id is None:
+                self.empty_baskets.setdefault(space.cellar_id, []).append(space)
+        self.new_baskets: list[CellarSpace] = []
+
+    def move(self, move: dict) -> list["UUID"]:
+        """
+        Applies one move and returns the ids of the wines it relocated.
+        """
+        wine_id = move["id"]
+        cellar_id = move["cellar_id"]
+        from_space = self.space_of_wine.get(wine_id)
+
+        if cellar_id is not None and cellar_id not in self.cellars:
+            raise exceptions.NotFound(detail={"cellar_id": "This cellar does not exist."})
+        if cellar_id is None:
+            to_space = None
+        elif move["row"] is None and move["column"] is None:
+            if from_space is not None and not self._is_rack(from_space) and from_space.cellar_id == cellar_id:
+                return []
+            to_space = self._get_empty_basket(self.cellars[cellar_id])
+        else:
+            to_space = self.racks.get((cellar_id, move["row"], move["column"]))
+        if cellar_id is not None and to_space is None:
+            raise exceptions.NotFound(detail={"position": "This position does not exist."})
+        if to_space is from_space:
+            return []
+
+        displaced_wine_id = to_space.wine_id if to_space else None
+        if from_space:
+            self._set_wine(from_space, displaced_wine_id)
+        if to_space:
+            self._set_wine(to_space, wine_id)
+        if from_space is None and displaced_wine_id:
+            del self.space_of_wine[displaced_wine_id]
+        if to_space is None:
+            del self.space_of_wine[wine_id]
+
+        return [wine_id, displaced_wine_id] if displaced_wine_id else [wine_id]
+
+    def has_moved(self, wine_id: "UUID") -> bool:
+        space = self.space_of_wine.get(wine_id)
+        return self.original_space_ids.get(wine_id) != (space.id if space else None)
+
+    def _set_wine(self, space: CellarSpace, wine_id: Optional["UUID"]):
+        space.wine_id = wine_id
+        if wine_id:
+            self.space_of_wine[wine_id] = space
+        elif not self._is_rack(space):
+            self.empty_baskets.setdefault(space.cellar_id, []).append(space)
+
+    def _get_empty_basket(self, cellar: Cellar) -> Optional[CellarSpace]:
+        if not cellar.has_basket:
+            return None
+        if empty_baskets := self.empty_baskets.get(cellar.id):
+            return empty_baskets.pop()
+        basket = CellarSpace(cellar_id=cellar.id, type=CellarSpaceType.BASKET)
+        self.new_baskets.append(basket)
+        return basket
+
+    def _is_rack(self, space: CellarSpace) -> bool:
+        return space.type == CellarSpaceType.RACK
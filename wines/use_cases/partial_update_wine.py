@@ -0,0 +1,82 @@
+import logging
+
+from django.db import transaction
+from rest_framework import exceptions
+
+from llwinecellar.common.user_data_cache import user_data_cache
+from users.models import User
+
+from ..models import Wine, count_wine_values, refresh_wine_read_models
+from .update_wine import UpdateWine
+
+logger = logging.getLogger(__name__)
+
+
+class PartialUpdateWine(UpdateWine):
+    """
+    Updates only the fields present in data: one UPDATE of just those columns, and cepages, tags and the
+    cellar space only when they are given. The wine is still read with its cellar space, cepages and tags, which
+    the response renders.
+    """
+
+    wine_fields = (
+        "name",
+        "producer",
+        "region_1",
+        "region_2",
+        "region_3",
+        "region_4",
+        "region_5",
+        "vintage",
+        "bought_at",
+        "bought_from",
+        "price",
+        "drunk_at",
+        "note",
+        "value",
+    )
+
+    def __init__(self):
+        self.exception_log_title = f"{__class__.__name__}_exception"
+
+    @transaction.atomic
+    def execute(self, user: User, wine_id: str, data: dict):
+        logger.info(self.__class__.__name__, extra={"user": user, "wine_id": wine_id, "data": data})
+
+        wine = (
+            Wine.objects.filter_eq_user_id(user.id)
+            .select_cellarspace()
+            .prefetch_cepages()
+            .prefetch_tags()
+            .get_by_id(wine_id)
+        )
+
+        if wine is None:
+            raise exceptions.NotFound()
+        counted_values = wine.counted_values
+        was_in_stock = wine.is_in_stock
+
+        update_fields = []
+        for field in self.wine_fields:
+            if field in data:
+                setattr(wine, field, data[field])
+                update_fields.append(field)
+        if "country" in data:
+            wine.country = data["country"]
+            update_fields.extend(["_country", "_country_str"])
+        if update_fields:
+            wine.save(update_fields=[*update_fields, "updated_at"])
+            count_wine_values(user.id, added=[wine.counted_values], removed=[counted_values])
+            wine.count_in_stock_change(was_in_stock)
+
+        if "cepages" in data:
+            self._set_cepages(user, wine, data["cepages"])
+        if "tag_texts" in data:
+            self._set_tags(user, wine, data["tag_texts"])
+        if "cellar_id" in data:
+            self._move(user, wine, data)
+
+        refresh_wine_read_models([wine.id])
+        user_data_cache.invalidate(user.id)
+
+        return wine
@@ -4,9 +4,10 @@ from django.db import transaction
 from rest_framework import exceptions
 
 from cellars.models import CellarSpace
+from llwinecellar.common.user_data_cache import user_data_cache
 from users.models import User
 
-from ..models import Cepage, GrapeMaster, Wine, WineTag
+from ..models import GrapeMaster, Wine, WineTag, count_wine_values, refresh_wine_read_models
 
 logger = logging.getLogger(__name__)
 
@@ -19,10 +20,19 @@ class UpdateWine:
     def execute(self, user: User, wine_id: str, data: dict):
         logger.info(self.__class__.__name__, extra={"user": user, "wine_id": wine_id, "data": data})
 
-        wine = Wine.objects.filter_eq_user_id(user.id).select_cellarspace().get_by_id(wine_id)
+        # Prefetched, so that the writes below keep them current and the response needs no read back.
+        wine = (
+            Wine.objects.filter_eq_user_id(user.id)
+            .select_cellarspace()
+            .prefetch_cepages()
+            .prefetch_tags()
+            .get_by_id(wine_id)
+        )
 
         if wine is None:
             raise exceptions.NotFound()
+        counted_values = wine.counted_values
+        was_in_stock = wine.is_in_stock
 
         wine.name = data["name"]
         wine.producer = data["producer"]
@@ -41,26 +51,37 @@ class UpdateWine:
         wine.value = data["value"]
 
         wine.save()
-        wine.cepages.all().delete()
-        if len(data["cepages"]) > 0:
-            cepages = []
-            for cepage in data["cepages"]:
-                grape_master = GrapeMaster.objects.get_or_create(
-                    user_id=user.id, name=cepage["name"], abbreviation=cepage["abbreviation"]
-                )[0]
-                cepages.append(Cepage(wine_id=wine.id, grape_id=grape_master.id, percentage=cepage["percentage"]))
-            Cepage.objects.bulk_create(cepages)
-        if len(tag_texts := data["tag_texts"]) > 0:
-            # MYMEMO(後日): 順番を保持するように (後から追加は保持できているけど、最初に複数つけた時、フロントで書いた通りの順番にならない)
-            tags = [WineTag.objects.get_or_create(user_id=user.id, text=text)[0] for text in tag_texts]
-            wine.tags.set(tags)
-        else:
-            wine.tags.clear()
-
+        count_wine_values(user.id, added=[wine.counted_values], removed=[counted_values])
+        wine.count_in_stock_change(was_in_stock)
+        self._set_cepages(user, wine, data["cepages"])
+        self._set_tags(user, wine, data["tag_texts"])
         if "cellar_id" in data.keys():
-            if from_space := wine.cellarspace if hasattr(wine, "cellarspace") else None:
-                from_space.wine = None
-                from_space.save(update_fields=["wine_id", "updated_at"])
+            self._move(user, wine, data)
+
+        refresh_wine_read_models([wine.id])
+        user_data_cache.invalidate(user.id)
+
+        return wine
+
+    def _set_cepages(self, user: User, wine: Wine, cepages_data: list[dict]):
+        # Only rows that differ are written, so unchanged cepages are left untouched.
+        grapes = {}
+        if len(cepages_data) > 0:
+            grapes = GrapeMaster.objects.get_or_create_by_names(
+                user.id, {cepage["name"]: cepage["abbreviation"] for cepage in cepages_data}
+            )
+        wine.set_cepages({grapes[cepage["name"]]: cepage["percentage"] for cepage in cepages_data})
+
+    def _set_tags(self, user: User, wine: Wine, tag_texts: list[str]):
+        tags = {}
+        if len(tag_texts) > 0:
+            tags = WineTag.objects.get_or_create_by_texts(user.id, tag_texts)
+        wine.set_tags([tags[text] for text in dict.fromkeys(tag_texts)])
+
+    def _move(self, user: User, wine: Wine, data: dict):
+        if from_space := wine.cellarspace if hasattr(wine, "cellarspace") else None:
+            from_space.wine = None
+            from_space.save(update_fields=["wine_id", "updated_at"])
         if (cellar_id := data.get("cellar_id")) and (position := data.get("position")):
             if not user.has_cellar(cellar_id):
                 raise exceptions.NotFound(detail={"cellar_id": "This cellar does not exist."})
@@ -73,9 +94,6 @@ class UpdateWine:
                 raise exceptions.NotFound(detail={"position": "This position does not exist."})
             if to_space.wine_id is not None:
                 raise exceptions.PermissionDenied(detail={"position": "That position is already occupied."})
+            # Also caches to_space as wine.cellarspace, as emptying from_space cleared it.
             to_space.wine = wine
             to_space.save(update_fields=["wine_id", "updated_at"])
-
-        wine = Wine.objects.prefetch_tags().select_cellarspace().get_by_id(wine.id)
-
-        return wine
@@ -1,4 +1,5 @@
 from .grape_master_views import GrapeMasterViewSet
+from .wine_producer_views import WineProducerViewSet
 from .wine_region_views import WineRegionViewSet
 from .wine_tag_views import WineTagViewSet
 from .wine_views import WineViewSet
@@ -7,7 +7,12 @@ from rest_framework.response import Response
 
 from llwinecellar.exception_handler import exception_handler_with_logging
 
-from ..serializers import DeleteGrapeMasterQuerySerializer, GrapeMasterSerializer, GrapeMastersSerializer
+from ..serializers import (
+    AutocompleteQuerySerializer,
+    DeleteGrapeMasterQuerySerializer,
+    GrapeMasterSerializer,
+    GrapeMastersSerializer,
+)
 from ..use_cases import CreateGrapeMaster, DeleteGrapeMaster, ListGrapeMasters
 
 logger = logging.getLogger(__name__)
@@ -20,7 +25,11 @@ class GrapeMasterViewSet(viewsets.GenericViewSet):
 
     def list(self, request, use_case=ListGrapeMasters(), format=None):
         try:
-            grape_masters = use_case.execute(user=request.user)
+            serializer = AutocompleteQuerySerializer(data=request.GET.dict())
+            serializer.is_valid(raise_exception=True)
+
+            queries = serializer.validated_data
+            grape_masters = use_case.execute(user=request.user, q=queries.get("q"), limit=queries.get("limit"))
 
             serializer = self.get_serializer({"grape_masters": grape_masters})
             return Response(serializer.data)
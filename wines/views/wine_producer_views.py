@@ -0,0 +1,39 @@
+import logging
+
+from rest_framework import viewsets
+from rest_framework.authentication import SessionAuthentication
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from llwinecellar.common.conditional_get import get_list_etag, get_not_modified_response
+from llwinecellar.exception_handler import exception_handler_with_logging
+
+from ..models import WineProducer
+from ..serializers import AutocompleteQuerySerializer, WineProducersSerializer
+from ..use_cases import ListWineProducers
+
+logger = logging.getLogger(__name__)
+
+
+class WineProducerViewSet(viewsets.GenericViewSet):
+    serializer_class = WineProducersSerializer
+    authentication_classes = [SessionAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def list(self, request, use_case=ListWineProducers(), format=None):
+        try:
+            serializer = AutocompleteQuerySerializer(data=request.GET.dict())
+            serializer.is_valid(raise_exception=True)
+
+            etag = get_list_etag(request, WineProducer.objects.filter_eq_user_id(request.user.id))
+            if not_modified := get_not_modified_response(request, etag):
+                return not_modified
+
+            queries = serializer.validated_data
+            producers = use_case.execute(user=request.user, q=queries.get("q"), limit=queries.get("limit"))
+
+            serializer = self.get_serializer({"producers": producers})
+            return Response(serializer.data, headers={"ETag": etag})
+
+        except Exception as exc:
+            return exception_handler_with_logging(exc)
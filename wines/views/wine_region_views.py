@@ -5,9 +5,11 @@ from rest_framework.authentication import SessionAuthentication
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from llwinecellar.common.conditional_get import get_list_etag, get_not_modified_response
 from llwinecellar.exception_handler import exception_handler_with_logging
 
-from ..serializers import WineRegionsSerializer
+from ..models import WineRegion
+from ..serializers import ListWineRegionQuerySerializer, WineRegionsSerializer
 from ..use_cases import ListWineRegions
 
 logger = logging.getLogger(__name__)
@@ -20,10 +22,20 @@ class WineRegionViewSet(viewsets.GenericViewSet):
 
     def list(self, request, use_case=ListWineRegions(), format=None):
         try:
-            wine_regions = use_case.execute(user=request.user)
+            serializer = ListWineRegionQuerySerializer(data=request.GET.dict())
+            serializer.is_valid(raise_exception=True)
+
+            etag = get_list_etag(request, WineRegion.objects.filter_eq_user_id(request.user.id))
+            if not_modified := get_not_modified_response(request, etag):
+                return not_modified
+
+            queries = serializer.validated_data
+            wine_regions = use_case.execute(
+                user=request.user, prefix=queries.get("prefix"), q=queries.get("q"), limit=queries.get("limit")
+            )
 
             serializer = self.get_serializer({"regions": wine_regions})
-            return Response(serializer.data)
+            return Response(serializer.data, headers={"ETag": etag})
 
         except Exception as exc:
             return exception_handler_with_logging(exc)
@@ -6,9 +6,16 @@ from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from llwinecellar.common.conditional_get import get_list_etag, get_not_modified_response
 from llwinecellar.exception_handler import exception_handler_with_logging
 
-from ..serializers import DeleteWineTagQuerySerializer, WineTagsSerializer
+from ..models import WineTag
+from ..serializers import (
+    DeleteWineTagQuerySerializer,
+    ListWineTagQuerySerializer,
+    WineTagCountsSerializer,
+    WineTagsSerializer,
+)
 from ..use_cases import DeleteWineTag, ListWineTags
 
 logger = logging.getLogger(__name__)
@@ -21,10 +28,24 @@ class WineTagViewSet(viewsets.GenericViewSet):
 
     def list(self, request, use_case=ListWineTags(), format=None):
         try:
-            tag_texts = use_case.execute(user=request.user)
+            serializer = ListWineTagQuerySerializer(data=request.GET.dict())
+            serializer.is_valid(raise_exception=True)
+
+            # Attaching, detaching and drinking wines update the tags' counters, and with them updated_at.
+            etag = get_list_etag(request, WineTag.objects.filter_eq_user_id(request.user.id))
+            if not_modified := get_not_modified_response(request, etag):
+                return not_modified
+
+            queries = serializer.validated_data
+            tags = use_case.execute(
+                user=request.user, q=queries.get("q"), limit=queries.get("limit"), with_counts=queries["with_counts"]
+            )
 
-            serializer = self.get_serializer({"tag_texts": tag_texts})
-            return Response(serializer.data)
+            if queries["with_counts"]:
+                serializer = WineTagCountsSerializer({"tags": tags})
+            else:
+                serializer = self.get_serializer({"tag_texts": tags})
+            return Response(serializer.data, headers={"ETag": etag})
 
         except Exception as exc:
             return exception_handler_with_logging(exc)
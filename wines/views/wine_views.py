@@ -1,22 +1,47 @@
 import logging
 
+from django.http import StreamingHttpResponse
 from rest_framework import status, viewsets
 from rest_framework.authentication import SessionAuthentication
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from cellars.models import CellarSpace
+from llwinecellar.common.conditional_get import get_list_etag, get_not_modified_response
 from llwinecellar.exception_handler import exception_handler_with_logging
+from llwinecellar.negotiation import IgnoreFormatNegotiation
+from llwinecellar.streaming import stream_csv, stream_json_lines, stream_json_list
 
+from ..enums import WineFileFormat
+from ..models import Cepage, Wine, WineTagRelation
 from ..serializers import (
+    CreateWinesSerializer,
+    ExportWineQuerySerializer,
     ListWineQuerySerializer,
     MoveWineResponseSerializer,
     MoveWineSerializer,
+    MoveWinesSerializer,
     UpdateWineSerializer,
+    WineDocumentsPageSerializer,
+    WineDocumentsSerializer,
+    WineFacetsSerializer,
+    WineListItemSerializer,
     WineSerializer,
+    WinesPageSerializer,
     WinesSerializer,
 )
-from ..use_cases import CreateWine, ListWine, MoveWine, UpdateWine
+from ..use_cases import (
+    CreateWine,
+    CreateWines,
+    ExportWines,
+    ListWine,
+    ListWineFacets,
+    MoveWine,
+    MoveWines,
+    PartialUpdateWine,
+    UpdateWine,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -31,11 +56,81 @@ class WineViewSet(viewsets.GenericViewSet):
             serializer = ListWineQuerySerializer(data=request.GET.dict())
             serializer.is_valid(raise_exception=True)
 
+            etag = get_list_etag(
+                request,
+                Wine.objects.filter_eq_user_id(request.user.id),
+                WineTagRelation.objects.filter_eq_user_id(request.user.id),
+                Cepage.objects.filter_eq_user_id(request.user.id),
+                CellarSpace.objects.filter_eq_user_id(request.user.id),
+            )
+            if not_modified := get_not_modified_response(request, etag):
+                return not_modified
+
             queries = serializer.validated_data
             wines = use_case.execute(user=request.user, queries=queries)
 
-            serializer = WinesSerializer({"wines": wines})
-            return Response(serializer.data)
+            if queries.get("stream"):
+                content = stream_json_list("wines", wines, WineListItemSerializer())
+                response = StreamingHttpResponse(content, content_type="application/json")
+            else:
+                documents = use_case.reads_documents(queries)
+                if "limit" in queries:
+                    serializer_class = WineDocumentsPageSerializer if documents else WinesPageSerializer
+                    serializer = serializer_class(wines)
+                else:
+                    serializer_class = WineDocumentsSerializer if documents else WinesSerializer
+                    serializer = serializer_class({"wines": wines})
+                response = Response(serializer.data)
+
+            response["ETag"] = etag
+            return response
+
+        except Exception as exc:
+            return exception_handler_with_logging(exc)
+
+    @action(detail=False, methods=["get"], url_path="facets")
+    def facets(self, request, use_case=ListWineFacets(), format=None):
+        try:
+            serializer = ListWineQuerySerializer(data=request.GET.dict())
+            serializer.is_valid(raise_exception=True)
+
+            etag = get_list_etag(
+                request,
+                Wine.objects.filter_eq_user_id(request.user.id),
+                WineTagRelation.objects.filter_eq_user_id(request.user.id),
+                Cepage.objects.filter_eq_user_id(request.user.id),
+                CellarSpace.objects.filter_eq_user_id(request.user.id),
+            )
+            if not_modified := get_not_modified_response(request, etag):
+                return not_modified
+
+            facets = use_case.execute(user=request.user, queries=serializer.validated_data)
+
+            serializer = WineFacetsSerializer(facets)
+            response = Response(serializer.data)
+            response["ETag"] = etag
+            return response
+
+        except Exception as exc:
+            return exception_handler_with_logging(exc)
+
+    @action(detail=False, methods=["get"], url_path="export", content_negotiation_class=IgnoreFormatNegotiation)
+    def export(self, request, use_case=ExportWines(), format=None):
+        try:
+            serializer = ExportWineQuerySerializer(data=request.GET.dict())
+            serializer.is_valid(raise_exception=True)
+
+            queries = serializer.validated_data
+            wines = use_case.execute(user=request.user, cellar_id=queries.get("cellar_id"))
+
+            if queries["format"] == WineFileFormat.JSONL:
+                content = stream_json_lines(wines, WineListItemSerializer())
+                response = StreamingHttpResponse(content, content_type="application/jsonl")
+            else:
+                content = stream_csv(wines, WineListItemSerializer())
+                response = StreamingHttpResponse(content, content_type="text/csv; charset=utf-8")
+            response["Content-Disposition"] = f'attachment; filename="wines.{queries["format"]}"'
+            return response
 
         except Exception as exc:
             return exception_handler_with_logging(exc)
@@ -54,6 +149,20 @@ class WineViewSet(viewsets.GenericViewSet):
         except Exception as exc:
             return exception_handler_with_logging(exc)
 
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def create_many(self, request, use_case=CreateWines(), format=None):
+        try:
+            serializer = CreateWinesSerializer(data=request.data)
+            serializer.is_valid(raise_exception=True)
+
+            wines = use_case.execute(user=request.user, items=serializer.validated_data["wines"])
+
+            serializer = WinesSerializer({"wines": wines})
+            return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+        except Exception as exc:
+            return exception_handler_with_logging(exc)
+
     def update(self, request, use_case=UpdateWine(), format=None, pk=None):
         try:
             serializer = UpdateWineSerializer(data=request.data)
@@ -68,6 +177,20 @@ class WineViewSet(viewsets.GenericViewSet):
         except Exception as exc:
             return exception_handler_with_logging(exc)
 
+    def partial_update(self, request, use_case=PartialUpdateWine(), format=None, pk=None):
+        try:
+            serializer = UpdateWineSerializer(data=request.data, partial=True)
+            serializer.is_valid(raise_exception=True)
+
+            data = serializer.validated_data
+            wine = use_case.execute(user=request.user, wine_id=pk, data=data)
+
+            serializer = UpdateWineSerializer(wine)
+            return Response(serializer.data)
+
+        except Exception as exc:
+            return exception_handler_with_logging(exc)
+
     @action(detail=True, methods=["put"], url_path="space")
     def move(self, request, use_case=MoveWine(), format=None, pk=None):
         try:
@@ -82,3 +205,17 @@ class WineViewSet(viewsets.GenericViewSet):
 
         except Exception as exc:
             return exception_handler_with_logging(exc)
+
+    @action(detail=False, methods=["put"], url_path="spaces")
+    def move_many(self, request, use_case=MoveWines(), format=None):
+        try:
+            serializer = MoveWinesSerializer(data=request.data)
+            serializer.is_valid(raise_exception=True)
+
+            moved_wines = use_case.execute(user=request.user, moves=serializer.validated_data["wines"])
+
+            serializer = MoveWineResponseSerializer({"wines": moved_wines})
+            return Response(serializer.data)
+
+        except Exception as exc:
+            return exception_handler_with_logging(exc)